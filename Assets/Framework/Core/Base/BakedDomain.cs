@@ -0,0 +1,93 @@
+using System.Collections.Generic;
+using HaroFramework.Data;
+
+namespace HaroFramework.Core
+{
+    /// <summary>
+    /// Base class for domains that read their rows from a baked table file.
+    /// </summary>
+    /// <typeparam name="TData">The type of data this domain manages.</typeparam>
+    /// <remarks>
+    /// LoadData only maps the file and reads its id index; each row is deserialized the first time
+    /// GetData touches it. Bake the file with BakedTableWriter.
+    /// Override RowCacheCapacity to bound the number of materialized rows kept in memory.
+    /// </remarks>
+    public abstract class BakedDomain<TData> : BaseDomain<TData>, IReloadableDomain where TData : BaseData, new()
+    {
+        #region Fields
+
+        private BakedTableReader<TData> _reader;
+
+        #endregion
+
+        #region Properties
+
+        /// <summary>
+        /// Gets the path of the baked table file.
+        /// </summary>
+        protected abstract string BakedFilePath { get; }
+
+        /// <summary>
+        /// Gets the maximum number of materialized rows to keep, or 0 to keep every row once read.
+        /// </summary>
+        protected virtual int RowCacheCapacity => 0;
+
+        /// <summary>
+        /// Gets the reader for the baked table, or null before LoadData.
+        /// </summary>
+        public BakedTableReader<TData> Reader => _reader;
+
+        #endregion
+
+        #region Lifecycle Methods
+
+        /// <summary>
+        /// Opens the baked table file.
+        /// </summary>
+        /// <remarks>
+        /// Called by DataManager during initialization, possibly on a worker thread (see LoadOnMainThread).
+        /// Loading again closes the previously opened file.
+        /// </remarks>
+        public override void LoadData()
+        {
+            var reader = new BakedTableReader<TData>(BakedFilePath, RowCacheCapacity);
+            BakedTableReader<TData> previous = _reader;
+            _reader = reader;
+            previous?.Dispose();
+        }
+
+        /// <summary>
+        /// Reopens the baked table if the file content changed on disk.
+        /// </summary>
+        /// <returns>True if the table was reloaded, false if it was unchanged.</returns>
+        public virtual bool ReloadIfChanged()
+        {
+            return _reader != null && _reader.ReloadIfChanged();
+        }
+
+        #endregion
+
+        #region Data Access Methods
+
+        /// <summary>
+        /// Gets a single data entry by ID, deserializing it on first access.
+        /// </summary>
+        /// <param name="id">The unique identifier of the data entry.</param>
+        /// <returns>The data entry, or null if not found.</returns>
+        public override TData GetData(int id)
+        {
+            return _reader?.GetData(id);
+        }
+
+        /// <summary>
+        /// Gets all data entries in this domain.
+        /// </summary>
+        /// <returns>An enumerable collection of all data entries, materialized as enumerated.</returns>
+        public override IEnumerable<TData> GetAllData()
+        {
+            return _reader != null ? _reader.GetAllData() : System.Array.Empty<TData>();
+        }
+
+        #endregion
+    }
+}
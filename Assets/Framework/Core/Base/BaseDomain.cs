@@ -1,3 +1,4 @@
+using System;
 using System.Collections.Generic;
 using HaroFramework.Data;
 
@@ -12,7 +13,7 @@ namespace HaroFramework.Core
     /// They process raw data and apply game rules/calculations.
     /// Domains are registered with DataManager and accessed through it.
     /// </remarks>
-    public abstract class BaseDomain<TData> where TData : BaseData
+    public abstract class BaseDomain<TData> : IDomain where TData : BaseData
     {
         #region Properties
 
@@ -21,6 +22,24 @@ namespace HaroFramework.Core
         /// </summary>
         public abstract string DomainName { get; }
 
+        /// <summary>
+        /// Gets the domain types that must finish loading before this domain loads.
+        /// </summary>
+        /// <remarks>
+        /// Override to declare dependencies on other registered domains.
+        /// Domains without a dependency path between them may load concurrently.
+        /// </remarks>
+        public virtual IReadOnlyList<Type> Dependencies => Array.Empty<Type>();
+
+        /// <summary>
+        /// Gets whether LoadData must run on the main thread.
+        /// </summary>
+        /// <remarks>
+        /// LoadAllDomainsAsync runs LoadData on the thread pool by default.
+        /// Override and return true if LoadData uses Unity APIs such as Resources.Load.
+        /// </remarks>
+        public virtual bool LoadOnMainThread => false;
+
         #endregion
 
         #region Lifecycle Methods
@@ -29,7 +48,7 @@ namespace HaroFramework.Core
         /// Loads and processes data for this domain.
         /// </summary>
         /// <remarks>
-        /// Called by DataManager during initialization.
+        /// Called by DataManager during initialization, possibly on a worker thread (see LoadOnMainThread).
         /// Implement data loading from JSON, CSV, or other sources.
         /// Apply business rules and cache processed data.
         /// </remarks>
@@ -50,6 +69,10 @@ namespace HaroFramework.Core
         /// Gets all data entries in this domain.
         /// </summary>
         /// <returns>An enumerable collection of all data entries.</returns>
+        /// <remarks>
+        /// Enumerating the result through IEnumerable may allocate. TableDomain also supports
+        /// foreach over the domain itself and AsSpan, which do not.
+        /// </remarks>
         public abstract IEnumerable<TData> GetAllData();
 
         #endregion
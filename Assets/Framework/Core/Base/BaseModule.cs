@@ -1,3 +1,6 @@
+using System;
+using System.Collections.Generic;
+
 namespace HaroFramework.Core
 {
     /// <summary>
@@ -5,10 +8,11 @@ namespace HaroFramework.Core
     /// </summary>
     /// <remarks>
     /// Modules provide game-independent functionality (UI, Audio, Scene, Network, etc.).
-    /// They are initialized by FrameworkManager in priority order.
+    /// They are initialized by FrameworkManager after their Dependencies, in priority order among ready modules.
     /// Override lifecycle methods to implement module-specific behavior.
+    /// Modules that do not override OnUpdate are never ticked.
     /// </remarks>
-    public abstract class BaseModule : IModule
+    public abstract class BaseModule : IScheduledModule, IBootModule
     {
         #region Properties
 
@@ -21,8 +25,51 @@ namespace HaroFramework.Core
         /// Gets the initialization priority of this module.
         /// Lower values are initialized first (e.g., 5 before 10).
         /// </summary>
+        /// <remarks>
+        /// Only orders modules whose Dependencies are already initialized; it also sets the update order.
+        /// </remarks>
         public abstract int Priority { get; }
 
+        /// <summary>
+        /// Gets the module types that must finish initializing before this module initializes.
+        /// </summary>
+        public virtual IReadOnlyList<Type> Dependencies => Array.Empty<Type>();
+
+        /// <summary>
+        /// Gets whether Initialize must run on the main thread.
+        /// </summary>
+        /// <remarks>
+        /// Override to return false when Initialize does not touch the Unity API,
+        /// so it can run on a worker thread alongside other modules.
+        /// </remarks>
+        public virtual bool InitializeOnMainThread => true;
+
+        /// <summary>
+        /// Gets the tick group OnUpdate runs in.
+        /// </summary>
+        public virtual ModuleTickGroup TickGroup => ModuleTickGroup.Normal;
+
+        /// <summary>
+        /// Gets the number of ticks between OnUpdate calls (1 = every tick).
+        /// </summary>
+        /// <remarks>
+        /// Ignored when UpdateRate is greater than zero.
+        /// </remarks>
+        public virtual int UpdateInterval => 1;
+
+        /// <summary>
+        /// Gets the OnUpdate frequency in Hz, or 0 to use UpdateInterval.
+        /// </summary>
+        public virtual float UpdateRate => 0f;
+
+        /// <summary>
+        /// Gets whether OnUpdate may be deferred to a later frame when the module time slice budget is spent.
+        /// </summary>
+        /// <remarks>
+        /// Use for low-priority work such as background bookkeeping.
+        /// </remarks>
+        public virtual bool IsTimeSliced => false;
+
         #endregion
 
         #region Lifecycle Methods
@@ -31,7 +78,7 @@ namespace HaroFramework.Core
         /// Initializes the module.
         /// </summary>
         /// <remarks>
-        /// Called by FrameworkManager in priority order.
+        /// Called by FrameworkManager once every module in Dependencies is initialized.
         /// Use this to set up resources and register dependencies.
         /// </remarks>
         public virtual void Initialize()
@@ -43,7 +90,7 @@ namespace HaroFramework.Core
         /// Shuts down the module and releases resources.
         /// </summary>
         /// <remarks>
-        /// Called by FrameworkManager in reverse priority order.
+        /// Called by FrameworkManager in reverse initialization order.
         /// Use this to clean up resources and unregister dependencies.
         /// </remarks>
         public virtual void Shutdown()
@@ -52,11 +99,12 @@ namespace HaroFramework.Core
         }
 
         /// <summary>
-        /// Called every frame by FrameworkManager.
+        /// Called by FrameworkManager according to TickGroup, UpdateInterval and UpdateRate.
         /// </summary>
         /// <remarks>
         /// Use this for module-specific per-frame updates.
         /// Keep logic lightweight to avoid performance issues.
+        /// Leave it un-overridden if the module has no per-frame work; it will then be skipped entirely.
         /// </remarks>
         public virtual void OnUpdate()
         {
@@ -0,0 +1,38 @@
+using System;
+using System.Collections.Generic;
+
+namespace HaroFramework.Core
+{
+    /// <summary>
+    /// Interface for modules that declare what they need before they can initialize.
+    /// </summary>
+    /// <remarks>
+    /// During boot, FrameworkManager initializes a module only after every module listed in Dependencies.
+    /// Modules with no dependency between them may initialize concurrently (when InitializeOnMainThread is false)
+    /// or in different frames. Priority only orders modules that are ready at the same time.
+    /// Modules that only implement IModule have no dependencies and initialize on the main thread.
+    /// BaseModule implements this interface with overridable defaults.
+    /// </remarks>
+    public interface IBootModule : IModule
+    {
+        #region Properties
+
+        /// <summary>
+        /// Gets the module types that must finish initializing before this module initializes.
+        /// </summary>
+        /// <remarks>
+        /// A dependency matches every registered module assignable to the type, so interfaces and base classes work.
+        /// </remarks>
+        IReadOnlyList<Type> Dependencies { get; }
+
+        /// <summary>
+        /// Gets whether Initialize must run on the main thread.
+        /// </summary>
+        /// <remarks>
+        /// Return false only if Initialize does not touch the Unity API; it then runs on a worker thread.
+        /// </remarks>
+        bool InitializeOnMainThread { get; }
+
+        #endregion
+    }
+}
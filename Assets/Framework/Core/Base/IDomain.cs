@@ -0,0 +1,44 @@
+using System;
+using System.Collections.Generic;
+
+namespace HaroFramework.Core
+{
+    /// <summary>
+    /// Non-generic interface for all domains.
+    /// Lets DataManager load domains without knowing their data type.
+    /// </summary>
+    /// <remarks>
+    /// Implemented by BaseDomain&lt;TData&gt;. Game code should derive from BaseDomain instead of implementing this directly.
+    /// </remarks>
+    public interface IDomain
+    {
+        #region Properties
+
+        /// <summary>
+        /// Gets the unique name of this domain.
+        /// </summary>
+        string DomainName { get; }
+
+        /// <summary>
+        /// Gets the domain types that must finish loading before this domain loads.
+        /// </summary>
+        IReadOnlyList<Type> Dependencies { get; }
+
+        /// <summary>
+        /// Gets whether LoadData must run on the main thread.
+        /// </summary>
+        bool LoadOnMainThread { get; }
+
+        #endregion
+
+        #region Lifecycle Methods
+
+        /// <summary>
+        /// Loads and processes data for this domain.
+        /// Called by DataManager during initialization.
+        /// </summary>
+        void LoadData();
+
+        #endregion
+    }
+}
@@ -6,6 +6,7 @@ namespace HaroFramework.Core
     /// </summary>
     /// <remarks>
     /// Modules are initialized in priority order (lower priority number = earlier initialization).
+    /// Implement IBootModule to declare dependencies or to initialize off the main thread.
     /// All modules must implement Initialize, Shutdown, and OnUpdate lifecycle methods.
     /// </remarks>
     public interface IModule
@@ -29,18 +30,19 @@ namespace HaroFramework.Core
 
         /// <summary>
         /// Initializes the module.
-        /// Called by FrameworkManager in priority order.
+        /// Called by FrameworkManager once its dependencies are initialized (see IBootModule).
         /// </summary>
         void Initialize();
 
         /// <summary>
         /// Shuts down the module and releases resources.
-        /// Called in reverse priority order.
+        /// Called in reverse initialization order.
         /// </summary>
         void Shutdown();
 
         /// <summary>
         /// Called every frame by FrameworkManager.
+        /// Implement IScheduledModule to change the tick group or rate.
         /// </summary>
         void OnUpdate();
 
@@ -0,0 +1,21 @@
+namespace HaroFramework.Core
+{
+    /// <summary>
+    /// Interface for domains that can reload their data while the game is running.
+    /// </summary>
+    /// <remarks>
+    /// DataManager.ReloadChangedDomains calls ReloadIfChanged on every registered domain that implements this.
+    /// </remarks>
+    public interface IReloadableDomain : IDomain
+    {
+        #region Lifecycle Methods
+
+        /// <summary>
+        /// Reloads the domain's data if its source changed since it was last loaded.
+        /// </summary>
+        /// <returns>True if the data was reloaded, false if it was unchanged.</returns>
+        bool ReloadIfChanged();
+
+        #endregion
+    }
+}
@@ -0,0 +1,63 @@
+namespace HaroFramework.Core
+{
+    /// <summary>
+    /// Tick group a module's OnUpdate runs in.
+    /// </summary>
+    public enum ModuleTickGroup
+    {
+        /// <summary>
+        /// Runs in Update before the Normal group.
+        /// </summary>
+        Early,
+
+        /// <summary>
+        /// Runs in Update.
+        /// </summary>
+        Normal,
+
+        /// <summary>
+        /// Runs in LateUpdate.
+        /// </summary>
+        Late,
+
+        /// <summary>
+        /// Runs in FixedUpdate.
+        /// </summary>
+        Fixed
+    }
+
+    /// <summary>
+    /// Interface for modules that control when FrameworkManager ticks them.
+    /// </summary>
+    /// <remarks>
+    /// Modules that only implement IModule tick every frame in the Normal group.
+    /// BaseModule implements this interface with overridable defaults.
+    /// </remarks>
+    public interface IScheduledModule : IModule
+    {
+        #region Properties
+
+        /// <summary>
+        /// Gets the tick group OnUpdate runs in.
+        /// </summary>
+        ModuleTickGroup TickGroup { get; }
+
+        /// <summary>
+        /// Gets the number of ticks between OnUpdate calls (1 = every tick).
+        /// Ignored when UpdateRate is greater than zero.
+        /// </summary>
+        int UpdateInterval { get; }
+
+        /// <summary>
+        /// Gets the OnUpdate frequency in Hz, or 0 to use UpdateInterval.
+        /// </summary>
+        float UpdateRate { get; }
+
+        /// <summary>
+        /// Gets whether OnUpdate may be deferred to a later frame when the module time slice budget is spent.
+        /// </summary>
+        bool IsTimeSliced { get; }
+
+        #endregion
+    }
+}
@@ -0,0 +1,142 @@
+using System;
+using System.Collections.Generic;
+using HaroFramework.Data;
+
+namespace HaroFramework.Core
+{
+    /// <summary>
+    /// Base class for domains backed by a DataTable.
+    /// </summary>
+    /// <typeparam name="TData">The type of data this domain manages.</typeparam>
+    /// <remarks>
+    /// Implement LoadRows to read the raw rows; the domain stores them in a DataTable,
+    /// validates every row once, and serves GetData and GetAllData from the table.
+    /// Override ConfigureIndexes to add lambda-based secondary indexes.
+    /// Iterate with foreach over the domain itself, or AsSpan, for allocation-free enumeration.
+    /// </remarks>
+    public abstract class TableDomain<TData> : BaseDomain<TData> where TData : BaseData
+    {
+        #region Fields
+
+        private static readonly LogCategory Log = FrameworkLogger.GetCategory("TableDomain");
+
+        private DataTable<TData> _table = new DataTable<TData>(new TData[0]);
+
+        #endregion
+
+        #region Properties
+
+        /// <summary>
+        /// Gets the table holding this domain's rows.
+        /// </summary>
+        public DataTable<TData> Table => _table;
+
+        #endregion
+
+        #region Lifecycle Methods
+
+        /// <summary>
+        /// Loads rows into the table and validates them.
+        /// </summary>
+        /// <remarks>
+        /// Invalid rows are reported as a warning but kept in the table.
+        /// Called by DataManager during initialization, possibly on a worker thread (see LoadOnMainThread).
+        /// </remarks>
+        public override void LoadData()
+        {
+            var table = new DataTable<TData>(LoadRows());
+            ConfigureIndexes(table);
+
+            var invalidIds = new List<int>();
+
+            if (table.Validate(invalidIds) > 0 && Log.IsEnabled(LogLevel.Warning))
+            {
+                Log.Warning("{0}: {1} invalid row(s): {2}", DomainName, invalidIds.Count, string.Join(", ", invalidIds));
+            }
+
+            _table = table;
+            OnTableLoaded();
+        }
+
+        /// <summary>
+        /// Reads the raw rows for this domain.
+        /// </summary>
+        /// <returns>The rows to store in the table.</returns>
+        /// <remarks>
+        /// Implement data loading from JSON, CSV, or other sources.
+        /// </remarks>
+        protected abstract IEnumerable<TData> LoadRows();
+
+        /// <summary>
+        /// Adds secondary indexes to a newly built table.
+        /// </summary>
+        /// <param name="table">The table being loaded.</param>
+        /// <remarks>
+        /// Indexes declared with DataIndexAttribute are already present.
+        /// Example: table.AddIndex("Level", data =&gt; data.Level);
+        /// </remarks>
+        protected virtual void ConfigureIndexes(DataTable<TData> table)
+        {
+            // Override in derived classes
+        }
+
+        /// <summary>
+        /// Called after the table has been built and validated.
+        /// </summary>
+        /// <remarks>
+        /// Use this to apply business rules or build derived caches.
+        /// </remarks>
+        protected virtual void OnTableLoaded()
+        {
+            // Override in derived classes
+        }
+
+        #endregion
+
+        #region Data Access Methods
+
+        /// <summary>
+        /// Gets a single data entry by ID.
+        /// </summary>
+        /// <param name="id">The unique identifier of the data entry.</param>
+        /// <returns>The data entry, or null if not found.</returns>
+        public override TData GetData(int id)
+        {
+            return _table.GetData(id);
+        }
+
+        /// <summary>
+        /// Gets all data entries in this domain.
+        /// </summary>
+        /// <returns>The table itself; no copy is made.</returns>
+        /// <remarks>
+        /// Enumerating through IEnumerable boxes the enumerator. Use foreach over the domain or AsSpan
+        /// to avoid that.
+        /// </remarks>
+        public override IEnumerable<TData> GetAllData()
+        {
+            return _table;
+        }
+
+        /// <summary>
+        /// Returns an allocation-free enumerator over all data entries in id order.
+        /// </summary>
+        /// <remarks>
+        /// Lets foreach iterate the domain directly without boxing the enumerator.
+        /// </remarks>
+        public DataTable<TData>.Enumerator GetEnumerator()
+        {
+            return _table.GetEnumerator();
+        }
+
+        /// <summary>
+        /// Gets all data entries as a read-only span in id order.
+        /// </summary>
+        public ReadOnlySpan<TData> AsSpan()
+        {
+            return _table.AsSpan();
+        }
+
+        #endregion
+    }
+}
@@ -30,6 +30,65 @@ namespace HaroFramework.Core
 
         #endregion
 
+        #region Logging Settings
+
+        [Header("Logging Settings")]
+        [Tooltip("Minimum level logged by categories without their own level")]
+        public LogLevel MinimumLogLevel = LogLevel.Info;
+
+        [Tooltip("Per-category minimum levels, for example ServiceLocator = Warning")]
+        public LogCategoryLevel[] CategoryLogLevels = new LogCategoryLevel[0];
+
+        [Tooltip("Write log messages to rotating files under persistentDataPath/Logs")]
+        public bool LogToFile = false;
+
+        [Tooltip("Size in kilobytes at which the log file is rotated")]
+        [Min(1)]
+        public int MaxLogFileSizeKB = 1024;
+
+        [Tooltip("Number of log files to keep, including the current one")]
+        [Min(1)]
+        public int MaxLogFiles = 5;
+
+        #endregion
+
+        #region Event Queue Settings
+
+        [Header("Event Queue Settings")]
+        [Tooltip("Milliseconds per frame for dispatching Normal and Low priority queued events (0 = unlimited)")]
+        [Min(0f)]
+        public float EventQueueBudgetMilliseconds = 0f;
+
+        [Tooltip("Maximum number of queued events before new ones are dropped (0 = unlimited)")]
+        [Min(0)]
+        public int MaxQueuedEvents = 0;
+
+        #endregion
+
+        #region Module Scheduling Settings
+
+        [Header("Module Scheduling")]
+        [Tooltip("Milliseconds per frame, and per fixed step for the Fixed group, for time-sliced module updates (0 = unlimited)")]
+        [Min(0f)]
+        public float ModuleTimeSliceBudgetMilliseconds = 2f;
+
+        #endregion
+
+        #region Boot Settings
+
+        [Header("Boot Settings")]
+        [Tooltip("Milliseconds of main-thread boot work per frame before yielding to the next frame (0 = boot synchronously in Awake)")]
+        [Min(0f)]
+        public float BootFrameBudgetMilliseconds = 0f;
+
+        [Tooltip("Load registered DataManager domains during the Data boot phase")]
+        public bool LoadDomainsDuringBoot = true;
+
+        [Tooltip("Log the per-phase, per-domain and per-module boot timeline when boot completes, in every build")]
+        public bool LogBootReport = true;
+
+        #endregion
+
         #region Framework Settings
 
         [Header("Framework Settings")]
@@ -48,7 +107,7 @@ namespace HaroFramework.Core
             // Ensure at least core systems are enabled
             if (!EnableEventBus && !EnableServiceLocator && !EnableDataManager)
             {
-                Debug.LogWarning("[FrameworkConfig] At least one core system should be enabled for the framework to function properly.");
+                FrameworkLogger.GetCategory("FrameworkConfig").Warning("At least one core system should be enabled for the framework to function properly.");
             }
         }
 
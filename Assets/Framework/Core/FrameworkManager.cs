@@ -1,5 +1,10 @@
+using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
-using System.Linq;
+using System.Diagnostics;
+using System.IO;
+using System.Threading;
+using System.Threading.Tasks;
 using UnityEngine;
 
 namespace HaroFramework.Core
@@ -9,12 +14,76 @@ namespace HaroFramework.Core
     /// </summary>
     /// <remarks>
     /// Manages framework initialization, module lifecycle, and core systems.
+    /// Boot runs in phases (see BootPhase): core systems, data, services, then modules.
+    /// Modules initialize once their IBootModule dependencies have, off the main thread where they allow it,
+    /// and are shut down in reverse initialization order. Each boot records a BootReport timeline.
+    /// Module Initialize, OnUpdate and Shutdown calls are profiled and timed through FrameworkStats.
     /// Add to a GameObject in the first scene and configure with FrameworkConfig.
-    /// Automatically initializes on Awake if AutoInitialize is enabled.
+    /// Automatically initializes on Awake if AutoInitialize is enabled; with a BootFrameBudgetMilliseconds
+    /// above zero, the boot is spread over several frames.
     /// </remarks>
     [DefaultExecutionOrder(-100)]
     public class FrameworkManager : Singleton<FrameworkManager>
     {
+        #region Nested Types
+
+        private readonly struct BootStep
+        {
+            public readonly BootPhase Phase;
+            public readonly string Name;
+            public readonly Action Action;
+
+            public BootStep(BootPhase phase, string name, Action action)
+            {
+                Phase = phase;
+                Name = name;
+                Action = action;
+            }
+        }
+
+        /// <summary>
+        /// Collects a boot report entry per domain as DataManager finishes loading it.
+        /// </summary>
+        /// <remarks>
+        /// Domains report from the thread that loaded them, so entries are queued and added to the report
+        /// on the main thread. Frame counts can only be read on the main thread, so a domain loaded on a
+        /// worker is stamped with the frame the Data phase started in.
+        /// </remarks>
+        private sealed class DomainTimingRecorder : IProgress<DomainLoadProgress>
+        {
+            private readonly ConcurrentQueue<BootTiming> _timings = new ConcurrentQueue<BootTiming>();
+            private readonly BootReport _report;
+            private readonly int _mainThreadId;
+            private readonly int _phaseFrame;
+
+            public DomainTimingRecorder(BootReport report)
+            {
+                _report = report;
+                _mainThreadId = Thread.CurrentThread.ManagedThreadId;
+                _phaseFrame = report.FrameOffset(Time.frameCount);
+            }
+
+            public void Report(DomainLoadProgress progress)
+            {
+                bool isMainThread = Thread.CurrentThread.ManagedThreadId == _mainThreadId;
+                int frame = isMainThread ? _report.FrameOffset(Time.frameCount) : _phaseFrame;
+                double start = _report.Now() - progress.ElapsedMilliseconds;
+
+                _timings.Enqueue(new BootTiming(progress.DomainName, BootPhase.Data, start,
+                    progress.ElapsedMilliseconds, frame, isMainThread, progress.Succeeded));
+            }
+
+            public void AddToReport()
+            {
+                while (_timings.TryDequeue(out BootTiming timing))
+                {
+                    _report.AddEntry(in timing);
+                }
+            }
+        }
+
+        #endregion
+
         #region Inspector Fields
 
         [Header("Configuration")]
@@ -26,7 +95,21 @@ namespace HaroFramework.Core
 
         #region Fields
 
-        private List<IModule> _modules = new List<IModule>();
+        private static readonly LogCategory Log = FrameworkLogger.Default;
+
+        private readonly List<IModule> _modules = new List<IModule>();
+        private readonly List<IModule> _initializedModules = new List<IModule>();
+        private readonly List<IModule> _lateModules = new List<IModule>();
+        private readonly List<BootStep> _bootSteps = new List<BootStep>();
+        private readonly ModuleScheduler _scheduler = new ModuleScheduler();
+        private EventBus _eventBus;
+        private RotatingFileLogSink _fileLogSink;
+        private BootReport _bootReport;
+        private BootPhase _bootPhase = BootPhase.CoreSystems;
+        private CancellationTokenSource _bootCancellation;
+        private long _bootSliceStart = 0;
+        private bool _isBooting = false;
+        private bool _isShutdownRequested = false;
         private bool _isInitialized = false;
 
         #endregion
@@ -38,10 +121,27 @@ namespace HaroFramework.Core
         /// </summary>
         public bool IsInitialized => _isInitialized;
 
+        /// <summary>
+        /// Gets whether the framework is booting.
+        /// </summary>
+        public bool IsBooting => _isBooting;
+
+        /// <summary>
+        /// Gets the timeline of the last boot, or null before the first boot starts.
+        /// </summary>
+        public BootReport BootReport => _bootReport;
+
         /// <summary>
         /// Gets the framework configuration.
         /// </summary>
-        public FrameworkConfig Config => _config;
+        /// <remarks>
+        /// Set internally so tests can boot a manager created without the inspector.
+        /// </remarks>
+        public FrameworkConfig Config
+        {
+            get => _config;
+            internal set => _config = value;
+        }
 
         #endregion
 
@@ -51,7 +151,7 @@ namespace HaroFramework.Core
         {
             if (_config == null)
             {
-                Debug.LogError("[FrameworkManager] FrameworkConfig is not assigned. Please assign a config asset.");
+                Log.Error("FrameworkConfig is not assigned. Please assign a config asset.");
                 return;
             }
 
@@ -62,7 +162,14 @@ namespace HaroFramework.Core
 
             if (_config.AutoInitialize)
             {
-                Initialize();
+                if (_config.BootFrameBudgetMilliseconds > 0f)
+                {
+                    BootAsync();
+                }
+                else
+                {
+                    Initialize();
+                }
             }
         }
 
@@ -70,11 +177,30 @@ namespace HaroFramework.Core
         {
             if (!_isInitialized) return;
 
-            // Update all modules
-            foreach (var module in _modules)
+            // Dispatch events queued since the last frame before modules tick
+            if (_eventBus != null)
             {
-                module.OnUpdate();
+                _eventBus.DispatchQueued(_config.EventQueueBudgetMilliseconds);
             }
+
+            // Tick modules that are due this frame
+            double time = Time.unscaledTimeAsDouble;
+            _scheduler.Tick(ModuleTickGroup.Early, time, Time.frameCount);
+            _scheduler.Tick(ModuleTickGroup.Normal, time, Time.frameCount);
+        }
+
+        private void LateUpdate()
+        {
+            if (!_isInitialized) return;
+
+            _scheduler.Tick(ModuleTickGroup.Late, Time.unscaledTimeAsDouble, Time.frameCount);
+        }
+
+        private void FixedUpdate()
+        {
+            if (!_isInitialized) return;
+
+            _scheduler.Tick(ModuleTickGroup.Fixed, Time.fixedTimeAsDouble, Time.frameCount);
         }
 
         protected override void OnDestroy()
@@ -88,59 +214,116 @@ namespace HaroFramework.Core
         #region Public Methods
 
         /// <summary>
-        /// Initializes the framework.
+        /// Initializes the framework within the current frame.
         /// </summary>
         /// <remarks>
-        /// Initializes core systems and modules in priority order.
+        /// Runs every boot phase before returning. Modules that allow it still initialize on the
+        /// thread pool, concurrently with main-thread modules.
         /// Safe to call multiple times (will skip if already initialized).
         /// </remarks>
+        /// <exception cref="InvalidOperationException">Thrown if module or domain dependencies form a cycle.</exception>
         public void Initialize()
         {
-            if (_isInitialized)
+            if (!BeginBoot()) return;
+
+            bool isComplete = false;
+
+            try
             {
-                FrameworkLogger.LogWarning("Framework already initialized. Skipping.");
-                return;
+                RunPhase(BootPhase.CoreSystems, InitializeCoreSystems);
+                RunPhase(BootPhase.Data, LoadDomains);
+                RunPhase(BootPhase.Services, null);
+                RunPhase(BootPhase.Modules, InitializeModules);
+                isComplete = true;
             }
+            finally
+            {
+                EndBoot(isComplete);
+            }
+        }
 
-            FrameworkLogger.Log("Initializing HaroFramework...");
-
-            // Initialize core systems
-            InitializeCoreSystems();
+        /// <summary>
+        /// Initializes the framework over several frames.
+        /// </summary>
+        /// <param name="cancellationToken">Stops the boot before the next phase, domain or module starts.</param>
+        /// <returns>A task that completes once the framework is initialized.</returns>
+        /// <remarks>
+        /// Must be awaited from the main thread. Main-thread work yields to the next frame whenever it
+        /// exceeds FrameworkConfig.BootFrameBudgetMilliseconds, domains load through LoadAllDomainsAsync,
+        /// and modules that allow it initialize on the thread pool. Updates do not reach modules until the boot completes.
+        /// A cancelled or failed boot shuts down the modules it had initialized.
+        /// </remarks>
+        /// <exception cref="InvalidOperationException">Thrown if module or domain dependencies form a cycle.</exception>
+        public async Task InitializeAsync(CancellationToken cancellationToken = default)
+        {
+            if (!BeginBoot()) return;
 
-            // Initialize modules
-            InitializeModules();
+            bool isComplete = false;
+            _bootCancellation = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+            CancellationToken token = _bootCancellation.Token;
 
-            _isInitialized = true;
-            FrameworkLogger.Log("HaroFramework initialized successfully.");
+            try
+            {
+                RunPhase(BootPhase.CoreSystems, InitializeCoreSystems);
+                await YieldIfOverBudgetAsync(token);
+                await RunPhaseAsync(BootPhase.Data, () => LoadDomainsAsync(token), token);
+                await RunPhaseAsync(BootPhase.Services, null, token);
+                await RunPhaseAsync(BootPhase.Modules, () => InitializeModulesAsync(token), token);
+                isComplete = true;
+            }
+            finally
+            {
+                _bootCancellation.Dispose();
+                _bootCancellation = null;
+                EndBoot(isComplete);
+            }
         }
 
         /// <summary>
         /// Shuts down the framework.
         /// </summary>
         /// <remarks>
-        /// Shuts down modules and core systems in reverse order.
+        /// Shuts down modules in reverse initialization order, then the core systems.
+        /// During a boot, cancels it instead; the shutdown then completes once the boot has unwound,
+        /// after modules still initializing on the thread pool have finished.
         /// Called automatically on application quit.
         /// </remarks>
         public void Shutdown()
         {
+            if (_isBooting)
+            {
+                _isShutdownRequested = true;
+                _bootCancellation?.Cancel();
+                return;
+            }
+
             if (!_isInitialized) return;
 
-            FrameworkLogger.Log("Shutting down HaroFramework...");
+            CompleteShutdown();
+        }
+
+        /// <summary>
+        /// Adds work to run at the end of a boot phase.
+        /// </summary>
+        /// <param name="phase">The phase to run the step in.</param>
+        /// <param name="name">The name shown in the boot report.</param>
+        /// <param name="step">The work to run on the main thread.</param>
+        /// <remarks>
+        /// Steps run in the order they were added, after the phase's own work; use the Services phase
+        /// to register services that modules resolve in Initialize. Add steps before the framework boots.
+        /// A step that throws is logged and reported as failed without stopping the boot.
+        /// </remarks>
+        public void AddBootStep(BootPhase phase, string name, Action step)
+        {
+            if (step == null) throw new ArgumentNullException(nameof(step));
 
-            // Shutdown modules in reverse order
-            for (int i = _modules.Count - 1; i >= 0; i--)
+            if (_isInitialized || (_isBooting && phase < _bootPhase))
             {
-                _modules[i].Shutdown();
-                FrameworkLogger.Log($"Shutdown module: {_modules[i].ModuleName}");
+                Log.Warning("Boot step {0} added after the {1} phase ran. Skipping.", name, phase);
+                return;
             }
 
-            _modules.Clear();
-
-            // Shutdown core systems
-            ShutdownCoreSystems();
-
-            _isInitialized = false;
-            FrameworkLogger.Log("HaroFramework shutdown complete.");
+            _bootSteps.Add(new BootStep(phase, name ?? step.Method.Name, step));
         }
 
         /// <summary>
@@ -148,26 +331,37 @@ namespace HaroFramework.Core
         /// </summary>
         /// <param name="module">The module to register.</param>
         /// <remarks>
-        /// Modules are initialized in priority order after registration.
-        /// If framework is already initialized, the module is initialized immediately.
+        /// Modules registered before the Modules boot phase initialize in dependency order during boot.
+        /// If the framework is already initialized, or past that phase, the module is initialized immediately after.
         /// </remarks>
         public void RegisterModule(IModule module)
         {
             if (_modules.Contains(module))
             {
-                FrameworkLogger.LogWarning($"Module {module.ModuleName} is already registered.");
+                Log.Warning("Module {0} is already registered.", module.ModuleName);
                 return;
             }
 
-            _modules.Add(module);
-            _modules = _modules.OrderBy(m => m.Priority).ToList();
+            // Insert after every module with the same or lower priority to keep the list sorted
+            int index = _modules.Count;
+
+            while (index > 0 && _modules[index - 1].Priority > module.Priority)
+            {
+                index--;
+            }
+
+            _modules.Insert(index, module);
+            _scheduler.Add(module);
 
-            FrameworkLogger.Log($"Registered module: {module.ModuleName} (Priority: {module.Priority})");
+            Log.Info("Registered module: {0} (Priority: {1})", module.ModuleName, module.Priority);
 
-            if (_isInitialized)
+            if (_isBooting && _bootPhase == BootPhase.Modules)
             {
-                module.Initialize();
-                FrameworkLogger.Log($"Initialized module: {module.ModuleName}");
+                _lateModules.Add(module);
+            }
+            else if (_isInitialized)
+            {
+                InitializeRegisteredModule(module);
             }
         }
 
@@ -179,72 +373,449 @@ namespace HaroFramework.Core
         {
             if (!_modules.Contains(module))
             {
-                FrameworkLogger.LogWarning($"Module {module.ModuleName} is not registered.");
+                Log.Warning("Module {0} is not registered.", module.ModuleName);
                 return;
             }
 
-            module.Shutdown();
+            if (_initializedModules.Remove(module))
+            {
+                ShutdownModule(module);
+            }
+
             _modules.Remove(module);
+            _lateModules.Remove(module);
+            _scheduler.Remove(module);
 
-            FrameworkLogger.Log($"Unregistered module: {module.ModuleName}");
+            Log.Info("Unregistered module: {0}", module.ModuleName);
         }
 
         #endregion
 
         #region Private Methods
 
+        private async void BootAsync()
+        {
+            try
+            {
+                await InitializeAsync();
+            }
+            catch (OperationCanceledException)
+            {
+                Log.Warning("HaroFramework boot cancelled.");
+            }
+            catch (Exception ex)
+            {
+                Log.Error("HaroFramework boot failed: {0}", ex.Message);
+            }
+        }
+
+        private bool BeginBoot()
+        {
+            if (_isInitialized || _isBooting)
+            {
+                Log.Warning("Framework already initialized. Skipping.");
+                return false;
+            }
+
+            Log.Info("Initializing HaroFramework...");
+
+            _isBooting = true;
+            _isShutdownRequested = false;
+            _bootReport = new BootReport(Time.frameCount);
+            _bootSliceStart = Stopwatch.GetTimestamp();
+            return true;
+        }
+
+        private void EndBoot(bool isComplete)
+        {
+            _isBooting = false;
+            _bootReport.Complete(Time.frameCount, isComplete);
+
+            if (isComplete)
+            {
+                _isInitialized = true;
+
+                // Modules registered while the Modules phase ran missed the bootstrapper
+                foreach (IModule module in _lateModules)
+                {
+                    InitializeRegisteredModule(module);
+                }
+
+                _lateModules.Clear();
+                Log.Info("HaroFramework initialized successfully.");
+            }
+            else
+            {
+                _lateModules.Clear();
+                ShutdownModules();
+                Log.Error("HaroFramework boot aborted during the {0} phase.", _bootPhase);
+            }
+
+            if (_config.LogBootReport && FrameworkLogger.IsEnabled)
+            {
+                // Bypasses Log.Info, which is compiled out of Release builds
+                FrameworkLogger.Enqueue(LogLevel.Info, Log.Name, "Boot report:\n" + _bootReport, null);
+            }
+
+            if (_isShutdownRequested)
+            {
+                // Shutdown was called during the boot, for example because the manager was destroyed
+                _isShutdownRequested = false;
+                CompleteShutdown();
+            }
+        }
+
+        private void RunPhase(BootPhase phase, Action work)
+        {
+            _bootPhase = phase;
+            double start = _bootReport.Now();
+            int frame = Time.frameCount;
+            bool succeeded = false;
+
+            try
+            {
+                work?.Invoke();
+                RunBootSteps(phase);
+                succeeded = true;
+            }
+            finally
+            {
+                _bootReport.AddPhase(phase, start, frame, succeeded);
+            }
+        }
+
+        private async Task RunPhaseAsync(BootPhase phase, Func<Task> work, CancellationToken cancellationToken)
+        {
+            ThrowIfBootStopped(cancellationToken);
+
+            _bootPhase = phase;
+            double start = _bootReport.Now();
+            int frame = Time.frameCount;
+            bool succeeded = false;
+
+            try
+            {
+                if (work != null)
+                {
+                    await work();
+                    ThrowIfBootStopped(cancellationToken);
+                }
+
+                for (int i = 0; i < _bootSteps.Count; i++)
+                {
+                    if (_bootSteps[i].Phase != phase) continue;
+
+                    await YieldIfOverBudgetAsync(cancellationToken);
+                    RunBootStep(_bootSteps[i]);
+                }
+
+                succeeded = true;
+            }
+            finally
+            {
+                _bootReport.AddPhase(phase, start, frame, succeeded);
+            }
+
+            await YieldIfOverBudgetAsync(cancellationToken);
+        }
+
+        private void RunBootSteps(BootPhase phase)
+        {
+            for (int i = 0; i < _bootSteps.Count; i++)
+            {
+                if (_bootSteps[i].Phase != phase) continue;
+
+                RunBootStep(_bootSteps[i]);
+            }
+        }
+
+        private void RunBootStep(BootStep step)
+        {
+            double start = _bootReport.Now();
+            int frame = _bootReport.FrameOffset(Time.frameCount);
+            bool succeeded = true;
+
+            try
+            {
+                step.Action();
+            }
+            catch (Exception ex)
+            {
+                Log.Error("Boot step {0} failed: {1}", step.Name, ex.Message);
+                succeeded = false;
+            }
+
+            _bootReport.AddEntry(new BootTiming(step.Name, step.Phase, start, _bootReport.Now() - start, frame, true, succeeded));
+        }
+
+        private async Task YieldIfOverBudgetAsync(CancellationToken cancellationToken)
+        {
+            double budget = _config.BootFrameBudgetMilliseconds;
+            double elapsed = (Stopwatch.GetTimestamp() - _bootSliceStart) * 1000.0 / Stopwatch.Frequency;
+
+            if (budget > 0 && elapsed >= budget)
+            {
+                await Task.Yield();
+                _bootSliceStart = Stopwatch.GetTimestamp();
+            }
+
+            ThrowIfBootStopped(cancellationToken);
+        }
+
+        /// <summary>
+        /// Stops an asynchronous boot that was cancelled or whose manager was destroyed while it awaited.
+        /// </summary>
+        private void ThrowIfBootStopped(CancellationToken cancellationToken)
+        {
+            // Continuations still run after the component is destroyed; OnDestroy is skipped for inactive objects
+            if (this == null)
+            {
+                _isShutdownRequested = true;
+                throw new OperationCanceledException(cancellationToken);
+            }
+
+            cancellationToken.ThrowIfCancellationRequested();
+        }
+
         private void InitializeCoreSystems()
         {
-            FrameworkLogger.IsEnabled = _config.EnableLogging;
+            ConfigureLogging();
+
+            // The core systems share one GameObject; after this, their Instance is a cached field read
+            GameObject host = null;
 
             if (_config.EnableEventBus)
             {
-                _ = EventBus.Instance;
-                FrameworkLogger.Log("EventBus initialized.");
+                _eventBus = CreateCoreSystem<EventBus>(ref host);
+                _eventBus.MaxQueuedEvents = _config.MaxQueuedEvents;
             }
 
             if (_config.EnableServiceLocator)
             {
-                _ = ServiceLocator.Instance;
-                FrameworkLogger.Log("ServiceLocator initialized.");
+                CreateCoreSystem<ServiceLocator>(ref host);
             }
 
             if (_config.EnableDataManager)
             {
-                _ = DataManager.Instance;
-                FrameworkLogger.Log("DataManager initialized.");
+                CreateCoreSystem<DataManager>(ref host);
+            }
+        }
+
+        private static T CreateCoreSystem<T>(ref GameObject host) where T : Singleton<T>
+        {
+            T system;
+
+            if (Singleton<T>.HasInstance)
+            {
+                system = Singleton<T>.Instance;
+            }
+            else
+            {
+                if (host == null)
+                {
+                    host = new GameObject("HaroFramework Systems");
+                    DontDestroyOnLoad(host);
+                }
+
+                system = Singleton<T>.CreateOn(host);
+            }
+
+            Log.Info("{0} initialized.", typeof(T).Name);
+            return system;
+        }
+
+        private void ConfigureLogging()
+        {
+            FrameworkLogger.IsEnabled = _config.EnableLogging;
+            FrameworkLogger.MinimumLevel = _config.MinimumLogLevel;
+            FrameworkLogger.ResetCategoryLevels();
+
+            foreach (LogCategoryLevel categoryLevel in _config.CategoryLogLevels)
+            {
+                if (string.IsNullOrEmpty(categoryLevel.Category)) continue;
+
+                FrameworkLogger.SetCategoryLevel(categoryLevel.Category, categoryLevel.Level);
+            }
+
+            if (_config.LogToFile && _fileLogSink == null)
+            {
+                _fileLogSink = new RotatingFileLogSink(
+                    Path.Combine(Application.persistentDataPath, "Logs"),
+                    "framework",
+                    _config.MaxLogFileSizeKB * 1024L,
+                    _config.MaxLogFiles);
+                FrameworkLogger.AddSink(_fileLogSink);
+            }
+        }
+
+        private void ReleaseFileLogSink()
+        {
+            if (_fileLogSink == null) return;
+
+            FrameworkLogger.RemoveSink(_fileLogSink);
+            _fileLogSink.Dispose();
+            _fileLogSink = null;
+        }
+
+        private bool ShouldLoadDomains()
+        {
+            if (!_config.EnableDataManager || !_config.LoadDomainsDuringBoot) return false;
+
+            DataManager dataManager = DataManager.Instance;
+            return dataManager.DomainCount > 0 && !dataManager.IsLoaded && !dataManager.IsLoading;
+        }
+
+        private void LoadDomains()
+        {
+            if (!ShouldLoadDomains()) return;
+
+            var recorder = new DomainTimingRecorder(_bootReport);
+
+            try
+            {
+                DataManager.Instance.LoadAllDomains(recorder);
+            }
+            finally
+            {
+                recorder.AddToReport();
+            }
+        }
+
+        private async Task LoadDomainsAsync(CancellationToken cancellationToken)
+        {
+            if (!ShouldLoadDomains()) return;
+
+            var recorder = new DomainTimingRecorder(_bootReport);
+
+            try
+            {
+                await DataManager.Instance.LoadAllDomainsAsync(recorder, cancellationToken);
+            }
+            finally
+            {
+                recorder.AddToReport();
             }
         }
 
         private void InitializeModules()
         {
-            // Sort modules by priority
-            _modules = _modules.OrderBy(m => m.Priority).ToList();
+            _scheduler.TimeSliceBudgetMilliseconds = _config.ModuleTimeSliceBudgetMilliseconds;
+
+            IModule[] modules = _modules.ToArray();
+            var bootstrapper = new ModuleBootstrapper(modules, _bootReport);
+
+            try
+            {
+                bootstrapper.Run();
+            }
+            finally
+            {
+                CompleteModuleBoot(modules, bootstrapper);
+            }
+        }
+
+        private async Task InitializeModulesAsync(CancellationToken cancellationToken)
+        {
+            _scheduler.TimeSliceBudgetMilliseconds = _config.ModuleTimeSliceBudgetMilliseconds;
+
+            IModule[] modules = _modules.ToArray();
+            var bootstrapper = new ModuleBootstrapper(modules, _bootReport);
+
+            try
+            {
+                await bootstrapper.RunAsync(_config.BootFrameBudgetMilliseconds, cancellationToken);
+            }
+            finally
+            {
+                CompleteModuleBoot(modules, bootstrapper);
+            }
+        }
+
+        private void CompleteModuleBoot(IModule[] modules, ModuleBootstrapper bootstrapper)
+        {
+            _initializedModules.AddRange(bootstrapper.InitializedModules);
+
+            // Modules that failed or were skipped stay registered but are not ticked
+            foreach (IModule module in modules)
+            {
+                if (!_initializedModules.Contains(module))
+                {
+                    _scheduler.Remove(module);
+                }
+            }
+        }
+
+        private void InitializeRegisteredModule(IModule module)
+        {
+            try
+            {
+                ModuleBootstrapper.InitializeModule(module);
+            }
+            catch (Exception ex)
+            {
+                Log.Error("Failed to initialize module {0}: {1}", module.ModuleName, ex.Message);
+                _scheduler.Remove(module);
+                return;
+            }
+
+            _initializedModules.Add(module);
+            Log.Info("Initialized module: {0}", module.ModuleName);
+        }
+
+        private void CompleteShutdown()
+        {
+            Log.Info("Shutting down HaroFramework...");
 
-            // Initialize each module
-            foreach (var module in _modules)
+            ShutdownModules();
+            _modules.Clear();
+            _scheduler.Clear();
+
+            // Shutdown core systems
+            ShutdownCoreSystems();
+
+            _isInitialized = false;
+            Log.Info("HaroFramework shutdown complete.");
+
+            ReleaseFileLogSink();
+        }
+
+        private void ShutdownModules()
+        {
+            for (int i = _initializedModules.Count - 1; i >= 0; i--)
+            {
+                ShutdownModule(_initializedModules[i]);
+                Log.Info("Shutdown module: {0}", _initializedModules[i].ModuleName);
+            }
+
+            _initializedModules.Clear();
+        }
+
+        private static void ShutdownModule(IModule module)
+        {
+            using (FrameworkStats.Begin(FrameworkStats.GetModuleRecord(module)?.Shutdown))
             {
-                module.Initialize();
-                FrameworkLogger.Log($"Initialized module: {module.ModuleName} (Priority: {module.Priority})");
+                module.Shutdown();
             }
         }
 
         private void ShutdownCoreSystems()
         {
-            if (_config.EnableDataManager && DataManager.Instance != null)
+            if (_config.EnableDataManager && DataManager.HasInstance)
             {
                 DataManager.Instance.Clear();
             }
 
-            if (_config.EnableServiceLocator && ServiceLocator.Instance != null)
+            if (_config.EnableServiceLocator && ServiceLocator.HasInstance)
             {
                 ServiceLocator.Instance.Clear();
             }
 
-            if (_config.EnableEventBus && EventBus.Instance != null)
+            if (_config.EnableEventBus && EventBus.HasInstance)
             {
                 EventBus.Instance.Clear();
             }
+
+            _eventBus = null;
         }
 
         #endregion
@@ -0,0 +1,191 @@
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Text;
+
+namespace HaroFramework.Core
+{
+    /// <summary>
+    /// Phases of the FrameworkManager boot pipeline, run in declaration order.
+    /// </summary>
+    public enum BootPhase
+    {
+        /// <summary>
+        /// Configures logging and creates the core system singletons.
+        /// </summary>
+        CoreSystems,
+
+        /// <summary>
+        /// Loads the domains registered with DataManager.
+        /// </summary>
+        Data,
+
+        /// <summary>
+        /// Runs boot steps that register services.
+        /// </summary>
+        Services,
+
+        /// <summary>
+        /// Initializes registered modules in dependency order.
+        /// </summary>
+        Modules
+    }
+
+    /// <summary>
+    /// Timing of one phase, boot step or module initialization.
+    /// </summary>
+    public readonly struct BootTiming
+    {
+        public readonly string Name;
+        public readonly BootPhase Phase;
+
+        /// <summary>
+        /// Start time in milliseconds since the boot started.
+        /// </summary>
+        public readonly double StartMilliseconds;
+
+        public readonly double ElapsedMilliseconds;
+
+        /// <summary>
+        /// Number of frames between the start of the boot and the start of this entry.
+        /// </summary>
+        public readonly int Frame;
+
+        public readonly bool IsMainThread;
+        public readonly bool Succeeded;
+
+        public BootTiming(string name, BootPhase phase, double startMilliseconds, double elapsedMilliseconds, int frame, bool isMainThread, bool succeeded)
+        {
+            Name = name;
+            Phase = phase;
+            StartMilliseconds = startMilliseconds;
+            ElapsedMilliseconds = elapsedMilliseconds;
+            Frame = frame;
+            IsMainThread = isMainThread;
+            Succeeded = succeeded;
+        }
+    }
+
+    /// <summary>
+    /// Startup timeline recorded by FrameworkManager while booting.
+    /// </summary>
+    /// <remarks>
+    /// Lists every phase and, inside it, every boot step and module initialization with its start offset,
+    /// duration, frame and thread. ToString formats the timeline as a table, which FrameworkManager logs
+    /// at the end of boot when FrameworkConfig.LogBootReport is enabled.
+    /// </remarks>
+    public sealed class BootReport
+    {
+        #region Fields
+
+        private readonly List<BootTiming> _phases = new List<BootTiming>();
+        private readonly List<BootTiming> _entries = new List<BootTiming>();
+        private readonly long _startTimestamp;
+        private readonly int _startFrame;
+        private double _totalMilliseconds = 0;
+        private int _frameCount = 0;
+        private bool _isComplete = false;
+
+        #endregion
+
+        #region Constructor
+
+        internal BootReport(int startFrame)
+        {
+            _startTimestamp = Stopwatch.GetTimestamp();
+            _startFrame = startFrame;
+        }
+
+        #endregion
+
+        #region Properties
+
+        /// <summary>
+        /// Gets the timing of each phase that has run.
+        /// </summary>
+        public IReadOnlyList<BootTiming> Phases => _phases;
+
+        /// <summary>
+        /// Gets the timing of each boot step and module, in completion order.
+        /// </summary>
+        public IReadOnlyList<BootTiming> Entries => _entries;
+
+        /// <summary>
+        /// Gets the wall-clock duration of the boot in milliseconds.
+        /// </summary>
+        public double TotalMilliseconds => _totalMilliseconds;
+
+        /// <summary>
+        /// Gets the number of frames the boot spanned.
+        /// </summary>
+        public int FrameCount => _frameCount;
+
+        /// <summary>
+        /// Gets whether every phase ran to the end.
+        /// </summary>
+        public bool IsComplete => _isComplete;
+
+        #endregion
+
+        #region Public Methods
+
+        /// <summary>
+        /// Formats the timeline as a table.
+        /// </summary>
+        public override string ToString()
+        {
+            var builder = new StringBuilder();
+            builder.AppendFormat("Boot {0} in {1:F1} ms over {2} frame(s)", _isComplete ? "completed" : "aborted", _totalMilliseconds, _frameCount);
+
+            foreach (BootTiming phase in _phases)
+            {
+                builder.AppendLine();
+                builder.AppendFormat("{0,-12} {1,9:F1} ms  @{2,8:F1} ms  frame {3}", phase.Name, phase.ElapsedMilliseconds, phase.StartMilliseconds, phase.Frame);
+
+                foreach (BootTiming entry in _entries)
+                {
+                    if (entry.Phase != phase.Phase) continue;
+
+                    builder.AppendLine();
+                    builder.AppendFormat("  {0,-30} {1,9:F1} ms  @{2,8:F1} ms  frame {3}  {4}{5}",
+                        entry.Name, entry.ElapsedMilliseconds, entry.StartMilliseconds, entry.Frame,
+                        entry.IsMainThread ? "main" : "worker", entry.Succeeded ? string.Empty : "  FAILED");
+                }
+            }
+
+            return builder.ToString();
+        }
+
+        #endregion
+
+        #region Internal Methods
+
+        internal double Now()
+        {
+            return (Stopwatch.GetTimestamp() - _startTimestamp) * 1000.0 / Stopwatch.Frequency;
+        }
+
+        internal int FrameOffset(int frame)
+        {
+            return frame - _startFrame;
+        }
+
+        internal void AddPhase(BootPhase phase, double startMilliseconds, int frame, bool succeeded)
+        {
+            _phases.Add(new BootTiming(phase.ToString(), phase, startMilliseconds, Now() - startMilliseconds, FrameOffset(frame), true, succeeded));
+        }
+
+        internal void AddEntry(in BootTiming entry)
+        {
+            _entries.Add(entry);
+        }
+
+        internal void Complete(int frame, bool isComplete)
+        {
+            _totalMilliseconds = Now();
+            _frameCount = FrameOffset(frame) + 1;
+            _isComplete = isComplete;
+        }
+
+        #endregion
+    }
+}
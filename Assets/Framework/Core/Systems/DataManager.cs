@@ -1,24 +1,114 @@
 using System;
 using System.Collections.Generic;
-using UnityEngine;
+using System.Threading;
+using System.Threading.Tasks;
 using HaroFramework.Data;
 
 namespace HaroFramework.Core
 {
+    /// <summary>
+    /// Progress report for a single domain during LoadAllDomainsAsync.
+    /// </summary>
+    public readonly struct DomainLoadProgress
+    {
+        /// <summary>
+        /// Gets the name of the domain that finished.
+        /// </summary>
+        public readonly string DomainName;
+
+        /// <summary>
+        /// Gets whether the domain loaded successfully.
+        /// </summary>
+        public readonly bool Succeeded;
+
+        /// <summary>
+        /// Gets the time spent in the domain's LoadData, in milliseconds.
+        /// </summary>
+        public readonly double ElapsedMilliseconds;
+
+        /// <summary>
+        /// Gets the number of domains finished so far, including this one.
+        /// </summary>
+        public readonly int CompletedCount;
+
+        /// <summary>
+        /// Gets the total number of domains being loaded.
+        /// </summary>
+        public readonly int TotalCount;
+
+        /// <summary>
+        /// Gets the fraction of domains finished, from 0 to 1.
+        /// </summary>
+        public float Progress => TotalCount == 0 ? 1f : (float)CompletedCount / TotalCount;
+
+        public DomainLoadProgress(string domainName, bool succeeded, double elapsedMilliseconds, int completedCount, int totalCount)
+        {
+            DomainName = domainName;
+            Succeeded = succeeded;
+            ElapsedMilliseconds = elapsedMilliseconds;
+            CompletedCount = completedCount;
+            TotalCount = totalCount;
+        }
+    }
+
     /// <summary>
     /// Central manager for all domain objects.
     /// </summary>
     /// <remarks>
     /// Manages registration and access to domain objects.
     /// Domains handle data loading, caching, and business logic.
-    /// Call LoadAllDomains during game initialization to load all data.
+    /// Call LoadAllDomains or LoadAllDomainsAsync during game initialization to load all data.
+    /// Domains are loaded in dependency order; a domain whose dependency failed is skipped.
     /// </remarks>
     public class DataManager : Singleton<DataManager>
     {
+        #region Nested Types
+
+        private sealed class LoadCounter
+        {
+            public readonly int Total;
+            public int Completed;
+
+            public LoadCounter(int total)
+            {
+                Total = total;
+            }
+        }
+
+        #endregion
+
         #region Fields
 
-        private readonly Dictionary<Type, object> _domains = new Dictionary<Type, object>();
+        private static readonly LogCategory Log = FrameworkLogger.GetCategory("DataManager");
+
+        private readonly Dictionary<Type, IDomain> _domains = new Dictionary<Type, IDomain>();
+        private readonly Dictionary<Type, double> _domainLoadTimes = new Dictionary<Type, double>();
         private bool _isLoaded = false;
+        private bool _isLoading = false;
+
+        #endregion
+
+        #region Properties
+
+        /// <summary>
+        /// Gets whether all domains have been loaded.
+        /// </summary>
+        public bool IsLoaded => _isLoaded;
+
+        /// <summary>
+        /// Gets whether LoadAllDomains or LoadAllDomainsAsync is running.
+        /// </summary>
+        public bool IsLoading => _isLoading;
+
+        /// <summary>
+        /// Gets the number of registered domains.
+        /// </summary>
+        public int DomainCount => _domains.Count;
+
+        /// <summary>
+        /// Gets the LoadData time of each loaded domain in milliseconds, keyed by domain type.
+        /// </summary>
+        public IReadOnlyDictionary<Type, double> DomainLoadTimes => _domainLoadTimes;
 
         #endregion
 
@@ -42,11 +132,11 @@ namespace HaroFramework.Core
 
             if (_domains.ContainsKey(domainType))
             {
-                Debug.LogWarning($"[DataManager] Domain of type {domainType.Name} is already registered. Overwriting.");
+                Log.Warning("Domain of type {0} is already registered. Overwriting.", domainType.Name);
             }
 
             _domains[domainType] = domain;
-            Debug.Log($"[DataManager] Registered domain: {domainType.Name}");
+            Log.Info("Registered domain: {0}", domainType.Name);
         }
 
         /// <summary>
@@ -63,9 +153,9 @@ namespace HaroFramework.Core
         {
             Type domainType = typeof(TDomain);
 
-            if (_domains.ContainsKey(domainType))
+            if (_domains.TryGetValue(domainType, out IDomain domain))
             {
-                return _domains[domainType] as TDomain;
+                return domain as TDomain;
             }
 
             throw new InvalidOperationException($"[DataManager] Domain of type {domainType.Name} is not registered.");
@@ -84,42 +174,143 @@ namespace HaroFramework.Core
         /// <summary>
         /// Loads data for all registered domains.
         /// </summary>
+        /// <param name="progress">Optional receiver notified as each domain finishes.</param>
         /// <remarks>
         /// Should be called once during game initialization, after all domains are registered.
-        /// Calls LoadData on each domain in registration order.
-        /// This operation may take time depending on data size.
+        /// Calls LoadData on each domain on the calling thread, dependencies first.
+        /// This operation may take time depending on data size; prefer LoadAllDomainsAsync at boot.
         /// </remarks>
-        public void LoadAllDomains()
+        /// <exception cref="InvalidOperationException">Thrown if domain dependencies form a cycle.</exception>
+        public void LoadAllDomains(IProgress<DomainLoadProgress> progress = null)
         {
-            if (_isLoaded)
+            if (!BeginLoad()) return;
+
+            Log.Info("Loading all domains...");
+
+            try
             {
-                Debug.LogWarning("[DataManager] Domains already loaded. Skipping.");
-                return;
+                List<Type> loadOrder = GetLoadOrder();
+                var failed = new HashSet<Type>();
+                var counter = new LoadCounter(loadOrder.Count);
+
+                foreach (Type domainType in loadOrder)
+                {
+                    IDomain domain = _domains[domainType];
+                    double elapsedMilliseconds = 0;
+                    bool succeeded = CanLoad(domainType, domain, failed) && LoadDomain(domainType, domain, out elapsedMilliseconds);
+
+                    if (!succeeded)
+                    {
+                        failed.Add(domainType);
+                    }
+
+                    Report(domain, succeeded, elapsedMilliseconds, counter, progress);
+                }
+
+                EndLoad(failed.Count);
             }
+            finally
+            {
+                _isLoading = false;
+            }
+        }
 
-            Debug.Log("[DataManager] Loading all domains...");
+        /// <summary>
+        /// Loads data for all registered domains concurrently.
+        /// </summary>
+        /// <param name="progress">Optional receiver notified as each domain finishes.</param>
+        /// <param name="cancellationToken">Stops domains that have not started yet.</param>
+        /// <returns>A task that completes once every domain has loaded, failed, or been skipped.</returns>
+        /// <remarks>
+        /// Independent domains run LoadData on the thread pool; a domain starts once all its
+        /// Dependencies have loaded. Domains with LoadOnMainThread run on the calling thread's
+        /// synchronization context. Await this from the main thread: the continuation that marks
+        /// the manager as loaded runs there, so dependent systems only start after loading is done.
+        /// </remarks>
+        /// <exception cref="InvalidOperationException">Thrown if domain dependencies form a cycle.</exception>
+        public async Task LoadAllDomainsAsync(IProgress<DomainLoadProgress> progress = null, CancellationToken cancellationToken = default)
+        {
+            if (!BeginLoad()) return;
+
+            Log.Info("Loading all domains asynchronously...");
+
+            try
+            {
+                List<Type> loadOrder = GetLoadOrder();
+                TaskScheduler mainThreadScheduler = SynchronizationContext.Current != null
+                    ? TaskScheduler.FromCurrentSynchronizationContext()
+                    : TaskScheduler.Current;
+                var tasks = new Dictionary<Type, Task<bool>>(loadOrder.Count);
+                var counter = new LoadCounter(loadOrder.Count);
+
+                // Load order guarantees dependency tasks exist before their dependents are created
+                foreach (Type domainType in loadOrder)
+                {
+                    IDomain domain = _domains[domainType];
+                    var dependencyTasks = new List<KeyValuePair<Type, Task<bool>>>(domain.Dependencies.Count);
+
+                    foreach (Type dependency in domain.Dependencies)
+                    {
+                        if (tasks.TryGetValue(dependency, out Task<bool> dependencyTask))
+                        {
+                            dependencyTasks.Add(new KeyValuePair<Type, Task<bool>>(dependency, dependencyTask));
+                        }
+                    }
+
+                    TaskScheduler scheduler = domain.LoadOnMainThread ? mainThreadScheduler : TaskScheduler.Default;
+                    tasks[domainType] = LoadDomainAsync(domainType, domain, dependencyTasks, scheduler, counter, progress, cancellationToken);
+                }
+
+                bool[] results = await Task.WhenAll(tasks.Values);
+
+                cancellationToken.ThrowIfCancellationRequested();
+
+                int failedCount = 0;
+
+                foreach (bool succeeded in results)
+                {
+                    if (!succeeded) failedCount++;
+                }
+
+                EndLoad(failedCount);
+            }
+            finally
+            {
+                _isLoading = false;
+            }
+        }
+
+        /// <summary>
+        /// Reloads every domain whose source data changed since it was loaded.
+        /// </summary>
+        /// <returns>The number of domains that were reloaded.</returns>
+        /// <remarks>
+        /// Only domains implementing IReloadableDomain take part; unchanged tables are left untouched.
+        /// Call from the main thread, for example from an editor file watcher or a debug menu.
+        /// </remarks>
+        public int ReloadChangedDomains()
+        {
+            int reloadedCount = 0;
 
             foreach (var kvp in _domains)
             {
-                Type domainType = kvp.Key;
-                object domain = kvp.Value;
+                if (!(kvp.Value is IReloadableDomain domain)) continue;
 
                 try
                 {
-                    // Get LoadData method through reflection
-                    var loadDataMethod = domainType.GetMethod("LoadData");
-                    loadDataMethod?.Invoke(domain, null);
-
-                    Debug.Log($"[DataManager] Loaded domain: {domainType.Name}");
+                    if (domain.ReloadIfChanged())
+                    {
+                        reloadedCount++;
+                        Log.Info("Reloaded domain: {0}", kvp.Key.Name);
+                    }
                 }
                 catch (Exception ex)
                 {
-                    Debug.LogError($"[DataManager] Failed to load domain {domainType.Name}: {ex.Message}");
+                    Log.Error("Failed to reload domain {0}: {1}", kvp.Key.Name, ex.Message);
                 }
             }
 
-            _isLoaded = true;
-            Debug.Log("[DataManager] All domains loaded successfully.");
+            return reloadedCount;
         }
 
         /// <summary>
@@ -132,8 +323,179 @@ namespace HaroFramework.Core
         public void Clear()
         {
             _domains.Clear();
+            _domainLoadTimes.Clear();
             _isLoaded = false;
-            Debug.Log("[DataManager] Cleared all domains.");
+            Log.Info("Cleared all domains.");
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private bool BeginLoad()
+        {
+            if (_isLoaded)
+            {
+                Log.Warning("Domains already loaded. Skipping.");
+                return false;
+            }
+
+            if (_isLoading)
+            {
+                Log.Warning("Domains are already loading. Skipping.");
+                return false;
+            }
+
+            _isLoading = true;
+            _domainLoadTimes.Clear();
+            return true;
+        }
+
+        private void EndLoad(int failedCount)
+        {
+            _isLoaded = true;
+
+            if (failedCount > 0)
+            {
+                Log.Warning("Domains loaded with {0} failure(s).", failedCount);
+            }
+            else
+            {
+                Log.Info("All domains loaded successfully.");
+            }
+        }
+
+        private async Task<bool> LoadDomainAsync(
+            Type domainType,
+            IDomain domain,
+            List<KeyValuePair<Type, Task<bool>>> dependencyTasks,
+            TaskScheduler scheduler,
+            LoadCounter counter,
+            IProgress<DomainLoadProgress> progress,
+            CancellationToken cancellationToken)
+        {
+            HashSet<Type> failed = null;
+
+            // Dependency tasks never throw, so awaiting them in turn waits for all of them
+            foreach (KeyValuePair<Type, Task<bool>> dependency in dependencyTasks)
+            {
+                if (!await dependency.Value.ConfigureAwait(false))
+                {
+                    failed ??= new HashSet<Type>();
+                    failed.Add(dependency.Key);
+                }
+            }
+
+            // CanLoad logs a failed dependency the same way for both load paths
+            if (cancellationToken.IsCancellationRequested || !CanLoad(domainType, domain, failed))
+            {
+                return Report(domain, false, 0, counter, progress);
+            }
+
+            return await Task.Factory.StartNew(() =>
+            {
+                bool succeeded = LoadDomain(domainType, domain, out double elapsedMilliseconds);
+                return Report(domain, succeeded, elapsedMilliseconds, counter, progress);
+            }, CancellationToken.None, TaskCreationOptions.DenyChildAttach, scheduler).ConfigureAwait(false);
+        }
+
+        private static bool Report(IDomain domain, bool succeeded, double elapsedMilliseconds, LoadCounter counter, IProgress<DomainLoadProgress> progress)
+        {
+            int completed = Interlocked.Increment(ref counter.Completed);
+            progress?.Report(new DomainLoadProgress(domain.DomainName, succeeded, elapsedMilliseconds, completed, counter.Total));
+            return succeeded;
+        }
+
+        private bool CanLoad(Type domainType, IDomain domain, HashSet<Type> failed)
+        {
+            foreach (Type dependency in domain.Dependencies)
+            {
+                if (!_domains.ContainsKey(dependency))
+                {
+                    Log.Error("Failed to load domain {0}: dependency {1} is not registered.", domainType.Name, dependency.Name);
+                    return false;
+                }
+
+                if (failed != null && failed.Contains(dependency))
+                {
+                    Log.Error("Skipped domain {0}: dependency {1} failed to load.", domainType.Name, dependency.Name);
+                    return false;
+                }
+            }
+
+            return true;
+        }
+
+        private bool LoadDomain(Type domainType, IDomain domain, out double elapsedMilliseconds)
+        {
+            long start = System.Diagnostics.Stopwatch.GetTimestamp();
+
+            try
+            {
+                using (FrameworkStats.BeginDomainLoad(domainType))
+                {
+                    domain.LoadData();
+                }
+            }
+            catch (Exception ex)
+            {
+                elapsedMilliseconds = GetElapsedMilliseconds(start);
+                Log.Error("Failed to load domain {0}: {1}", domainType.Name, ex.Message);
+                return false;
+            }
+
+            elapsedMilliseconds = GetElapsedMilliseconds(start);
+
+            lock (_domainLoadTimes)
+            {
+                _domainLoadTimes[domainType] = elapsedMilliseconds;
+            }
+
+            Log.Info("Loaded domain: {0} ({1:F1} ms)", domainType.Name, elapsedMilliseconds);
+            return true;
+        }
+
+        private static double GetElapsedMilliseconds(long startTimestamp)
+        {
+            return (System.Diagnostics.Stopwatch.GetTimestamp() - startTimestamp) * 1000.0 / System.Diagnostics.Stopwatch.Frequency;
+        }
+
+        private List<Type> GetLoadOrder()
+        {
+            // Depth-first topological sort: dependencies are emitted before their dependents
+            var order = new List<Type>(_domains.Count);
+            var visited = new HashSet<Type>();
+            var visiting = new List<Type>();
+
+            foreach (Type domainType in _domains.Keys)
+            {
+                Visit(domainType, order, visited, visiting);
+            }
+
+            return order;
+        }
+
+        private void Visit(Type domainType, List<Type> order, HashSet<Type> visited, List<Type> visiting)
+        {
+            if (visited.Contains(domainType) || !_domains.TryGetValue(domainType, out IDomain domain)) return;
+
+            if (visiting.Contains(domainType))
+            {
+                visiting.Add(domainType);
+                string cycle = string.Join(" -> ", visiting.ConvertAll(type => type.Name));
+                throw new InvalidOperationException($"[DataManager] Circular domain dependency detected: {cycle}");
+            }
+
+            visiting.Add(domainType);
+
+            foreach (Type dependency in domain.Dependencies)
+            {
+                Visit(dependency, order, visited, visiting);
+            }
+
+            visiting.RemoveAt(visiting.Count - 1);
+            visited.Add(domainType);
+            order.Add(domainType);
         }
 
         #endregion
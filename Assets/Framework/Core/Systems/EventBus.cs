@@ -1,5 +1,8 @@
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
+using System.Diagnostics;
+using System.Threading;
 
 namespace HaroFramework.Core
 {
@@ -9,22 +12,406 @@ namespace HaroFramework.Core
     /// <remarks>
     /// All event classes must implement this interface.
     /// Events should be immutable data containers with no logic.
+    /// Struct events are supported and are passed by reference without boxing.
     /// </remarks>
     public interface IGameEvent { }
 
+    /// <summary>
+    /// Handler that receives an event by readonly reference.
+    /// </summary>
+    /// <typeparam name="T">The type of event handled.</typeparam>
+    /// <param name="gameEvent">The published event.</param>
+    /// <remarks>
+    /// Prefer this over Action&lt;T&gt; for large struct events to avoid copying them per handler.
+    /// </remarks>
+    public delegate void GameEventHandler<T>(in T gameEvent) where T : IGameEvent;
+
+    /// <summary>
+    /// Dispatch channel for queued events.
+    /// </summary>
+    /// <remarks>
+    /// Channels are drained in declaration order each frame.
+    /// </remarks>
+    public enum EventPriority
+    {
+        /// <summary>
+        /// Always dispatched in full, regardless of the frame budget.
+        /// </summary>
+        High,
+
+        /// <summary>
+        /// Default channel, subject to the frame budget.
+        /// </summary>
+        Normal,
+
+        /// <summary>
+        /// Dispatched last, subject to the frame budget.
+        /// </summary>
+        Low
+    }
+
     /// <summary>
     /// Central event bus for loose coupling between game systems.
     /// </summary>
     /// <remarks>
     /// Provides publish-subscribe pattern for game-wide communication.
     /// Events are processed synchronously in the order they are published.
+    /// Handlers are stored per event type in a snapshot array that is only rebuilt after
+    /// a subscription change, so publishing does not allocate in steady state.
+    /// Publish counts and times per event type are reported through FrameworkStats.
+    /// Publish, Subscribe and Unsubscribe must be called from the main thread.
+    /// Other threads raise events through Enqueue; queued events are dispatched on the
+    /// main thread when FrameworkManager drains the queue at the start of each frame.
     /// Remember to unsubscribe in OnDestroy to prevent memory leaks.
     /// </remarks>
     public class EventBus : Singleton<EventBus>
     {
+        #region Nested Types
+
+        private interface IHandlerList
+        {
+            int Count { get; }
+        }
+
+        /// <summary>
+        /// Typed handler storage for a single event type.
+        /// </summary>
+        /// <remarks>
+        /// Removal leaves a hole that is compacted on the next snapshot rebuild,
+        /// which keeps Unsubscribe O(1) while preserving subscription order.
+        /// </remarks>
+        private sealed class HandlerList<T> : IHandlerList where T : IGameEvent
+        {
+            private struct Entry
+            {
+                public Action<T> Action;
+                public GameEventHandler<T> InHandler;
+            }
+
+            private static readonly Entry[] EmptySnapshot = new Entry[0];
+
+            private readonly List<Entry> _entries = new List<Entry>();
+            private readonly Dictionary<Delegate, int> _indices = new Dictionary<Delegate, int>();
+            private Entry[] _snapshot = EmptySnapshot;
+            private bool _isDirty = false;
+
+            public int Count => _indices.Count;
+
+            public bool Add(Action<T> action)
+            {
+                return Add(action, new Entry { Action = action });
+            }
+
+            public bool Add(GameEventHandler<T> handler)
+            {
+                return Add(handler, new Entry { InHandler = handler });
+            }
+
+            public bool Remove(Delegate handler)
+            {
+                if (!_indices.TryGetValue(handler, out int index))
+                {
+                    return false;
+                }
+
+                _indices.Remove(handler);
+                _entries[index] = default;
+                _isDirty = true;
+                return true;
+            }
+
+            public void Invoke(in T gameEvent)
+            {
+                if (_isDirty)
+                {
+                    RebuildSnapshot();
+                }
+
+                // The snapshot is never mutated in place, so handlers may subscribe or
+                // unsubscribe during dispatch without affecting the current iteration.
+                Entry[] snapshot = _snapshot;
+
+                for (int i = 0; i < snapshot.Length; i++)
+                {
+                    if (snapshot[i].InHandler != null)
+                    {
+                        snapshot[i].InHandler(in gameEvent);
+                    }
+                    else
+                    {
+                        snapshot[i].Action(gameEvent);
+                    }
+                }
+            }
+
+            private bool Add(Delegate key, Entry entry)
+            {
+                if (_indices.ContainsKey(key))
+                {
+                    return false;
+                }
+
+                _indices[key] = _entries.Count;
+                _entries.Add(entry);
+                _isDirty = true;
+                return true;
+            }
+
+            private void RebuildSnapshot()
+            {
+                // Compact removed entries and refresh their indices
+                int count = 0;
+
+                for (int i = 0; i < _entries.Count; i++)
+                {
+                    Entry entry = _entries[i];
+
+                    if (entry.Action == null && entry.InHandler == null) continue;
+
+                    if (count != i)
+                    {
+                        _entries[count] = entry;
+                        _indices[(Delegate)entry.Action ?? entry.InHandler] = count;
+                    }
+
+                    count++;
+                }
+
+                _entries.RemoveRange(count, _entries.Count - count);
+                _snapshot = count == 0 ? EmptySnapshot : _entries.ToArray();
+                _isDirty = false;
+            }
+        }
+
+        private interface IQueuedEvent
+        {
+            /// <returns>False if the entry was superseded and nothing was published.</returns>
+            bool Dispatch(EventBus bus);
+
+            void Discard(EventBus bus);
+        }
+
+        /// <summary>
+        /// Pooled queue entry carrying a single event of type T.
+        /// </summary>
+        private sealed class QueuedEvent<T> : IQueuedEvent where T : IGameEvent
+        {
+            private static readonly ConcurrentQueue<QueuedEvent<T>> Pool = new ConcurrentQueue<QueuedEvent<T>>();
+
+            public T Event;
+            public EventPriority Priority;
+            public Coalescer<T> Coalescer;
+            public bool IsSuperseded;
+
+            public static QueuedEvent<T> Rent(in T gameEvent, EventPriority priority)
+            {
+                if (!Pool.TryDequeue(out QueuedEvent<T> queued))
+                {
+                    queued = new QueuedEvent<T>();
+                }
+
+                queued.Event = gameEvent;
+                queued.Priority = priority;
+                return queued;
+            }
+
+            public bool Dispatch(EventBus bus)
+            {
+                if (!Release(out T gameEvent)) return false;
+
+                Interlocked.Decrement(ref bus._queuedCount);
+                bus.Publish(in gameEvent);
+                return true;
+            }
+
+            public void Discard(EventBus bus)
+            {
+                if (Release(out _))
+                {
+                    Interlocked.Decrement(ref bus._queuedCount);
+                }
+            }
+
+            /// <summary>
+            /// Returns the entry to the pool.
+            /// </summary>
+            /// <returns>False if the entry was superseded by a promoted one and must not be published.</returns>
+            private bool Release(out T gameEvent)
+            {
+                bool isLive = true;
+
+                if (Coalescer != null)
+                {
+                    isLive = Coalescer.Release(this, out gameEvent);
+                }
+                else
+                {
+                    gameEvent = Event;
+                }
+
+                Event = default;
+                Coalescer = null;
+                IsSuperseded = false;
+                Pool.Enqueue(this);
+
+                return isLive;
+            }
+        }
+
+        /// <summary>
+        /// Merges events of type T into the single pending queue entry.
+        /// </summary>
+        /// <remarks>
+        /// A queue entry cannot be moved between channels, so promoting the pending event to a higher
+        /// priority marks the old entry as superseded and rents a new one in the higher channel.
+        /// The superseded entry is skipped when it is dequeued. The promoted entry takes over the
+        /// superseded entry's place in the queue count, so superseded entries are never counted.
+        /// </remarks>
+        private sealed class Coalescer<T> where T : IGameEvent
+        {
+            private readonly object _lock = new object();
+            private Func<T, T, T> _merge;
+            private QueuedEvent<T> _pending;
+
+            public Coalescer(Func<T, T, T> merge)
+            {
+                _merge = merge;
+            }
+
+            /// <summary>
+            /// Replaces the merge function, keeping the pending entry.
+            /// </summary>
+            public void SetMerge(Func<T, T, T> merge)
+            {
+                lock (_lock)
+                {
+                    _merge = merge;
+                }
+            }
+
+            /// <summary>
+            /// Merges the event into the pending entry, or rents a new entry if none is pending.
+            /// </summary>
+            /// <param name="gameEvent">The event to queue.</param>
+            /// <param name="priority">The channel the event was queued on.</param>
+            /// <param name="isFull">Whether the queue is at its limit, in which case no new entry is rented.</param>
+            /// <param name="isMerged">Set to true if the event was merged into the pending one.</param>
+            /// <returns>
+            /// A new entry, a promoted entry replacing the pending one when isMerged is true,
+            /// or null if nothing needs to be enqueued.
+            /// </returns>
+            public QueuedEvent<T> MergeOrRent(in T gameEvent, EventPriority priority, bool isFull, out bool isMerged)
+            {
+                lock (_lock)
+                {
+                    if (_pending != null)
+                    {
+                        isMerged = true;
+                        T merged = _merge != null ? _merge(_pending.Event, gameEvent) : gameEvent;
+
+                        if (priority >= _pending.Priority)
+                        {
+                            _pending.Event = merged;
+                            return null;
+                        }
+
+                        _pending.IsSuperseded = true;
+                        _pending.Event = default;
+                        return _pending = Rent(in merged, priority);
+                    }
+
+                    isMerged = false;
+
+                    if (isFull) return null;
+
+                    return _pending = Rent(in gameEvent, priority);
+                }
+            }
+
+            /// <summary>
+            /// Takes the event out of a dequeued entry.
+            /// </summary>
+            /// <returns>False if the entry was superseded.</returns>
+            public bool Release(QueuedEvent<T> queued, out T gameEvent)
+            {
+                lock (_lock)
+                {
+                    if (_pending == queued)
+                    {
+                        _pending = null;
+                    }
+
+                    gameEvent = queued.Event;
+                    return !queued.IsSuperseded;
+                }
+            }
+
+            private QueuedEvent<T> Rent(in T gameEvent, EventPriority priority)
+            {
+                QueuedEvent<T> queued = QueuedEvent<T>.Rent(in gameEvent, priority);
+                queued.Coalescer = this;
+                return queued;
+            }
+        }
+
+        #endregion
+
         #region Fields
 
-        private readonly Dictionary<Type, List<Delegate>> _eventHandlers = new Dictionary<Type, List<Delegate>>();
+        private static readonly LogCategory Log = FrameworkLogger.GetCategory("EventBus");
+
+        private readonly Dictionary<Type, IHandlerList> _eventHandlers = new Dictionary<Type, IHandlerList>();
+
+        private readonly ConcurrentQueue<IQueuedEvent>[] _channels =
+        {
+            new ConcurrentQueue<IQueuedEvent>(),
+            new ConcurrentQueue<IQueuedEvent>(),
+            new ConcurrentQueue<IQueuedEvent>()
+        };
+        private readonly ConcurrentDictionary<Type, object> _coalescers = new ConcurrentDictionary<Type, object>();
+        private int _maxQueuedEvents = 0;
+        private int _queuedCount = 0;
+        private long _droppedCount = 0;
+        private long _coalescedCount = 0;
+        private int _carriedOverCount = 0;
+
+        #endregion
+
+        #region Properties
+
+        /// <summary>
+        /// Gets or sets the maximum number of queued events across all channels.
+        /// </summary>
+        /// <remarks>
+        /// Events enqueued beyond this limit are dropped, including the first coalesced event of a type.
+        /// Events merged into an already pending event are not counted, and a promoted event replaces the
+        /// pending one in the count, so merging never exceeds the limit. Zero or less means unlimited.
+        /// </remarks>
+        public int MaxQueuedEvents
+        {
+            get => _maxQueuedEvents;
+            set => _maxQueuedEvents = value;
+        }
+
+        /// <summary>
+        /// Gets the number of events currently waiting in the queue.
+        /// </summary>
+        public int QueuedEventCount => Volatile.Read(ref _queuedCount);
+
+        /// <summary>
+        /// Gets the total number of events dropped because the queue was full.
+        /// </summary>
+        public long DroppedEventCount => Interlocked.Read(ref _droppedCount);
+
+        /// <summary>
+        /// Gets the total number of events merged into an already pending event.
+        /// </summary>
+        public long CoalescedEventCount => Interlocked.Read(ref _coalescedCount);
+
+        /// <summary>
+        /// Gets the number of events left over by the last DispatchQueued call due to the frame budget.
+        /// </summary>
+        public int CarriedOverEventCount => _carriedOverCount;
 
         #endregion
 
@@ -41,17 +428,25 @@ namespace HaroFramework.Core
         /// </remarks>
         public void Subscribe<T>(Action<T> handler) where T : IGameEvent
         {
-            Type eventType = typeof(T);
+            if (handler == null) return;
 
-            if (!_eventHandlers.ContainsKey(eventType))
-            {
-                _eventHandlers[eventType] = new List<Delegate>();
-            }
+            GetOrCreateHandlers<T>().Add(handler);
+        }
 
-            if (!_eventHandlers[eventType].Contains(handler))
-            {
-                _eventHandlers[eventType].Add(handler);
-            }
+        /// <summary>
+        /// Subscribes to an event type with a handler that receives the event by reference.
+        /// </summary>
+        /// <typeparam name="T">The type of event to subscribe to.</typeparam>
+        /// <param name="handler">The handler to call when the event is published.</param>
+        /// <remarks>
+        /// Use for struct events to avoid copying the event for every handler.
+        /// Handlers are called in the order they were subscribed.
+        /// </remarks>
+        public void Subscribe<T>(GameEventHandler<T> handler) where T : IGameEvent
+        {
+            if (handler == null) return;
+
+            GetOrCreateHandlers<T>().Add(handler);
         }
 
         /// <summary>
@@ -65,17 +460,20 @@ namespace HaroFramework.Core
         /// </remarks>
         public void Unsubscribe<T>(Action<T> handler) where T : IGameEvent
         {
-            Type eventType = typeof(T);
-
-            if (_eventHandlers.ContainsKey(eventType))
-            {
-                _eventHandlers[eventType].Remove(handler);
+            RemoveHandler<T>(handler);
+        }
 
-                if (_eventHandlers[eventType].Count == 0)
-                {
-                    _eventHandlers.Remove(eventType);
-                }
-            }
+        /// <summary>
+        /// Unsubscribes a by-reference handler from an event type.
+        /// </summary>
+        /// <typeparam name="T">The type of event to unsubscribe from.</typeparam>
+        /// <param name="handler">The handler to remove.</param>
+        /// <remarks>
+        /// Safe to call even if the handler was never subscribed.
+        /// </remarks>
+        public void Unsubscribe<T>(GameEventHandler<T> handler) where T : IGameEvent
+        {
+            RemoveHandler<T>(handler);
         }
 
         /// <summary>
@@ -85,20 +483,18 @@ namespace HaroFramework.Core
         /// <param name="gameEvent">The event instance to publish.</param>
         /// <remarks>
         /// Events are processed synchronously in the order handlers were subscribed.
+        /// Struct events are passed by reference and are never boxed.
         /// If a handler throws an exception, subsequent handlers will not be called.
         /// </remarks>
-        public void Publish<T>(T gameEvent) where T : IGameEvent
+        public void Publish<T>(in T gameEvent) where T : IGameEvent
         {
-            Type eventType = typeof(T);
+            _eventHandlers.TryGetValue(typeof(T), out IHandlerList handlers);
 
-            if (_eventHandlers.ContainsKey(eventType))
+            using (FrameworkStats.BeginPublish<T>(handlers != null ? handlers.Count : 0))
             {
-                // Create a copy to avoid modification during iteration
-                List<Delegate> handlers = new List<Delegate>(_eventHandlers[eventType]);
-
-                foreach (Delegate handler in handlers)
+                if (handlers != null)
                 {
-                    (handler as Action<T>)?.Invoke(gameEvent);
+                    ((HandlerList<T>)handlers).Invoke(in gameEvent);
                 }
             }
         }
@@ -113,6 +509,204 @@ namespace HaroFramework.Core
         public void Clear()
         {
             _eventHandlers.Clear();
+            ClearQueue();
+        }
+
+        /// <summary>
+        /// Queues an event for dispatch on the main thread.
+        /// </summary>
+        /// <typeparam name="T">The type of event to queue.</typeparam>
+        /// <param name="gameEvent">The event instance to queue.</param>
+        /// <param name="priority">The channel the event is dispatched from.</param>
+        /// <returns>True if the event was queued or coalesced, false if it was dropped.</returns>
+        /// <remarks>
+        /// Safe to call from any thread. Queued events are delivered through Publish
+        /// when DispatchQueued runs, in FIFO order within each channel.
+        /// If coalescing is enabled for T, the event is merged into the pending one instead. If it is queued
+        /// at a higher priority than the pending one, the merged event moves to the higher channel.
+        /// Merging never drops an event; only a new queue entry is subject to MaxQueuedEvents.
+        /// </remarks>
+        public bool Enqueue<T>(in T gameEvent, EventPriority priority = EventPriority.Normal) where T : IGameEvent
+        {
+            int max = _maxQueuedEvents;
+            bool isFull = max > 0 && Volatile.Read(ref _queuedCount) >= max;
+            QueuedEvent<T> queued;
+
+            if (_coalescers.TryGetValue(typeof(T), out object coalescer))
+            {
+                queued = ((Coalescer<T>)coalescer).MergeOrRent(in gameEvent, priority, isFull, out bool isMerged);
+
+                if (isMerged)
+                {
+                    Interlocked.Increment(ref _coalescedCount);
+
+                    // A promoted entry takes over the count of the entry it superseded
+                    if (queued != null)
+                    {
+                        _channels[(int)priority].Enqueue(queued);
+                    }
+
+                    return true;
+                }
+
+                if (queued == null)
+                {
+                    Interlocked.Increment(ref _droppedCount);
+                    return false;
+                }
+            }
+            else
+            {
+                if (isFull)
+                {
+                    Interlocked.Increment(ref _droppedCount);
+                    return false;
+                }
+
+                queued = QueuedEvent<T>.Rent(in gameEvent, priority);
+            }
+
+            Interlocked.Increment(ref _queuedCount);
+            _channels[(int)priority].Enqueue(queued);
+            return true;
+        }
+
+        /// <summary>
+        /// Enables coalescing of queued events of type T.
+        /// </summary>
+        /// <typeparam name="T">The type of event to coalesce.</typeparam>
+        /// <param name="merge">
+        /// Combines the pending event with a newly queued one. If null, the newest event replaces the pending one.
+        /// </param>
+        /// <remarks>
+        /// While an event of type T is waiting in the queue, further Enqueue calls for T are merged into it,
+        /// so a burst of events is delivered as a single Publish.
+        /// Calling this again for T only replaces the merge function; a pending event keeps being merged into.
+        /// </remarks>
+        public void EnableCoalescing<T>(Func<T, T, T> merge = null) where T : IGameEvent
+        {
+            var coalescer = (Coalescer<T>)_coalescers.GetOrAdd(typeof(T), _ => new Coalescer<T>(merge));
+            coalescer.SetMerge(merge);
+        }
+
+        /// <summary>
+        /// Disables coalescing of queued events of type T.
+        /// </summary>
+        /// <typeparam name="T">The type of event to stop coalescing.</typeparam>
+        /// <remarks>
+        /// An event that is already pending is still dispatched normally.
+        /// </remarks>
+        public void DisableCoalescing<T>() where T : IGameEvent
+        {
+            _coalescers.TryRemove(typeof(T), out _);
+        }
+
+        /// <summary>
+        /// Dispatches queued events on the calling thread.
+        /// </summary>
+        /// <param name="budgetMilliseconds">
+        /// Time budget for Normal and Low channel events. Zero or less means unlimited.
+        /// </param>
+        /// <returns>The number of events dispatched.</returns>
+        /// <remarks>
+        /// Called by FrameworkManager once per frame before modules update.
+        /// High channel events are always dispatched. Once the budget is spent, remaining events
+        /// are carried over to the next call. Events queued by handlers during dispatch are also
+        /// deferred to the next call. A handler exception is logged and does not stop the drain.
+        /// </remarks>
+        public int DispatchQueued(double budgetMilliseconds = 0)
+        {
+            long start = Stopwatch.GetTimestamp();
+            long budgetTicks = budgetMilliseconds > 0
+                ? (long)(budgetMilliseconds * Stopwatch.Frequency / 1000.0)
+                : long.MaxValue;
+            int dispatched = 0;
+            int carriedOver = 0;
+            bool isBudgetSpent = false;
+
+            for (int channel = 0; channel < _channels.Length; channel++)
+            {
+                ConcurrentQueue<IQueuedEvent> queue = _channels[channel];
+                bool isBudgeted = channel != (int)EventPriority.High;
+                int pending = queue.Count;
+
+                while (pending > 0)
+                {
+                    if (isBudgeted && (isBudgetSpent || Stopwatch.GetTimestamp() - start >= budgetTicks))
+                    {
+                        isBudgetSpent = true;
+                        break;
+                    }
+
+                    if (!queue.TryDequeue(out IQueuedEvent queued)) break;
+
+                    pending--;
+
+                    // Dispatch releases the entry's queue count; superseded entries never held one
+                    try
+                    {
+                        if (!queued.Dispatch(this)) continue;
+                    }
+                    catch (Exception ex)
+                    {
+                        Log.Error("Failed to dispatch queued event: {0}", ex);
+                    }
+
+                    dispatched++;
+                }
+
+                carriedOver += pending;
+            }
+
+            _carriedOverCount = carriedOver;
+            return dispatched;
+        }
+
+        /// <summary>
+        /// Discards all queued events without dispatching them.
+        /// </summary>
+        public void ClearQueue()
+        {
+            foreach (ConcurrentQueue<IQueuedEvent> queue in _channels)
+            {
+                while (queue.TryDequeue(out IQueuedEvent queued))
+                {
+                    queued.Discard(this);
+                }
+            }
+
+            _carriedOverCount = 0;
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private HandlerList<T> GetOrCreateHandlers<T>() where T : IGameEvent
+        {
+            Type eventType = typeof(T);
+
+            if (!_eventHandlers.TryGetValue(eventType, out IHandlerList handlers))
+            {
+                handlers = new HandlerList<T>();
+                _eventHandlers[eventType] = handlers;
+            }
+
+            return (HandlerList<T>)handlers;
+        }
+
+        private void RemoveHandler<T>(Delegate handler) where T : IGameEvent
+        {
+            if (handler == null) return;
+
+            Type eventType = typeof(T);
+
+            if (_eventHandlers.TryGetValue(eventType, out IHandlerList handlers)
+                && ((HandlerList<T>)handlers).Remove(handler)
+                && handlers.Count == 0)
+            {
+                _eventHandlers.Remove(eventType);
+            }
         }
 
         #endregion
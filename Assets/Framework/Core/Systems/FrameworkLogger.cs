@@ -1,4 +1,8 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
 using UnityEngine;
+using Object = UnityEngine.Object;
 
 namespace HaroFramework.Core
 {
@@ -20,23 +24,101 @@ namespace HaroFramework.Core
         /// <summary>
         /// Error messages for failures.
         /// </summary>
-        Error
+        Error,
+
+        /// <summary>
+        /// Used as a minimum level to turn logging off.
+        /// </summary>
+        None
+    }
+
+    /// <summary>
+    /// A formatted log message waiting to be written by the sinks.
+    /// </summary>
+    public readonly struct LogEntry
+    {
+        public readonly LogLevel Level;
+        public readonly string Category;
+        public readonly string Message;
+        public readonly Object Context;
+
+        /// <summary>
+        /// Time the message was logged, in UTC.
+        /// </summary>
+        public readonly DateTime Timestamp;
+        public readonly int ThreadId;
+
+        public LogEntry(LogLevel level, string category, string message, Object context, DateTime timestamp, int threadId)
+        {
+            Level = level;
+            Category = category;
+            Message = message;
+            Context = context;
+            Timestamp = timestamp;
+            ThreadId = threadId;
+        }
     }
 
     /// <summary>
     /// Centralized logging system for the framework.
     /// </summary>
     /// <remarks>
-    /// Provides consistent logging with conditional compilation support.
-    /// Logs are disabled in Release builds for performance.
+    /// Messages are logged through a LogCategory, whose generic overloads defer formatting until the
+    /// message has passed the level check, so filtered-out calls do not allocate.
+    /// Info and Warning calls are compiled out of Release builds; Error calls are kept.
+    /// Accepted messages are written to a lock-free ring buffer and handed to the sinks by a background
+    /// thread, so logging never blocks on the console or disk. Warnings wake the thread immediately.
+    /// Errors are the exception: they are written to the sinks on the calling thread before the call returns,
+    /// so the messages explaining a crash reach the console and disk. Errors are never dropped, even when
+    /// the buffer is full.
+    /// By default messages go to the Unity console; add a RotatingFileLogSink to also write files.
     /// Use this instead of Debug.Log for framework code.
     /// </remarks>
     public static class FrameworkLogger
     {
         #region Fields
 
+        /// <summary>
+        /// Number of messages the ring buffer holds before new ones are dropped.
+        /// </summary>
+        public const int BufferCapacity = 4096;
+
+        private const string DefaultCategoryName = "HaroFramework";
+        private const int FlushIntervalMilliseconds = 100;
+
+#if UNITY_WEBGL && !UNITY_EDITOR
+        private static readonly bool UseFlushThread = false;
+#else
+        private static readonly bool UseFlushThread = true;
+#endif
+
+        private static readonly Dictionary<string, LogCategory> Categories = new Dictionary<string, LogCategory>();
+        private static readonly LogRingBuffer Buffer = new LogRingBuffer(BufferCapacity);
+        private static readonly AutoResetEvent FlushSignal = new AutoResetEvent(false);
+        private static readonly object DrainLock = new object();
+        private static readonly object SinkLock = new object();
+        private static readonly LogCategory DefaultCategory;
+
         private static bool _isEnabled = true;
-        private const string LogPrefix = "[HaroFramework]";
+        private static LogLevel _minimumLevel = LogLevel.Info;
+        private static ILogSink[] _sinks;
+        private static Thread _flushThread;
+        private static volatile bool _isFlushThreadRunning = false;
+        private static long _droppedCount = 0;
+        private static long _reportedDroppedCount = 0;
+
+        #endregion
+
+        #region Constructor
+
+        static FrameworkLogger()
+        {
+            _sinks = new ILogSink[] { new UnityConsoleLogSink() };
+            DefaultCategory = GetCategory(DefaultCategoryName);
+
+            Application.quitting += StopFlushThread;
+            AppDomain.CurrentDomain.DomainUnload += (sender, args) => StopFlushThread();
+        }
 
         #endregion
 
@@ -51,10 +133,141 @@ namespace HaroFramework.Core
             set => _isEnabled = value;
         }
 
+        /// <summary>
+        /// Gets or sets the minimum level for categories that have no level of their own.
+        /// </summary>
+        public static LogLevel MinimumLevel
+        {
+            get => _minimumLevel;
+            set => _minimumLevel = value;
+        }
+
+        /// <summary>
+        /// Gets the category used by the Log, LogWarning and LogError shortcuts.
+        /// </summary>
+        public static LogCategory Default => DefaultCategory;
+
+        /// <summary>
+        /// Gets the total number of messages dropped because the ring buffer was full.
+        /// </summary>
+        public static long DroppedCount => Interlocked.Read(ref _droppedCount);
+
+        /// <summary>
+        /// Gets the sinks that currently receive messages.
+        /// </summary>
+        public static IReadOnlyList<ILogSink> Sinks => _sinks;
+
         #endregion
 
         #region Public Methods
 
+        /// <summary>
+        /// Gets the category with the given name, creating it if needed.
+        /// </summary>
+        /// <param name="name">The category name, shown as a [Name] prefix.</param>
+        /// <returns>The category. Cache it in a static field rather than looking it up per call.</returns>
+        public static LogCategory GetCategory(string name)
+        {
+            if (string.IsNullOrEmpty(name))
+            {
+                throw new ArgumentException("Category name must not be empty.", nameof(name));
+            }
+
+            lock (Categories)
+            {
+                if (!Categories.TryGetValue(name, out LogCategory category))
+                {
+                    category = new LogCategory(name);
+                    Categories[name] = category;
+                }
+
+                return category;
+            }
+        }
+
+        /// <summary>
+        /// Sets the minimum level of a category.
+        /// </summary>
+        /// <param name="category">The category name.</param>
+        /// <param name="level">The minimum level to log.</param>
+        public static void SetCategoryLevel(string category, LogLevel level)
+        {
+            GetCategory(category).MinimumLevel = level;
+        }
+
+        /// <summary>
+        /// Makes every category fall back to MinimumLevel again.
+        /// </summary>
+        public static void ResetCategoryLevels()
+        {
+            lock (Categories)
+            {
+                foreach (LogCategory category in Categories.Values)
+                {
+                    category.ResetMinimumLevel();
+                }
+            }
+        }
+
+        /// <summary>
+        /// Adds a sink that receives every accepted message.
+        /// </summary>
+        /// <param name="sink">The sink to add.</param>
+        public static void AddSink(ILogSink sink)
+        {
+            if (sink == null) return;
+
+            lock (SinkLock)
+            {
+                if (Array.IndexOf(_sinks, sink) >= 0) return;
+
+                var sinks = new ILogSink[_sinks.Length + 1];
+                _sinks.CopyTo(sinks, 0);
+                sinks[_sinks.Length] = sink;
+                _sinks = sinks;
+            }
+        }
+
+        /// <summary>
+        /// Removes a sink after writing all pending messages to it.
+        /// </summary>
+        /// <param name="sink">The sink to remove.</param>
+        /// <remarks>
+        /// The sink is not disposed; the caller owns it.
+        /// </remarks>
+        public static void RemoveSink(ILogSink sink)
+        {
+            if (sink == null) return;
+
+            lock (DrainLock)
+            {
+                Drain();
+
+                lock (SinkLock)
+                {
+                    int index = Array.IndexOf(_sinks, sink);
+
+                    if (index < 0) return;
+
+                    var sinks = new ILogSink[_sinks.Length - 1];
+                    Array.Copy(_sinks, 0, sinks, 0, index);
+                    Array.Copy(_sinks, index + 1, sinks, index, sinks.Length - index);
+                    _sinks = sinks;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Writes all pending messages to the sinks on the calling thread.
+        /// </summary>
+        public static void Flush()
+        {
+            lock (DrainLock)
+            {
+                Drain();
+            }
+        }
+
         /// <summary>
         /// Logs an informational message.
         /// </summary>
@@ -64,9 +277,7 @@ namespace HaroFramework.Core
         [System.Diagnostics.Conditional("DEVELOPMENT_BUILD")]
         public static void Log(string message, Object context = null)
         {
-            if (!_isEnabled) return;
-
-            Debug.Log($"{LogPrefix} {message}", context);
+            DefaultCategory.Write(LogLevel.Info, message, context);
         }
 
         /// <summary>
@@ -78,9 +289,7 @@ namespace HaroFramework.Core
         [System.Diagnostics.Conditional("DEVELOPMENT_BUILD")]
         public static void LogWarning(string message, Object context = null)
         {
-            if (!_isEnabled) return;
-
-            Debug.LogWarning($"{LogPrefix} {message}", context);
+            DefaultCategory.Write(LogLevel.Warning, message, context);
         }
 
         /// <summary>
@@ -88,11 +297,13 @@ namespace HaroFramework.Core
         /// </summary>
         /// <param name="message">The message to log.</param>
         /// <param name="context">Optional Unity object for context.</param>
+        /// <remarks>
+        /// Not compiled out of Release builds. Prefer LogCategory.Error with arguments
+        /// so the message is only formatted when errors are logged.
+        /// </remarks>
         public static void LogError(string message, Object context = null)
         {
-            if (!_isEnabled) return;
-
-            Debug.LogError($"{LogPrefix} {message}", context);
+            DefaultCategory.Write(LogLevel.Error, message, context);
         }
 
         /// <summary>
@@ -118,5 +329,170 @@ namespace HaroFramework.Core
         }
 
         #endregion
+
+        #region Internal Methods
+
+        internal static void Enqueue(LogLevel level, string category, string message, Object context)
+        {
+            var entry = new LogEntry(level, category, message, context, DateTime.UtcNow, Thread.CurrentThread.ManagedThreadId);
+            bool isQueued = Buffer.TryEnqueue(in entry);
+
+            // Errors are written before returning, so they are not lost if the process dies right after
+            if (level >= LogLevel.Error)
+            {
+                FlushError(in entry, isQueued);
+                return;
+            }
+
+            if (!isQueued)
+            {
+                Interlocked.Increment(ref _droppedCount);
+            }
+
+            if (!UseFlushThread)
+            {
+                Flush();
+                return;
+            }
+
+            if (!_isFlushThreadRunning)
+            {
+                StartFlushThread();
+            }
+
+            // Wake the flush thread early for warnings and when the buffer is full
+            if (level >= LogLevel.Warning || !isQueued)
+            {
+                FlushSignal.Set();
+            }
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private static void StartFlushThread()
+        {
+            lock (DrainLock)
+            {
+                if (_isFlushThreadRunning) return;
+
+                _isFlushThreadRunning = true;
+                _flushThread = new Thread(FlushLoop)
+                {
+                    Name = "HaroFramework Log Flush",
+                    IsBackground = true
+                };
+                _flushThread.Start();
+            }
+        }
+
+        private static void StopFlushThread()
+        {
+            Thread thread = _flushThread;
+
+            _isFlushThreadRunning = false;
+            _flushThread = null;
+
+            if (thread != null)
+            {
+                FlushSignal.Set();
+                thread.Join(1000);
+            }
+
+            Flush();
+        }
+
+        private static void FlushLoop()
+        {
+            while (_isFlushThreadRunning)
+            {
+                FlushSignal.WaitOne(FlushIntervalMilliseconds);
+                Flush();
+            }
+        }
+
+        /// <summary>
+        /// Writes pending messages to the sinks, followed by the error if it did not fit in the buffer.
+        /// </summary>
+        /// <remarks>
+        /// An error is never dropped: when the buffer is full it is written after the messages logged before it.
+        /// </remarks>
+        private static void FlushError(in LogEntry entry, bool isQueued)
+        {
+            lock (DrainLock)
+            {
+                Drain();
+
+                if (isQueued) return;
+
+                ILogSink[] sinks = _sinks;
+                Write(sinks, in entry);
+                FlushSinks(sinks);
+            }
+        }
+
+        /// <summary>
+        /// Writes pending messages to the sinks. Must be called while holding DrainLock.
+        /// </summary>
+        private static void Drain()
+        {
+            ILogSink[] sinks = _sinks;
+            bool hasWritten = false;
+
+            long dropped = Interlocked.Read(ref _droppedCount);
+
+            if (dropped != _reportedDroppedCount)
+            {
+                var notice = new LogEntry(LogLevel.Warning, DefaultCategoryName,
+                    $"Log buffer full: {dropped - _reportedDroppedCount} message(s) dropped.", null, DateTime.UtcNow, 0);
+                _reportedDroppedCount = dropped;
+                Write(sinks, in notice);
+                hasWritten = true;
+            }
+
+            while (Buffer.TryDequeue(out LogEntry entry))
+            {
+                Write(sinks, in entry);
+                hasWritten = true;
+            }
+
+            if (hasWritten)
+            {
+                FlushSinks(sinks);
+            }
+        }
+
+        private static void FlushSinks(ILogSink[] sinks)
+        {
+            foreach (ILogSink sink in sinks)
+            {
+                try
+                {
+                    sink.Flush();
+                }
+                catch (Exception)
+                {
+                    // A failing sink must not take down logging for the others
+                }
+            }
+        }
+
+        private static void Write(ILogSink[] sinks, in LogEntry entry)
+        {
+            foreach (ILogSink sink in sinks)
+            {
+                try
+                {
+                    sink.Write(in entry);
+                }
+                catch (Exception)
+                {
+                    // A failing sink must not take down logging for the others
+                }
+            }
+        }
+
+        #endregion
     }
 }
@@ -0,0 +1,684 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Threading;
+using Unity.Profiling;
+
+namespace HaroFramework.Core
+{
+    /// <summary>
+    /// Accumulated timing of a measured operation.
+    /// </summary>
+    public readonly struct TimingStats
+    {
+        /// <summary>
+        /// Number of measured calls.
+        /// </summary>
+        public readonly long Count;
+
+        /// <summary>
+        /// Total time of all measured calls in milliseconds.
+        /// </summary>
+        public readonly double TotalMilliseconds;
+
+        /// <summary>
+        /// Time of the most recent call in milliseconds.
+        /// </summary>
+        public readonly double LastMilliseconds;
+
+        /// <summary>
+        /// Time of the slowest call in milliseconds.
+        /// </summary>
+        public readonly double MaxMilliseconds;
+
+        public TimingStats(long count, double totalMilliseconds, double lastMilliseconds, double maxMilliseconds)
+        {
+            Count = count;
+            TotalMilliseconds = totalMilliseconds;
+            LastMilliseconds = lastMilliseconds;
+            MaxMilliseconds = maxMilliseconds;
+        }
+
+        /// <summary>
+        /// Average time per call in milliseconds.
+        /// </summary>
+        public double AverageMilliseconds => Count > 0 ? TotalMilliseconds / Count : 0;
+    }
+
+    /// <summary>
+    /// Lifecycle timings of a module.
+    /// </summary>
+    public readonly struct ModuleStats
+    {
+        public readonly Type ModuleType;
+        public readonly string ModuleName;
+        public readonly TimingStats Initialize;
+        public readonly TimingStats Update;
+        public readonly TimingStats Shutdown;
+
+        public ModuleStats(Type moduleType, string moduleName, TimingStats initialize, TimingStats update, TimingStats shutdown)
+        {
+            ModuleType = moduleType;
+            ModuleName = moduleName;
+            Initialize = initialize;
+            Update = update;
+            Shutdown = shutdown;
+        }
+    }
+
+    /// <summary>
+    /// Publish statistics of an event type.
+    /// </summary>
+    public readonly struct EventStats
+    {
+        public readonly Type EventType;
+
+        /// <summary>
+        /// Number of handlers called by the most recent publish.
+        /// </summary>
+        public readonly int HandlerCount;
+
+        public readonly TimingStats Publish;
+
+        public EventStats(Type eventType, int handlerCount, TimingStats publish)
+        {
+            EventType = eventType;
+            HandlerCount = handlerCount;
+            Publish = publish;
+        }
+    }
+
+    /// <summary>
+    /// Resolve statistics of a service type.
+    /// </summary>
+    public readonly struct ServiceStats
+    {
+        public readonly Type ServiceType;
+
+        /// <summary>
+        /// Number of Get calls for the service, including cached ones.
+        /// Only counted while FrameworkStats.IsResolveCountingEnabled is set.
+        /// </summary>
+        public readonly long ResolveCount;
+
+        /// <summary>
+        /// Resolves that missed the cache and went to the registry, including lazy creation.
+        /// </summary>
+        public readonly TimingStats RegistryResolve;
+
+        public ServiceStats(Type serviceType, long resolveCount, TimingStats registryResolve)
+        {
+            ServiceType = serviceType;
+            ResolveCount = resolveCount;
+            RegistryResolve = registryResolve;
+        }
+    }
+
+    /// <summary>
+    /// Load statistics of a data domain.
+    /// </summary>
+    public readonly struct DomainStats
+    {
+        public readonly Type DomainType;
+        public readonly TimingStats Load;
+
+        public DomainStats(Type domainType, TimingStats load)
+        {
+            DomainType = domainType;
+            Load = load;
+        }
+    }
+
+    /// <summary>
+    /// Runtime statistics for framework systems.
+    /// </summary>
+    /// <remarks>
+    /// Module lifecycle calls, event publishes, service registry resolves and domain loads are wrapped in
+    /// ProfilerMarkers, so they appear in the Unity Profiler, and their timings are accumulated here
+    /// so they can be queried in any build. Per-frame totals are also reported as Profiler counters.
+    /// Module statistics are kept per module type.
+    /// Cached ServiceLocator.Get calls are a single field read, so counting them would double their cost;
+    /// they are only counted while IsResolveCountingEnabled is set.
+    /// Query methods that take a list fill it without allocating once the list has grown.
+    /// Define HARO_DISABLE_FRAMEWORK_STATS to compile all measurement out; queries then return empty results.
+    /// Records that worker threads update, module Initialize, domain loads and service resolves, are
+    /// accumulated with interlocked operations. Event publish and module update and shutdown records
+    /// are main-thread only and use plain updates, so the per-frame paths stay cheap.
+    /// </remarks>
+    public static class FrameworkStats
+    {
+        #region Nested Types
+
+        /// <summary>
+        /// Accumulator and ProfilerMarker for one measured operation.
+        /// </summary>
+        internal sealed class Record
+        {
+            public readonly ProfilerMarker Marker;
+
+            /// <summary>
+            /// Whether several threads may update this record at once.
+            /// </summary>
+            public readonly bool IsConcurrent;
+            public long Count;
+            public long TotalTicks;
+            public long LastTicks;
+            public long MaxTicks;
+            public long Value;
+
+            public Record(string markerName, bool isConcurrent = false)
+            {
+                Marker = new ProfilerMarker(ProfilerCategory.Scripts, markerName);
+                IsConcurrent = isConcurrent;
+            }
+
+            public void Add(long ticks)
+            {
+                if (IsConcurrent)
+                {
+                    AddConcurrent(ticks);
+                    return;
+                }
+
+                Count++;
+                TotalTicks += ticks;
+                LastTicks = ticks;
+
+                if (ticks > MaxTicks)
+                {
+                    MaxTicks = ticks;
+                }
+            }
+
+            public void Increment()
+            {
+                if (IsConcurrent)
+                {
+                    Interlocked.Increment(ref Value);
+                }
+                else
+                {
+                    Value++;
+                }
+            }
+
+            public void Reset()
+            {
+                Interlocked.Exchange(ref Count, 0);
+                Interlocked.Exchange(ref TotalTicks, 0);
+                Interlocked.Exchange(ref LastTicks, 0);
+                Interlocked.Exchange(ref MaxTicks, 0);
+                Interlocked.Exchange(ref Value, 0);
+            }
+
+            public TimingStats ToTimingStats()
+            {
+                return new TimingStats(
+                    Interlocked.Read(ref Count),
+                    Interlocked.Read(ref TotalTicks) * TicksToMilliseconds,
+                    Interlocked.Read(ref LastTicks) * TicksToMilliseconds,
+                    Interlocked.Read(ref MaxTicks) * TicksToMilliseconds);
+            }
+
+            private void AddConcurrent(long ticks)
+            {
+                Interlocked.Increment(ref Count);
+                Interlocked.Add(ref TotalTicks, ticks);
+                Interlocked.Exchange(ref LastTicks, ticks);
+
+                long max = Interlocked.Read(ref MaxTicks);
+
+                while (ticks > max)
+                {
+                    long seen = Interlocked.CompareExchange(ref MaxTicks, ticks, max);
+
+                    if (seen == max) break;
+
+                    max = seen;
+                }
+            }
+        }
+
+        internal sealed class ModuleRecord
+        {
+            public readonly Type ModuleType;
+            public readonly string ModuleName;
+            public readonly Record Initialize;
+            public readonly Record Update;
+            public readonly Record Shutdown;
+
+            public ModuleRecord(Type moduleType, string moduleName)
+            {
+                ModuleType = moduleType;
+                ModuleName = moduleName;
+                // Initialize may run on a worker thread alongside other modules
+                Initialize = new Record($"{moduleName}.Initialize", true);
+                Update = new Record($"{moduleName}.OnUpdate");
+                Shutdown = new Record($"{moduleName}.Shutdown");
+            }
+        }
+
+        /// <summary>
+        /// Measures one call from creation until Dispose. The default value measures nothing.
+        /// </summary>
+        internal readonly struct Sample : IDisposable
+        {
+            private readonly Record _record;
+            private readonly long _start;
+
+            public Sample(Record record)
+            {
+                _record = record;
+                record.Marker.Begin();
+                _start = Stopwatch.GetTimestamp();
+            }
+
+            public void Dispose()
+            {
+                if (_record == null) return;
+
+                long ticks = Stopwatch.GetTimestamp() - _start;
+                _record.Marker.End();
+                _record.Add(ticks);
+            }
+        }
+
+        private static class EventRecord<T>
+        {
+            public static readonly Record Value = CreateTypeRecord(EventRecords, "EventBus.Publish", typeof(T), false);
+        }
+
+        private static class ServiceRecord<T>
+        {
+            public static readonly Record Value = CreateTypeRecord(ServiceRecords, "ServiceLocator.Resolve", typeof(T), true);
+        }
+
+        #endregion
+
+        #region Fields
+
+        private static readonly double TicksToMilliseconds = 1000.0 / Stopwatch.Frequency;
+
+        private static readonly Dictionary<Type, Record> EventRecords = new Dictionary<Type, Record>();
+        private static readonly Dictionary<Type, Record> ServiceRecords = new Dictionary<Type, Record>();
+        private static readonly Dictionary<Type, Record> DomainRecords = new Dictionary<Type, Record>();
+        private static readonly Dictionary<Type, ModuleRecord> ModuleRecords = new Dictionary<Type, ModuleRecord>();
+
+        private static readonly ProfilerCounterValue<int> PublishedEventsCounter = new ProfilerCounterValue<int>(
+            ProfilerCategory.Scripts, "Framework Events Published", ProfilerMarkerDataUnit.Count,
+            ProfilerCounterOptions.FlushOnEndOfFrame | ProfilerCounterOptions.ResetToZeroOnFlush);
+
+        private static readonly ProfilerCounterValue<int> ResolvedServicesCounter = new ProfilerCounterValue<int>(
+            ProfilerCategory.Scripts, "Framework Services Resolved", ProfilerMarkerDataUnit.Count,
+            ProfilerCounterOptions.FlushOnEndOfFrame | ProfilerCounterOptions.ResetToZeroOnFlush);
+
+        private static bool _isEnabled = true;
+        private static bool _isResolveCountingEnabled = false;
+
+        #endregion
+
+        #region Properties
+
+        /// <summary>
+        /// Gets whether measurement is compiled into this build.
+        /// </summary>
+        public static bool IsCompiled
+        {
+            get
+            {
+#if HARO_DISABLE_FRAMEWORK_STATS
+                return false;
+#else
+                return true;
+#endif
+            }
+        }
+
+        /// <summary>
+        /// Gets or sets whether measurement is active.
+        /// </summary>
+        /// <remarks>
+        /// Turning it off skips timing and counting but keeps the accumulated values.
+        /// </remarks>
+        public static bool IsEnabled
+        {
+            get => _isEnabled;
+            set => _isEnabled = value;
+        }
+
+        /// <summary>
+        /// Gets or sets whether every ServiceLocator.Get call is counted, including cached ones.
+        /// </summary>
+        /// <remarks>
+        /// Off by default. Registry resolves are timed either way; turn this on to find hot Get call sites.
+        /// Always false when measurement is compiled out.
+        /// </remarks>
+        public static bool IsResolveCountingEnabled
+        {
+#if HARO_DISABLE_FRAMEWORK_STATS
+            get => false;
+#else
+            get => _isResolveCountingEnabled;
+#endif
+            set => _isResolveCountingEnabled = value;
+        }
+
+        #endregion
+
+        #region Public Methods
+
+        /// <summary>
+        /// Gets the statistics of a module type.
+        /// </summary>
+        /// <param name="moduleType">The concrete type of the module.</param>
+        /// <param name="stats">The statistics, or default if the module was never measured.</param>
+        /// <returns>True if the module was measured, false otherwise.</returns>
+        public static bool TryGetModuleStats(Type moduleType, out ModuleStats stats)
+        {
+            lock (ModuleRecords)
+            {
+                if (moduleType != null && ModuleRecords.TryGetValue(moduleType, out ModuleRecord record))
+                {
+                    stats = ToModuleStats(record);
+                    return true;
+                }
+            }
+
+            stats = default;
+            return false;
+        }
+
+        /// <summary>
+        /// Gets the statistics of the first measured module with the given name.
+        /// </summary>
+        /// <param name="moduleName">The ModuleName of the module.</param>
+        /// <param name="stats">The statistics, or default if no module with that name was measured.</param>
+        /// <returns>True if a module was found, false otherwise.</returns>
+        /// <remarks>
+        /// Module names are not required to be unique; use the Type overload to tell such modules apart.
+        /// </remarks>
+        public static bool TryGetModuleStats(string moduleName, out ModuleStats stats)
+        {
+            lock (ModuleRecords)
+            {
+                foreach (ModuleRecord record in ModuleRecords.Values)
+                {
+                    if (record.ModuleName == moduleName)
+                    {
+                        stats = ToModuleStats(record);
+                        return true;
+                    }
+                }
+            }
+
+            stats = default;
+            return false;
+        }
+
+        /// <summary>
+        /// Fills a list with the statistics of every measured module.
+        /// </summary>
+        /// <param name="results">The list to fill. It is cleared first.</param>
+        public static void GetModuleStats(List<ModuleStats> results)
+        {
+            results.Clear();
+
+            lock (ModuleRecords)
+            {
+                foreach (ModuleRecord record in ModuleRecords.Values)
+                {
+                    results.Add(ToModuleStats(record));
+                }
+            }
+        }
+
+        /// <summary>
+        /// Gets the publish statistics of an event type.
+        /// </summary>
+        /// <typeparam name="T">The event type.</typeparam>
+        public static EventStats GetEventStats<T>() where T : IGameEvent
+        {
+            return ToEventStats(typeof(T), FindRecord(EventRecords, typeof(T)));
+        }
+
+        /// <summary>
+        /// Fills a list with the statistics of every published event type.
+        /// </summary>
+        /// <param name="results">The list to fill. It is cleared first.</param>
+        public static void GetEventStats(List<EventStats> results)
+        {
+            results.Clear();
+
+            lock (EventRecords)
+            {
+                foreach (KeyValuePair<Type, Record> kvp in EventRecords)
+                {
+                    results.Add(ToEventStats(kvp.Key, kvp.Value));
+                }
+            }
+        }
+
+        /// <summary>
+        /// Gets the resolve statistics of a service type.
+        /// </summary>
+        /// <typeparam name="T">The service type.</typeparam>
+        public static ServiceStats GetServiceStats<T>() where T : IService
+        {
+            return ToServiceStats(typeof(T), FindRecord(ServiceRecords, typeof(T)));
+        }
+
+        /// <summary>
+        /// Fills a list with the statistics of every resolved service type.
+        /// </summary>
+        /// <param name="results">The list to fill. It is cleared first.</param>
+        public static void GetServiceStats(List<ServiceStats> results)
+        {
+            results.Clear();
+
+            lock (ServiceRecords)
+            {
+                foreach (KeyValuePair<Type, Record> kvp in ServiceRecords)
+                {
+                    results.Add(ToServiceStats(kvp.Key, kvp.Value));
+                }
+            }
+        }
+
+        /// <summary>
+        /// Gets the load statistics of a domain type.
+        /// </summary>
+        /// <typeparam name="T">The domain type.</typeparam>
+        public static DomainStats GetDomainStats<T>() where T : IDomain
+        {
+            Record record = FindRecord(DomainRecords, typeof(T));
+            return new DomainStats(typeof(T), record != null ? record.ToTimingStats() : default);
+        }
+
+        /// <summary>
+        /// Fills a list with the statistics of every loaded domain type.
+        /// </summary>
+        /// <param name="results">The list to fill. It is cleared first.</param>
+        public static void GetDomainStats(List<DomainStats> results)
+        {
+            results.Clear();
+
+            lock (DomainRecords)
+            {
+                foreach (KeyValuePair<Type, Record> kvp in DomainRecords)
+                {
+                    results.Add(new DomainStats(kvp.Key, kvp.Value.ToTimingStats()));
+                }
+            }
+        }
+
+        /// <summary>
+        /// Resets all accumulated statistics to zero.
+        /// </summary>
+        public static void Reset()
+        {
+            ResetRecords(EventRecords);
+            ResetRecords(ServiceRecords);
+            ResetRecords(DomainRecords);
+
+            lock (ModuleRecords)
+            {
+                foreach (ModuleRecord record in ModuleRecords.Values)
+                {
+                    record.Initialize.Reset();
+                    record.Update.Reset();
+                    record.Shutdown.Reset();
+                }
+            }
+        }
+
+        #endregion
+
+        #region Internal Methods
+
+        /// <summary>
+        /// Starts measuring a call against a record. Returns a no-op sample if the record is null or measurement is off.
+        /// </summary>
+        internal static Sample Begin(Record record)
+        {
+#if HARO_DISABLE_FRAMEWORK_STATS
+            return default;
+#else
+            return record != null && _isEnabled ? new Sample(record) : default;
+#endif
+        }
+
+        /// <summary>
+        /// Gets the records of a module's type, or null if measurement is compiled out.
+        /// </summary>
+        internal static ModuleRecord GetModuleRecord(IModule module)
+        {
+#if HARO_DISABLE_FRAMEWORK_STATS
+            return null;
+#else
+            Type moduleType = module.GetType();
+
+            lock (ModuleRecords)
+            {
+                if (!ModuleRecords.TryGetValue(moduleType, out ModuleRecord record))
+                {
+                    record = new ModuleRecord(moduleType, module.ModuleName ?? moduleType.Name);
+                    ModuleRecords[moduleType] = record;
+                }
+
+                return record;
+            }
+#endif
+        }
+
+        internal static Sample BeginPublish<T>(int handlerCount)
+        {
+#if HARO_DISABLE_FRAMEWORK_STATS
+            return default;
+#else
+            if (!_isEnabled) return default;
+
+            Record record = EventRecord<T>.Value;
+            record.Value = handlerCount;
+            PublishedEventsCounter.Value += 1;
+            return new Sample(record);
+#endif
+        }
+
+        internal static void CountResolve<T>()
+        {
+#if !HARO_DISABLE_FRAMEWORK_STATS
+            if (!_isEnabled || !_isResolveCountingEnabled) return;
+
+            ServiceRecord<T>.Value.Increment();
+            ResolvedServicesCounter.Value += 1;
+#endif
+        }
+
+        internal static Sample BeginRegistryResolve<T>()
+        {
+#if HARO_DISABLE_FRAMEWORK_STATS
+            return default;
+#else
+            return _isEnabled ? new Sample(ServiceRecord<T>.Value) : default;
+#endif
+        }
+
+        internal static Sample BeginDomainLoad(Type domainType)
+        {
+#if HARO_DISABLE_FRAMEWORK_STATS
+            return default;
+#else
+            if (!_isEnabled) return default;
+
+            Record record;
+
+            lock (DomainRecords)
+            {
+                if (!DomainRecords.TryGetValue(domainType, out record))
+                {
+                    record = new Record($"DataManager.Load<{domainType.Name}>", true);
+                    DomainRecords[domainType] = record;
+                }
+            }
+
+            return new Sample(record);
+#endif
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private static Record CreateTypeRecord(Dictionary<Type, Record> records, string prefix, Type type, bool isConcurrent)
+        {
+            var record = new Record($"{prefix}<{type.Name}>", isConcurrent);
+
+            lock (records)
+            {
+                records[type] = record;
+            }
+
+            return record;
+        }
+
+        private static Record FindRecord(Dictionary<Type, Record> records, Type type)
+        {
+            lock (records)
+            {
+                return records.TryGetValue(type, out Record record) ? record : null;
+            }
+        }
+
+        private static void ResetRecords(Dictionary<Type, Record> records)
+        {
+            lock (records)
+            {
+                foreach (Record record in records.Values)
+                {
+                    record.Reset();
+                }
+            }
+        }
+
+        private static ModuleStats ToModuleStats(ModuleRecord record)
+        {
+            return new ModuleStats(record.ModuleType, record.ModuleName, record.Initialize.ToTimingStats(), record.Update.ToTimingStats(), record.Shutdown.ToTimingStats());
+        }
+
+        private static EventStats ToEventStats(Type eventType, Record record)
+        {
+            return record != null
+                ? new EventStats(eventType, (int)record.Value, record.ToTimingStats())
+                : new EventStats(eventType, 0, default);
+        }
+
+        private static ServiceStats ToServiceStats(Type serviceType, Record record)
+        {
+            return record != null
+                ? new ServiceStats(serviceType, Interlocked.Read(ref record.Value), record.ToTimingStats())
+                : new ServiceStats(serviceType, 0, default);
+        }
+
+        #endregion
+    }
+}
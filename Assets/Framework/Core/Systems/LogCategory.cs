@@ -0,0 +1,244 @@
+using System;
+using UnityEngine;
+using Object = UnityEngine.Object;
+
+namespace HaroFramework.Core
+{
+    /// <summary>
+    /// Minimum log level for a category, as configured in FrameworkConfig.
+    /// </summary>
+    [Serializable]
+    public struct LogCategoryLevel
+    {
+        [Tooltip("Category name, for example ServiceLocator or DataManager")]
+        public string Category;
+
+        [Tooltip("Minimum level logged for the category")]
+        public LogLevel Level;
+    }
+
+    /// <summary>
+    /// Named log source with its own minimum level.
+    /// </summary>
+    /// <remarks>
+    /// Get one from FrameworkLogger.GetCategory and keep it in a static field.
+    /// The generic overloads take a composite format string and its arguments separately;
+    /// the message is only formatted once the level check passes, so filtered-out calls
+    /// neither format nor box. Calls that are logged box value-type arguments once, inside string.Format.
+    /// Info and Warning are compiled out of Release builds, together with their arguments.
+    /// </remarks>
+    public sealed class LogCategory
+    {
+        #region Fields
+
+        private readonly string _name;
+        private LogLevel _minimumLevel = LogLevel.Info;
+        private bool _hasMinimumLevel = false;
+
+        #endregion
+
+        #region Constructor
+
+        internal LogCategory(string name)
+        {
+            _name = name;
+        }
+
+        #endregion
+
+        #region Properties
+
+        /// <summary>
+        /// Gets the category name.
+        /// </summary>
+        public string Name => _name;
+
+        /// <summary>
+        /// Gets or sets the minimum level logged for this category.
+        /// </summary>
+        /// <remarks>
+        /// Until set, the category follows FrameworkLogger.MinimumLevel.
+        /// </remarks>
+        public LogLevel MinimumLevel
+        {
+            get => _hasMinimumLevel ? _minimumLevel : FrameworkLogger.MinimumLevel;
+            set
+            {
+                _minimumLevel = value;
+                _hasMinimumLevel = true;
+            }
+        }
+
+        #endregion
+
+        #region Public Methods
+
+        /// <summary>
+        /// Checks whether a message of the given level would be logged.
+        /// </summary>
+        /// <param name="level">The level to check.</param>
+        /// <returns>True if the message would be logged, false otherwise.</returns>
+        /// <remarks>
+        /// Use to guard work that builds log arguments, such as joining a list.
+        /// </remarks>
+        public bool IsEnabled(LogLevel level)
+        {
+            return FrameworkLogger.IsEnabled && level != LogLevel.None && level >= MinimumLevel;
+        }
+
+        /// <summary>
+        /// Logs an informational message.
+        /// </summary>
+        /// <param name="message">The message to log.</param>
+        /// <param name="context">Optional Unity object for context.</param>
+        [System.Diagnostics.Conditional("UNITY_EDITOR")]
+        [System.Diagnostics.Conditional("DEVELOPMENT_BUILD")]
+        public void Info(string message, Object context = null)
+        {
+            Write(LogLevel.Info, message, context);
+        }
+
+        /// <summary>
+        /// Logs an informational message formatted from one argument.
+        /// </summary>
+        [System.Diagnostics.Conditional("UNITY_EDITOR")]
+        [System.Diagnostics.Conditional("DEVELOPMENT_BUILD")]
+        public void Info<T0>(string format, T0 arg0)
+        {
+            if (!IsEnabled(LogLevel.Info)) return;
+
+            FrameworkLogger.Enqueue(LogLevel.Info, _name, string.Format(format, arg0), null);
+        }
+
+        /// <summary>
+        /// Logs an informational message formatted from two arguments.
+        /// </summary>
+        [System.Diagnostics.Conditional("UNITY_EDITOR")]
+        [System.Diagnostics.Conditional("DEVELOPMENT_BUILD")]
+        public void Info<T0, T1>(string format, T0 arg0, T1 arg1)
+        {
+            if (!IsEnabled(LogLevel.Info)) return;
+
+            FrameworkLogger.Enqueue(LogLevel.Info, _name, string.Format(format, arg0, arg1), null);
+        }
+
+        /// <summary>
+        /// Logs an informational message formatted from three arguments.
+        /// </summary>
+        [System.Diagnostics.Conditional("UNITY_EDITOR")]
+        [System.Diagnostics.Conditional("DEVELOPMENT_BUILD")]
+        public void Info<T0, T1, T2>(string format, T0 arg0, T1 arg1, T2 arg2)
+        {
+            if (!IsEnabled(LogLevel.Info)) return;
+
+            FrameworkLogger.Enqueue(LogLevel.Info, _name, string.Format(format, arg0, arg1, arg2), null);
+        }
+
+        /// <summary>
+        /// Logs a warning message.
+        /// </summary>
+        /// <param name="message">The message to log.</param>
+        /// <param name="context">Optional Unity object for context.</param>
+        [System.Diagnostics.Conditional("UNITY_EDITOR")]
+        [System.Diagnostics.Conditional("DEVELOPMENT_BUILD")]
+        public void Warning(string message, Object context = null)
+        {
+            Write(LogLevel.Warning, message, context);
+        }
+
+        /// <summary>
+        /// Logs a warning message formatted from one argument.
+        /// </summary>
+        [System.Diagnostics.Conditional("UNITY_EDITOR")]
+        [System.Diagnostics.Conditional("DEVELOPMENT_BUILD")]
+        public void Warning<T0>(string format, T0 arg0)
+        {
+            if (!IsEnabled(LogLevel.Warning)) return;
+
+            FrameworkLogger.Enqueue(LogLevel.Warning, _name, string.Format(format, arg0), null);
+        }
+
+        /// <summary>
+        /// Logs a warning message formatted from two arguments.
+        /// </summary>
+        [System.Diagnostics.Conditional("UNITY_EDITOR")]
+        [System.Diagnostics.Conditional("DEVELOPMENT_BUILD")]
+        public void Warning<T0, T1>(string format, T0 arg0, T1 arg1)
+        {
+            if (!IsEnabled(LogLevel.Warning)) return;
+
+            FrameworkLogger.Enqueue(LogLevel.Warning, _name, string.Format(format, arg0, arg1), null);
+        }
+
+        /// <summary>
+        /// Logs a warning message formatted from three arguments.
+        /// </summary>
+        [System.Diagnostics.Conditional("UNITY_EDITOR")]
+        [System.Diagnostics.Conditional("DEVELOPMENT_BUILD")]
+        public void Warning<T0, T1, T2>(string format, T0 arg0, T1 arg1, T2 arg2)
+        {
+            if (!IsEnabled(LogLevel.Warning)) return;
+
+            FrameworkLogger.Enqueue(LogLevel.Warning, _name, string.Format(format, arg0, arg1, arg2), null);
+        }
+
+        /// <summary>
+        /// Logs an error message.
+        /// </summary>
+        /// <param name="message">The message to log.</param>
+        /// <param name="context">Optional Unity object for context.</param>
+        public void Error(string message, Object context = null)
+        {
+            Write(LogLevel.Error, message, context);
+        }
+
+        /// <summary>
+        /// Logs an error message formatted from one argument.
+        /// </summary>
+        public void Error<T0>(string format, T0 arg0)
+        {
+            if (!IsEnabled(LogLevel.Error)) return;
+
+            FrameworkLogger.Enqueue(LogLevel.Error, _name, string.Format(format, arg0), null);
+        }
+
+        /// <summary>
+        /// Logs an error message formatted from two arguments.
+        /// </summary>
+        public void Error<T0, T1>(string format, T0 arg0, T1 arg1)
+        {
+            if (!IsEnabled(LogLevel.Error)) return;
+
+            FrameworkLogger.Enqueue(LogLevel.Error, _name, string.Format(format, arg0, arg1), null);
+        }
+
+        /// <summary>
+        /// Logs an error message formatted from three arguments.
+        /// </summary>
+        public void Error<T0, T1, T2>(string format, T0 arg0, T1 arg1, T2 arg2)
+        {
+            if (!IsEnabled(LogLevel.Error)) return;
+
+            FrameworkLogger.Enqueue(LogLevel.Error, _name, string.Format(format, arg0, arg1, arg2), null);
+        }
+
+        #endregion
+
+        #region Internal Methods
+
+        internal void Write(LogLevel level, string message, Object context)
+        {
+            if (!IsEnabled(level)) return;
+
+            FrameworkLogger.Enqueue(level, _name, message, context);
+        }
+
+        internal void ResetMinimumLevel()
+        {
+            _hasMinimumLevel = false;
+            _minimumLevel = LogLevel.Info;
+        }
+
+        #endregion
+    }
+}
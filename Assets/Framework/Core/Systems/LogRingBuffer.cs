@@ -0,0 +1,116 @@
+using System.Threading;
+
+namespace HaroFramework.Core
+{
+    /// <summary>
+    /// Bounded lock-free queue of log entries.
+    /// </summary>
+    /// <remarks>
+    /// Any number of threads may enqueue concurrently; dequeuing must be serialized by the caller.
+    /// Each slot carries a sequence number that tells producers and the consumer whether the slot
+    /// is free or filled for the current lap, so neither side takes a lock.
+    /// When the buffer is full, TryEnqueue fails instead of overwriting unread entries.
+    /// </remarks>
+    internal sealed class LogRingBuffer
+    {
+        #region Nested Types
+
+        private struct Slot
+        {
+            public long Sequence;
+            public LogEntry Entry;
+        }
+
+        #endregion
+
+        #region Fields
+
+        private readonly Slot[] _slots;
+        private readonly int _mask;
+        private long _enqueuePosition = 0;
+        private long _dequeuePosition = 0;
+
+        #endregion
+
+        #region Constructor
+
+        /// <summary>
+        /// Creates a buffer whose capacity is rounded up to a power of two.
+        /// </summary>
+        public LogRingBuffer(int capacity)
+        {
+            int size = 2;
+
+            while (size < capacity)
+            {
+                size <<= 1;
+            }
+
+            _slots = new Slot[size];
+            _mask = size - 1;
+
+            for (int i = 0; i < size; i++)
+            {
+                _slots[i].Sequence = i;
+            }
+        }
+
+        #endregion
+
+        #region Public Methods
+
+        public bool TryEnqueue(in LogEntry entry)
+        {
+            long position = Volatile.Read(ref _enqueuePosition);
+
+            while (true)
+            {
+                ref Slot slot = ref _slots[position & _mask];
+                long difference = Volatile.Read(ref slot.Sequence) - position;
+
+                if (difference == 0)
+                {
+                    long observed = Interlocked.CompareExchange(ref _enqueuePosition, position + 1, position);
+
+                    if (observed == position)
+                    {
+                        slot.Entry = entry;
+                        Volatile.Write(ref slot.Sequence, position + 1);
+                        return true;
+                    }
+
+                    position = observed;
+                }
+                else if (difference < 0)
+                {
+                    // The consumer has not freed this slot yet: the buffer is full
+                    return false;
+                }
+                else
+                {
+                    position = Volatile.Read(ref _enqueuePosition);
+                }
+            }
+        }
+
+        public bool TryDequeue(out LogEntry entry)
+        {
+            long position = _dequeuePosition;
+            ref Slot slot = ref _slots[position & _mask];
+
+            if (Volatile.Read(ref slot.Sequence) != position + 1)
+            {
+                entry = default;
+                return false;
+            }
+
+            entry = slot.Entry;
+            slot.Entry = default;
+            Volatile.Write(ref slot.Sequence, position + _slots.Length);
+            _dequeuePosition = position + 1;
+            return true;
+        }
+
+        #endregion
+    }
+}
@@ -0,0 +1,230 @@
+using System;
+using System.IO;
+using System.Text;
+using UnityEngine;
+
+namespace HaroFramework.Core
+{
+    /// <summary>
+    /// Destination for framework log messages.
+    /// </summary>
+    /// <remarks>
+    /// Sinks are called from the logger's flush thread, one message at a time, never concurrently.
+    /// </remarks>
+    public interface ILogSink
+    {
+        /// <summary>
+        /// Writes a single message.
+        /// </summary>
+        /// <param name="entry">The message to write.</param>
+        void Write(in LogEntry entry);
+
+        /// <summary>
+        /// Called after a batch of messages has been written.
+        /// </summary>
+        void Flush();
+    }
+
+    /// <summary>
+    /// Writes log messages to the Unity console.
+    /// </summary>
+    /// <remarks>
+    /// Messages reach the console from the flush thread, so their stack traces point at the logger
+    /// rather than at the caller.
+    /// </remarks>
+    public sealed class UnityConsoleLogSink : ILogSink
+    {
+        #region Public Methods
+
+        /// <summary>
+        /// Writes a message to the console as [Category] message.
+        /// </summary>
+        public void Write(in LogEntry entry)
+        {
+            string message = $"[{entry.Category}] {entry.Message}";
+
+            switch (entry.Level)
+            {
+                case LogLevel.Info:
+                    Debug.Log(message, entry.Context);
+                    break;
+                case LogLevel.Warning:
+                    Debug.LogWarning(message, entry.Context);
+                    break;
+                case LogLevel.Error:
+                    Debug.LogError(message, entry.Context);
+                    break;
+            }
+        }
+
+        /// <summary>
+        /// Does nothing; the console needs no flushing.
+        /// </summary>
+        public void Flush()
+        {
+        }
+
+        #endregion
+    }
+
+    /// <summary>
+    /// Writes log messages to a text file that is rotated when it grows too large.
+    /// </summary>
+    /// <remarks>
+    /// Writes to {fileName}.log in the given directory, with local timestamps. When the file reaches the size limit it is
+    /// renamed to {fileName}.1.log, older files shift up by one, and files beyond the limit are deleted.
+    /// Dispose the sink after removing it from FrameworkLogger to close the file.
+    /// </remarks>
+    public sealed class RotatingFileLogSink : ILogSink, IDisposable
+    {
+        #region Fields
+
+        private readonly string _directory;
+        private readonly string _fileName;
+        private readonly long _maxFileBytes;
+        private readonly int _maxFiles;
+        private static readonly UTF8Encoding Utf8 = new UTF8Encoding(false);
+        private static readonly int NewLineByteCount = Utf8.GetByteCount(Environment.NewLine);
+
+        private readonly StringBuilder _line = new StringBuilder(256);
+        private char[] _chars = new char[256];
+        private StreamWriter _writer;
+        private long _fileLength = 0;
+        private bool _isDisposed = false;
+
+        #endregion
+
+        #region Constructor
+
+        /// <summary>
+        /// Creates a file sink.
+        /// </summary>
+        /// <param name="directory">The directory for log files. Created if missing.</param>
+        /// <param name="fileName">The log file name without extension.</param>
+        /// <param name="maxFileBytes">Size at which the current file is rotated.</param>
+        /// <param name="maxFiles">Number of files to keep, including the current one.</param>
+        public RotatingFileLogSink(string directory, string fileName = "framework", long maxFileBytes = 1024 * 1024, int maxFiles = 5)
+        {
+            _directory = directory;
+            _fileName = fileName;
+            _maxFileBytes = Math.Max(1024, maxFileBytes);
+            _maxFiles = Math.Max(1, maxFiles);
+        }
+
+        #endregion
+
+        #region Properties
+
+        /// <summary>
+        /// Gets the path of the file currently written.
+        /// </summary>
+        public string CurrentPath => GetPath(0);
+
+        #endregion
+
+        #region Public Methods
+
+        /// <summary>
+        /// Appends a message as a timestamped line.
+        /// </summary>
+        public void Write(in LogEntry entry)
+        {
+            if (_isDisposed) return;
+
+            if (_writer == null)
+            {
+                Open();
+            }
+            else if (_fileLength >= _maxFileBytes)
+            {
+                Rotate();
+            }
+
+            _line.Clear();
+            _line.Append(entry.Timestamp.ToLocalTime().ToString("yyyy-MM-dd HH:mm:ss.fff"));
+            _line.Append(' ').Append(entry.Level.ToString().ToUpperInvariant());
+            _line.Append(" [").Append(entry.Category).Append("] ");
+            _line.Append(entry.Message);
+
+            int length = _line.Length;
+
+            if (_chars.Length < length)
+            {
+                _chars = new char[Math.Max(length, _chars.Length * 2)];
+            }
+
+            _line.CopyTo(0, _chars, 0, length);
+            _writer.Write(_chars, 0, length);
+            _writer.WriteLine();
+
+            // Count encoded bytes, not characters, so non-ASCII messages cannot push the file past the limit
+            _fileLength += Utf8.GetByteCount(_chars, 0, length) + NewLineByteCount;
+        }
+
+        /// <summary>
+        /// Flushes buffered lines to disk.
+        /// </summary>
+        public void Flush()
+        {
+            _writer?.Flush();
+        }
+
+        /// <summary>
+        /// Closes the current file.
+        /// </summary>
+        public void Dispose()
+        {
+            if (_isDisposed) return;
+
+            _isDisposed = true;
+            _writer?.Dispose();
+            _writer = null;
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private void Open()
+        {
+            Directory.CreateDirectory(_directory);
+
+            var stream = new FileStream(GetPath(0), FileMode.Append, FileAccess.Write, FileShare.Read);
+            _writer = new StreamWriter(stream, Utf8);
+            _fileLength = stream.Length;
+        }
+
+        private void Rotate()
+        {
+            _writer.Dispose();
+            _writer = null;
+
+            string oldest = GetPath(_maxFiles - 1);
+
+            if (File.Exists(oldest))
+            {
+                File.Delete(oldest);
+            }
+
+            for (int i = _maxFiles - 2; i >= 0; i--)
+            {
+                string source = GetPath(i);
+
+                if (File.Exists(source))
+                {
+                    File.Move(source, GetPath(i + 1));
+                }
+            }
+
+            Open();
+        }
+
+        private string GetPath(int index)
+        {
+            string name = index == 0 ? $"{_fileName}.log" : $"{_fileName}.{index}.log";
+            return Path.Combine(_directory, name);
+        }
+
+        #endregion
+    }
+}
@@ -0,0 +1,423 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Threading;
+using System.Threading.Tasks;
+using UnityEngine;
+
+namespace HaroFramework.Core
+{
+    /// <summary>
+    /// Initializes a set of modules in dependency order.
+    /// </summary>
+    /// <remarks>
+    /// A module starts once every module it depends on (see IBootModule) has initialized; among
+    /// ready modules, lower Priority goes first. Modules that allow it initialize on the thread pool,
+    /// overlapping with each other and with main-thread modules. All bookkeeping, logging of results
+    /// and report entries happen on the thread that runs the bootstrapper.
+    /// A module whose dependency is missing or failed is skipped, and so are its dependents.
+    /// </remarks>
+    internal sealed class ModuleBootstrapper
+    {
+        #region Nested Types
+
+        private sealed class Node
+        {
+            public readonly IModule Module;
+            public readonly int Index;
+            public readonly bool IsOnMainThread;
+            public readonly List<Node> Dependencies = new List<Node>();
+            public readonly List<Node> Dependents = new List<Node>();
+            public int PendingCount;
+            public bool IsBlocked;
+            public double StartMilliseconds;
+            public double ElapsedMilliseconds;
+            public int Frame;
+            public Task Task;
+
+            public Node(IModule module, int index)
+            {
+                Module = module;
+                Index = index;
+                IsOnMainThread = !(module is IBootModule bootModule) || bootModule.InitializeOnMainThread;
+            }
+
+            public string Name => Module.ModuleName ?? Module.GetType().Name;
+        }
+
+        #endregion
+
+        #region Fields
+
+        private static readonly LogCategory Log = FrameworkLogger.Default;
+
+        private readonly List<Node> _nodes;
+        private readonly List<Node> _ready = new List<Node>();
+        private readonly List<Node> _running = new List<Node>();
+        private readonly List<IModule> _initialized = new List<IModule>();
+        private readonly BootReport _report;
+        private int _completedCount = 0;
+
+        #endregion
+
+        #region Constructor
+
+        /// <summary>
+        /// Builds the dependency graph of the given modules.
+        /// </summary>
+        /// <param name="modules">The modules to initialize.</param>
+        /// <param name="report">The report that receives a timing entry per module.</param>
+        /// <exception cref="InvalidOperationException">Thrown if module dependencies form a cycle.</exception>
+        public ModuleBootstrapper(IReadOnlyList<IModule> modules, BootReport report)
+        {
+            _report = report;
+            _nodes = new List<Node>(modules.Count);
+
+            for (int i = 0; i < modules.Count; i++)
+            {
+                _nodes.Add(new Node(modules[i], i));
+            }
+
+            foreach (Node node in _nodes)
+            {
+                if (node.Module is IBootModule bootModule)
+                {
+                    ResolveDependencies(node, bootModule.Dependencies);
+                }
+            }
+
+            ThrowIfCyclic();
+
+            foreach (Node node in _nodes)
+            {
+                if (node.PendingCount == 0)
+                {
+                    Enqueue(node);
+                }
+            }
+        }
+
+        #endregion
+
+        #region Properties
+
+        /// <summary>
+        /// Gets the modules that initialized successfully, in completion order.
+        /// </summary>
+        public IReadOnlyList<IModule> InitializedModules => _initialized;
+
+        #endregion
+
+        #region Public Methods
+
+        /// <summary>
+        /// Initializes every module before returning.
+        /// </summary>
+        /// <remarks>
+        /// Blocks the calling thread while only thread-pool modules are left running.
+        /// </remarks>
+        public void Run()
+        {
+            while (_completedCount < _nodes.Count)
+            {
+                if (TryRunNext()) continue;
+
+                if (_running.Count == 0) break;
+
+                Task.WaitAny(GetRunningTasks());
+            }
+        }
+
+        /// <summary>
+        /// Initializes every module, spreading main-thread work over several frames.
+        /// </summary>
+        /// <param name="frameBudgetMilliseconds">Main-thread time per frame before yielding; 0 or less never yields.</param>
+        /// <param name="cancellationToken">Stops modules that have not started yet.</param>
+        /// <returns>A task that completes once every module has initialized, failed, or been skipped.</returns>
+        /// <remarks>
+        /// Must be awaited from the main thread so main-thread modules resume there.
+        /// On cancellation, modules already running on the thread pool are awaited before the task is cancelled,
+        /// so InitializedModules is complete.
+        /// </remarks>
+        public async Task RunAsync(double frameBudgetMilliseconds, CancellationToken cancellationToken = default)
+        {
+            long budgetTicks = (long)(frameBudgetMilliseconds * Stopwatch.Frequency / 1000.0);
+            long sliceStart = Stopwatch.GetTimestamp();
+
+            try
+            {
+                while (_completedCount < _nodes.Count)
+                {
+                    cancellationToken.ThrowIfCancellationRequested();
+
+                    if (budgetTicks > 0 && Stopwatch.GetTimestamp() - sliceStart >= budgetTicks)
+                    {
+                        // Let the frame finish; the continuation runs on the next one
+                        await Task.Yield();
+                        sliceStart = Stopwatch.GetTimestamp();
+                        continue;
+                    }
+
+                    if (TryRunNext()) continue;
+
+                    if (_running.Count == 0) break;
+
+                    await Task.WhenAny(GetRunningTasks());
+                }
+            }
+            catch (OperationCanceledException)
+            {
+                if (_running.Count > 0)
+                {
+                    await Task.WhenAll(GetRunningTasks()).ContinueWith(_ => { }, TaskScheduler.Default);
+                    CollectFinished();
+                }
+
+                throw;
+            }
+        }
+
+        /// <summary>
+        /// Initializes a single module, timed through FrameworkStats.
+        /// </summary>
+        public static void InitializeModule(IModule module)
+        {
+            using (FrameworkStats.Begin(FrameworkStats.GetModuleRecord(module)?.Initialize))
+            {
+                module.Initialize();
+            }
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private void ResolveDependencies(Node node, IReadOnlyList<Type> dependencies)
+        {
+            if (dependencies == null) return;
+
+            foreach (Type dependency in dependencies)
+            {
+                bool isRegistered = false;
+
+                foreach (Node other in _nodes)
+                {
+                    if (other == node || !dependency.IsInstanceOfType(other.Module)) continue;
+
+                    isRegistered = true;
+
+                    if (node.Dependencies.Contains(other)) continue;
+
+                    node.Dependencies.Add(other);
+                    other.Dependents.Add(node);
+                    node.PendingCount++;
+                }
+
+                if (!isRegistered)
+                {
+                    Log.Error("Failed to initialize module {0}: dependency {1} is not registered.", node.Name, dependency.Name);
+                    node.IsBlocked = true;
+                }
+            }
+        }
+
+        private void ThrowIfCyclic()
+        {
+            var visited = new HashSet<Node>();
+            var visiting = new List<Node>();
+
+            foreach (Node node in _nodes)
+            {
+                Visit(node, visited, visiting);
+            }
+        }
+
+        private static void Visit(Node node, HashSet<Node> visited, List<Node> visiting)
+        {
+            if (visited.Contains(node)) return;
+
+            if (visiting.Contains(node))
+            {
+                visiting.Add(node);
+                string cycle = string.Join(" -> ", visiting.ConvertAll(visitingNode => visitingNode.Name));
+                throw new InvalidOperationException($"[FrameworkManager] Circular module dependency detected: {cycle}");
+            }
+
+            visiting.Add(node);
+
+            foreach (Node dependency in node.Dependencies)
+            {
+                Visit(dependency, visited, visiting);
+            }
+
+            visiting.RemoveAt(visiting.Count - 1);
+            visited.Add(node);
+        }
+
+        /// <summary>
+        /// Starts every ready thread-pool module, then runs the next ready main-thread module.
+        /// </summary>
+        /// <returns>True if a module was run or skipped, false if only thread-pool modules are left running.</returns>
+        private bool TryRunNext()
+        {
+            CollectFinished();
+
+            bool hasCompleted = false;
+
+            for (int i = 0; i < _ready.Count; i++)
+            {
+                Node node = _ready[i];
+
+                if (node.IsBlocked)
+                {
+                    // Skipping may make more modules ready, so rescan from the start
+                    _ready.RemoveAt(i);
+                    node.StartMilliseconds = _report.Now();
+                    node.Frame = _report.FrameOffset(Time.frameCount);
+                    Complete(node, false);
+                    hasCompleted = true;
+                    i = -1;
+                }
+                else if (!node.IsOnMainThread)
+                {
+                    _ready.RemoveAt(i--);
+                    Start(node);
+                }
+            }
+
+            if (_ready.Count == 0) return hasCompleted;
+
+            Node next = _ready[0];
+            _ready.RemoveAt(0);
+            RunOnMainThread(next);
+            return true;
+        }
+
+        private void Start(Node node)
+        {
+            node.StartMilliseconds = _report.Now();
+            node.Frame = _report.FrameOffset(Time.frameCount);
+
+            IModule module = node.Module;
+            node.Task = Task.Run(() =>
+            {
+                long start = Stopwatch.GetTimestamp();
+
+                try
+                {
+                    InitializeModule(module);
+                }
+                finally
+                {
+                    node.ElapsedMilliseconds = (Stopwatch.GetTimestamp() - start) * 1000.0 / Stopwatch.Frequency;
+                }
+            });
+
+            _running.Add(node);
+        }
+
+        private void RunOnMainThread(Node node)
+        {
+            node.StartMilliseconds = _report.Now();
+            node.Frame = _report.FrameOffset(Time.frameCount);
+
+            bool succeeded = true;
+
+            try
+            {
+                InitializeModule(node.Module);
+            }
+            catch (Exception ex)
+            {
+                Log.Error("Failed to initialize module {0}: {1}", node.Name, ex.Message);
+                succeeded = false;
+            }
+
+            node.ElapsedMilliseconds = _report.Now() - node.StartMilliseconds;
+            Complete(node, succeeded);
+        }
+
+        private void CollectFinished()
+        {
+            for (int i = 0; i < _running.Count; i++)
+            {
+                Node node = _running[i];
+
+                if (!node.Task.IsCompleted) continue;
+
+                _running.RemoveAt(i--);
+
+                bool succeeded = !node.Task.IsFaulted;
+
+                if (!succeeded)
+                {
+                    Log.Error("Failed to initialize module {0}: {1}", node.Name, node.Task.Exception.GetBaseException().Message);
+                }
+
+                Complete(node, succeeded);
+            }
+        }
+
+        private void Complete(Node node, bool succeeded)
+        {
+            _completedCount++;
+
+            if (succeeded)
+            {
+                _initialized.Add(node.Module);
+                Log.Info("Initialized module: {0} ({1:F1} ms)", node.Name, node.ElapsedMilliseconds);
+            }
+
+            _report.AddEntry(new BootTiming(node.Name, BootPhase.Modules, node.StartMilliseconds,
+                node.ElapsedMilliseconds, node.Frame, node.IsOnMainThread, succeeded));
+
+            foreach (Node dependent in node.Dependents)
+            {
+                if (!succeeded && !dependent.IsBlocked)
+                {
+                    Log.Error("Skipped module {0}: dependency {1} failed to initialize.", dependent.Name, node.Name);
+                    dependent.IsBlocked = true;
+                }
+
+                if (--dependent.PendingCount == 0)
+                {
+                    Enqueue(dependent);
+                }
+            }
+        }
+
+        private void Enqueue(Node node)
+        {
+            // Keep ready modules sorted by priority, then registration order
+            int index = _ready.Count;
+
+            while (index > 0 && Precedes(node, _ready[index - 1]))
+            {
+                index--;
+            }
+
+            _ready.Insert(index, node);
+        }
+
+        private static bool Precedes(Node node, Node other)
+        {
+            int priority = node.Module.Priority;
+            int otherPriority = other.Module.Priority;
+            return priority < otherPriority || (priority == otherPriority && node.Index < other.Index);
+        }
+
+        private Task[] GetRunningTasks()
+        {
+            var tasks = new Task[_running.Count];
+
+            for (int i = 0; i < tasks.Length; i++)
+            {
+                tasks[i] = _running[i].Task;
+            }
+
+            return tasks;
+        }
+
+        #endregion
+    }
+}
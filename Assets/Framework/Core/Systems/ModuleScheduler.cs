@@ -0,0 +1,336 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Reflection;
+
+namespace HaroFramework.Core
+{
+    /// <summary>
+    /// Decides which modules FrameworkManager ticks and when.
+    /// </summary>
+    /// <remarks>
+    /// Modules are grouped by ModuleTickGroup and kept in priority order in per-group arrays
+    /// that are only rebuilt when modules are added or removed.
+    /// BaseModule subclasses that do not override OnUpdate are left out entirely.
+    /// Time-sliced modules run after the regular ones in their group, round-robin, and stop
+    /// once the budget is spent; the first due time-sliced module always runs so every module makes progress.
+    /// Early, Normal and Late share one budget per frame. FixedUpdate can run several times in a frame,
+    /// so the Fixed group gets its own budget for every fixed step instead of drawing on the frame's.
+    /// A module added during a tick is ticked from the next tick on; a removed module is not ticked again.
+    /// Each OnUpdate call is wrapped in a per-module ProfilerMarker and timed through FrameworkStats.
+    /// </remarks>
+    internal sealed class ModuleScheduler
+    {
+        #region Nested Types
+
+        private sealed class TickEntry
+        {
+            public IModule Module;
+            public FrameworkStats.Record UpdateRecord;
+            public int Interval;
+            public double Period;
+            public long NextTickStep;
+            public double NextTickTime;
+            public bool IsRemoved;
+        }
+
+        private sealed class TickGroup
+        {
+            public readonly List<TickEntry> Entries = new List<TickEntry>();
+            public TickEntry[] Regular = new TickEntry[0];
+            public TickEntry[] Sliced = new TickEntry[0];
+            public bool IsDirty = false;
+            public long Step = 0;
+            public int SliceCursor = 0;
+        }
+
+        private sealed class TimeSliceBudget
+        {
+            public long Key = -1;
+            public long UsedTicks = 0;
+        }
+
+        #endregion
+
+        #region Fields
+
+        private static readonly Dictionary<Type, bool> UpdateOverrideCache = new Dictionary<Type, bool>();
+
+        private readonly TickGroup[] _groups =
+        {
+            new TickGroup(),
+            new TickGroup(),
+            new TickGroup(),
+            new TickGroup()
+        };
+        private readonly TimeSliceBudget _frameBudget = new TimeSliceBudget();
+        private readonly TimeSliceBudget _fixedBudget = new TimeSliceBudget();
+        private double _timeSliceBudgetMilliseconds = 0;
+
+        #endregion
+
+        #region Properties
+
+        /// <summary>
+        /// Gets or sets the budget for time-sliced modules in milliseconds (0 = unlimited).
+        /// </summary>
+        /// <remarks>
+        /// Applies once per frame to Early, Normal and Late together, and once per fixed step to Fixed.
+        /// </remarks>
+        public double TimeSliceBudgetMilliseconds
+        {
+            get => _timeSliceBudgetMilliseconds;
+            set => _timeSliceBudgetMilliseconds = value;
+        }
+
+        /// <summary>
+        /// Gets the number of modules that are ticked, across all groups.
+        /// </summary>
+        public int ModuleCount
+        {
+            get
+            {
+                int count = 0;
+
+                foreach (TickGroup group in _groups)
+                {
+                    count += group.Entries.Count;
+                }
+
+                return count;
+            }
+        }
+
+        #endregion
+
+        #region Public Methods
+
+        /// <summary>
+        /// Adds a module to its tick group. Modules without an OnUpdate override are ignored.
+        /// </summary>
+        public void Add(IModule module)
+        {
+            if (!HasUpdate(module)) return;
+
+            var entry = new TickEntry
+            {
+                Module = module,
+                UpdateRecord = FrameworkStats.GetModuleRecord(module)?.Update,
+                Interval = 1
+            };
+
+            if (module is IScheduledModule scheduled)
+            {
+                entry.Interval = Math.Max(1, scheduled.UpdateInterval);
+                entry.Period = scheduled.UpdateRate > 0f ? 1.0 / scheduled.UpdateRate : 0;
+            }
+
+            TickGroup group = GetGroup(module);
+            List<TickEntry> entries = group.Entries;
+
+            // Insert after every entry with the same or lower priority to keep registration order stable
+            int index = entries.Count;
+
+            while (index > 0 && entries[index - 1].Module.Priority > module.Priority)
+            {
+                index--;
+            }
+
+            entries.Insert(index, entry);
+            group.IsDirty = true;
+        }
+
+        /// <summary>
+        /// Removes a module from its tick group.
+        /// </summary>
+        public void Remove(IModule module)
+        {
+            foreach (TickGroup group in _groups)
+            {
+                int index = group.Entries.FindIndex(entry => entry.Module == module);
+
+                if (index >= 0)
+                {
+                    // The entry may still be in the arrays of a tick in progress
+                    group.Entries[index].IsRemoved = true;
+                    group.Entries.RemoveAt(index);
+                    group.IsDirty = true;
+                    return;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Removes all modules.
+        /// </summary>
+        public void Clear()
+        {
+            foreach (TickGroup group in _groups)
+            {
+                foreach (TickEntry entry in group.Entries)
+                {
+                    entry.IsRemoved = true;
+                }
+
+                group.Entries.Clear();
+                group.IsDirty = true;
+            }
+        }
+
+        /// <summary>
+        /// Ticks every due module in a group.
+        /// </summary>
+        /// <param name="tickGroup">The group to tick.</param>
+        /// <param name="time">Current time in seconds, used for UpdateRate.</param>
+        /// <param name="frame">Current frame number, used to reset the frame's time slice budget.</param>
+        public void Tick(ModuleTickGroup tickGroup, double time, long frame)
+        {
+            TickGroup group = _groups[(int)tickGroup];
+
+            if (group.IsDirty)
+            {
+                Rebuild(group);
+            }
+
+            long step = ++group.Step;
+            TickEntry[] regular = group.Regular;
+
+            for (int i = 0; i < regular.Length; i++)
+            {
+                TickEntry entry = regular[i];
+
+                if (entry.IsRemoved || !IsDue(entry, step, time)) continue;
+
+                MarkTicked(entry, step, time);
+                Update(entry);
+            }
+
+            TickEntry[] sliced = group.Sliced;
+
+            if (sliced.Length == 0) return;
+
+            // Fixed steps are keyed by the group's own step count, so each one starts with a full budget
+            TimeSliceBudget budget = tickGroup == ModuleTickGroup.Fixed ? _fixedBudget : _frameBudget;
+            long budgetKey = tickGroup == ModuleTickGroup.Fixed ? step : frame;
+
+            if (budget.Key != budgetKey)
+            {
+                budget.Key = budgetKey;
+                budget.UsedTicks = 0;
+            }
+
+            long budgetTicks = _timeSliceBudgetMilliseconds > 0
+                ? (long)(_timeSliceBudgetMilliseconds * Stopwatch.Frequency / 1000.0)
+                : long.MaxValue;
+            bool hasRun = false;
+
+            for (int n = 0; n < sliced.Length; n++)
+            {
+                int index = (group.SliceCursor + n) % sliced.Length;
+                TickEntry entry = sliced[index];
+
+                if (entry.IsRemoved || !IsDue(entry, step, time)) continue;
+
+                if (hasRun && budget.UsedTicks >= budgetTicks)
+                {
+                    // Resume from this module next frame
+                    group.SliceCursor = index;
+                    return;
+                }
+
+                long start = Stopwatch.GetTimestamp();
+                MarkTicked(entry, step, time);
+                Update(entry);
+                budget.UsedTicks += Stopwatch.GetTimestamp() - start;
+                hasRun = true;
+            }
+
+            group.SliceCursor = 0;
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private TickGroup GetGroup(IModule module)
+        {
+            ModuleTickGroup tickGroup = module is IScheduledModule scheduled ? scheduled.TickGroup : ModuleTickGroup.Normal;
+            return _groups[(int)tickGroup];
+        }
+
+        private static void Update(TickEntry entry)
+        {
+            using (FrameworkStats.Begin(entry.UpdateRecord))
+            {
+                entry.Module.OnUpdate();
+            }
+        }
+
+        private static bool IsDue(TickEntry entry, long step, double time)
+        {
+            return entry.Period > 0 ? time >= entry.NextTickTime : step >= entry.NextTickStep;
+        }
+
+        private static void MarkTicked(TickEntry entry, long step, double time)
+        {
+            if (entry.Period > 0)
+            {
+                // Skip missed ticks instead of bursting to catch up
+                entry.NextTickTime += entry.Period;
+
+                if (entry.NextTickTime <= time)
+                {
+                    entry.NextTickTime = time + entry.Period;
+                }
+            }
+            else
+            {
+                entry.NextTickStep = step + entry.Interval;
+            }
+        }
+
+        private static void Rebuild(TickGroup group)
+        {
+            var regular = new List<TickEntry>(group.Entries.Count);
+            var sliced = new List<TickEntry>();
+
+            foreach (TickEntry entry in group.Entries)
+            {
+                if (entry.Module is IScheduledModule scheduled && scheduled.IsTimeSliced)
+                {
+                    sliced.Add(entry);
+                }
+                else
+                {
+                    regular.Add(entry);
+                }
+            }
+
+            group.Regular = regular.ToArray();
+            group.Sliced = sliced.ToArray();
+            group.SliceCursor = 0;
+            group.IsDirty = false;
+        }
+
+        private static bool HasUpdate(IModule module)
+        {
+            if (!(module is BaseModule)) return true;
+
+            Type type = module.GetType();
+
+            lock (UpdateOverrideCache)
+            {
+                if (!UpdateOverrideCache.TryGetValue(type, out bool hasUpdate))
+                {
+                    MethodInfo method = type.GetMethod(nameof(IModule.OnUpdate), BindingFlags.Public | BindingFlags.Instance, null, Type.EmptyTypes, null);
+                    hasUpdate = method == null || method.DeclaringType != typeof(BaseModule);
+                    UpdateOverrideCache[type] = hasUpdate;
+                }
+
+                return hasUpdate;
+            }
+        }
+
+        #endregion
+    }
+}
@@ -1,6 +1,6 @@
 using System;
 using System.Collections.Generic;
-using UnityEngine;
+using UnityEngine.SceneManagement;
 
 namespace HaroFramework.Core
 {
@@ -11,12 +11,29 @@ namespace HaroFramework.Core
     /// Provides centralized registration and access to game services.
     /// Services are registered by interface type and retrieved by the same type.
     /// All services must implement IService interface.
+    /// Resolved services are cached in a per-type static slot, so Get is a single field read after first use.
+    /// Registry lookup times per service type are reported through FrameworkStats; cached Get calls are
+    /// only counted while FrameworkStats.IsResolveCountingEnabled is set.
+    /// Use CreateScope or GetSceneScope for child locators that fall back to this one.
     /// </remarks>
     public class ServiceLocator : Singleton<ServiceLocator>
     {
+        #region Nested Types
+
+        private static class ServiceSlot<T> where T : IService
+        {
+            public static T Service;
+        }
+
+        #endregion
+
         #region Fields
 
-        private readonly Dictionary<Type, IService> _services = new Dictionary<Type, IService>();
+        private static readonly LogCategory Log = FrameworkLogger.GetCategory("ServiceLocator");
+
+        private readonly ServiceRegistry _registry = new ServiceRegistry("[ServiceLocator]", Log);
+        private readonly Dictionary<int, ServiceScope> _sceneScopes = new Dictionary<int, ServiceScope>();
+        private bool _isListeningForSceneUnload = false;
 
         #endregion
 
@@ -34,18 +51,27 @@ namespace HaroFramework.Core
         /// </remarks>
         public void Register<T>(T service) where T : IService
         {
-            Type serviceType = typeof(T);
+            ResetSlot<T>();
+            ServiceSlot<T>.Service = _registry.Add(service).Resolve();
 
-            if (_services.ContainsKey(serviceType))
-            {
-                Debug.LogWarning($"[ServiceLocator] Service of type {serviceType.Name} is already registered. Overwriting.");
-                _services[serviceType].Dispose();
-            }
+            Log.Info("Registered service: {0}", typeof(T).Name);
+        }
 
-            _services[serviceType] = service;
-            service.Initialize();
+        /// <summary>
+        /// Registers a service that is created and initialized on first access.
+        /// </summary>
+        /// <typeparam name="T">The interface type of the service.</typeparam>
+        /// <param name="factory">Creates the service instance when it is first resolved.</param>
+        /// <remarks>
+        /// Defers construction and Initialize until the first Get&lt;T&gt;() call, keeping boot time flat.
+        /// Registering a service with the same type twice will overwrite the previous registration.
+        /// </remarks>
+        public void RegisterLazy<T>(Func<T> factory) where T : IService
+        {
+            ResetSlot<T>();
+            _registry.AddLazy(factory);
 
-            Debug.Log($"[ServiceLocator] Registered service: {serviceType.Name}");
+            Log.Info("Registered lazy service: {0}", typeof(T).Name);
         }
 
         /// <summary>
@@ -60,14 +86,15 @@ namespace HaroFramework.Core
         /// </remarks>
         public T Get<T>() where T : IService
         {
-            Type serviceType = typeof(T);
+            T service = ServiceSlot<T>.Service;
 
-            if (_services.ContainsKey(serviceType))
+            // Keep the cached path to a field read; counting is opt-in through FrameworkStats
+            if (service != null && !FrameworkStats.IsResolveCountingEnabled)
             {
-                return (T)_services[serviceType];
+                return service;
             }
 
-            throw new InvalidOperationException($"[ServiceLocator] Service of type {serviceType.Name} is not registered.");
+            return GetUncached<T>();
         }
 
         /// <summary>
@@ -75,9 +102,12 @@ namespace HaroFramework.Core
         /// </summary>
         /// <typeparam name="T">The interface type of the service.</typeparam>
         /// <returns>True if the service is registered, false otherwise.</returns>
+        /// <remarks>
+        /// Does not create lazily registered services.
+        /// </remarks>
         public bool Has<T>() where T : IService
         {
-            return _services.ContainsKey(typeof(T));
+            return ServiceSlot<T>.Service != null || _registry.Contains(typeof(T));
         }
 
         /// <summary>
@@ -86,17 +116,16 @@ namespace HaroFramework.Core
         /// <typeparam name="T">The interface type of the service.</typeparam>
         /// <remarks>
         /// The service's Dispose method is called automatically before removal.
+        /// Lazily registered services that were never resolved are removed without being created.
         /// Safe to call even if the service is not registered.
         /// </remarks>
         public void Unregister<T>() where T : IService
         {
-            Type serviceType = typeof(T);
+            ResetSlot<T>();
 
-            if (_services.ContainsKey(serviceType))
+            if (_registry.Remove(typeof(T), out _))
             {
-                _services[serviceType].Dispose();
-                _services.Remove(serviceType);
-                Debug.Log($"[ServiceLocator] Unregistered service: {serviceType.Name}");
+                Log.Info("Unregistered service: {0}", typeof(T).Name);
             }
         }
 
@@ -104,18 +133,119 @@ namespace HaroFramework.Core
         /// Clears all registered services.
         /// </summary>
         /// <remarks>
-        /// Calls Dispose on all registered services before clearing.
+        /// Disposes scene scopes first, then all registered services in reverse initialization order,
+        /// so services are disposed before the services they depend on.
+        /// Lazy services that were never created cannot be resolved while clearing.
         /// Useful during scene transitions or application shutdown.
         /// </remarks>
         public void Clear()
         {
-            foreach (var service in _services.Values)
+            foreach (ServiceScope scope in _sceneScopes.Values)
             {
-                service.Dispose();
+                scope.Dispose();
             }
 
-            _services.Clear();
-            Debug.Log("[ServiceLocator] Cleared all services.");
+            _sceneScopes.Clear();
+
+            var registrations = new List<ServiceRegistry.Registration>(_registry.Registrations);
+
+            // Slots stay valid while disposing, so a Dispose that resolves a live service still gets it
+            _registry.DisposeAll();
+
+            foreach (ServiceRegistry.Registration registration in registrations)
+            {
+                registration.ResetRootSlot();
+            }
+
+            Log.Info("Cleared all services.");
+        }
+
+        /// <summary>
+        /// Creates a child locator that falls back to this locator.
+        /// </summary>
+        /// <param name="scopeName">Name used in log messages.</param>
+        /// <returns>The new scope. Dispose it to release its services.</returns>
+        public ServiceScope CreateScope(string scopeName)
+        {
+            return new ServiceScope(scopeName, this, null);
+        }
+
+        /// <summary>
+        /// Gets the child locator bound to a scene, creating it if needed.
+        /// </summary>
+        /// <param name="scene">The scene that owns the scope.</param>
+        /// <returns>The scene scope.</returns>
+        /// <remarks>
+        /// The scope and its services are disposed automatically when the scene is unloaded.
+        /// </remarks>
+        public ServiceScope GetSceneScope(Scene scene)
+        {
+            if (_sceneScopes.TryGetValue(scene.handle, out ServiceScope scope))
+            {
+                return scope;
+            }
+
+            if (!_isListeningForSceneUnload)
+            {
+                SceneManager.sceneUnloaded += OnSceneUnloaded;
+                _isListeningForSceneUnload = true;
+            }
+
+            scope = CreateScope(scene.name);
+            _sceneScopes[scene.handle] = scope;
+            return scope;
+        }
+
+        #endregion
+
+        #region Internal Methods
+
+        internal bool TryResolve<T>(out T service) where T : IService
+        {
+            service = ServiceSlot<T>.Service;
+
+            if (service != null) return true;
+
+            using (FrameworkStats.BeginRegistryResolve<T>())
+            {
+                if (!_registry.TryResolve(out service))
+                {
+                    return false;
+                }
+            }
+
+            ServiceSlot<T>.Service = service;
+            return true;
+        }
+
+        internal static void ResetSlot<T>() where T : IService
+        {
+            ServiceSlot<T>.Service = default;
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private T GetUncached<T>() where T : IService
+        {
+            FrameworkStats.CountResolve<T>();
+
+            if (TryResolve(out T service))
+            {
+                return service;
+            }
+
+            throw new InvalidOperationException($"[ServiceLocator] Service of type {typeof(T).Name} is not registered.");
+        }
+
+        private void OnSceneUnloaded(Scene scene)
+        {
+            if (_sceneScopes.TryGetValue(scene.handle, out ServiceScope scope))
+            {
+                _sceneScopes.Remove(scene.handle);
+                scope.Dispose();
+            }
         }
 
         #endregion
@@ -124,6 +254,12 @@ namespace HaroFramework.Core
 
         protected override void OnDestroy()
         {
+            if (_isListeningForSceneUnload)
+            {
+                SceneManager.sceneUnloaded -= OnSceneUnloaded;
+                _isListeningForSceneUnload = false;
+            }
+
             Clear();
             base.OnDestroy();
         }
@@ -0,0 +1,257 @@
+using System;
+using System.Collections.Generic;
+
+namespace HaroFramework.Core
+{
+    /// <summary>
+    /// Service registration storage shared by ServiceLocator and ServiceScope.
+    /// </summary>
+    /// <remarks>
+    /// Supports eager and lazy registrations and records the order in which services are initialized.
+    /// A service that resolves another service during Initialize is initialized after it,
+    /// so disposing in reverse initialization order releases dependents before their dependencies.
+    /// </remarks>
+    internal sealed class ServiceRegistry
+    {
+        #region Nested Types
+
+        internal abstract class Registration
+        {
+            public abstract Type ServiceType { get; }
+
+            public abstract bool IsInitialized { get; }
+
+            public abstract void Dispose();
+
+            public abstract void ResetRootSlot();
+        }
+
+        internal sealed class Registration<T> : Registration where T : IService
+        {
+            private readonly ServiceRegistry _registry;
+            private readonly Func<T> _factory;
+            private T _service;
+            private bool _isInitialized = false;
+            private bool _isResolving = false;
+
+            public Registration(ServiceRegistry registry, T service)
+            {
+                _registry = registry;
+                _service = service;
+            }
+
+            public Registration(ServiceRegistry registry, Func<T> factory)
+            {
+                _registry = registry;
+                _factory = factory;
+            }
+
+            public override Type ServiceType => typeof(T);
+
+            public override bool IsInitialized => _isInitialized;
+
+            public T Resolve()
+            {
+                if (_isInitialized) return _service;
+
+                if (_registry._isDisposing)
+                {
+                    // A service created now would miss DisposeAll and leak
+                    throw new InvalidOperationException($"{_registry._logTag} Cannot create {typeof(T).Name} while services are being disposed.");
+                }
+
+                if (_isResolving)
+                {
+                    throw new InvalidOperationException($"{_registry._logTag} Circular dependency detected while resolving {typeof(T).Name}.");
+                }
+
+                _isResolving = true;
+
+                try
+                {
+                    if (_factory != null)
+                    {
+                        _service = _factory();
+
+                        if (_service == null)
+                        {
+                            throw new InvalidOperationException($"{_registry._logTag} Factory for {typeof(T).Name} returned null.");
+                        }
+                    }
+
+                    _service.Initialize();
+                    _isInitialized = true;
+                    _registry._initializationOrder.Add(this);
+                }
+                finally
+                {
+                    _isResolving = false;
+                }
+
+                return _service;
+            }
+
+            public override void Dispose()
+            {
+                if (!_isInitialized) return;
+
+                _isInitialized = false;
+                _service.Dispose();
+
+                if (_factory != null)
+                {
+                    _service = default;
+                }
+            }
+
+            public override void ResetRootSlot()
+            {
+                ServiceLocator.ResetSlot<T>();
+            }
+        }
+
+        #endregion
+
+        #region Fields
+
+        private readonly Dictionary<Type, Registration> _registrations = new Dictionary<Type, Registration>();
+        private readonly List<Registration> _initializationOrder = new List<Registration>();
+        private readonly string _logTag;
+        private readonly LogCategory _log;
+        private readonly string _logPrefix;
+        private bool _isDisposing = false;
+
+        #endregion
+
+        #region Constructor
+
+        /// <param name="logTag">Prefix for exception messages.</param>
+        /// <param name="log">Category for log messages.</param>
+        /// <param name="scopeName">Scope name prefixed to log messages, or null for the root locator.</param>
+        public ServiceRegistry(string logTag, LogCategory log, string scopeName = null)
+        {
+            _logTag = logTag;
+            _log = log;
+            _logPrefix = scopeName != null ? $"{scopeName}: " : string.Empty;
+        }
+
+        #endregion
+
+        #region Properties
+
+        public int Count => _registrations.Count;
+
+        public IEnumerable<Registration> Registrations => _registrations.Values;
+
+        #endregion
+
+        #region Public Methods
+
+        public Registration<T> Add<T>(T service) where T : IService
+        {
+            if (service == null)
+            {
+                throw new ArgumentNullException(nameof(service));
+            }
+
+            var registration = new Registration<T>(this, service);
+            Replace(typeof(T), registration);
+            return registration;
+        }
+
+        public Registration<T> AddLazy<T>(Func<T> factory) where T : IService
+        {
+            if (factory == null)
+            {
+                throw new ArgumentNullException(nameof(factory));
+            }
+
+            var registration = new Registration<T>(this, factory);
+            Replace(typeof(T), registration);
+            return registration;
+        }
+
+        public bool Contains(Type serviceType)
+        {
+            return _registrations.ContainsKey(serviceType);
+        }
+
+        public bool TryResolve<T>(out T service) where T : IService
+        {
+            if (_registrations.TryGetValue(typeof(T), out Registration registration))
+            {
+                service = ((Registration<T>)registration).Resolve();
+                return true;
+            }
+
+            service = default;
+            return false;
+        }
+
+        public bool Remove(Type serviceType, out Registration registration)
+        {
+            if (!_registrations.TryGetValue(serviceType, out registration))
+            {
+                return false;
+            }
+
+            _registrations.Remove(serviceType);
+            _initializationOrder.Remove(registration);
+            registration.Dispose();
+            return true;
+        }
+
+        /// <summary>
+        /// Disposes every initialized service and removes all registrations.
+        /// </summary>
+        /// <remarks>
+        /// Services that are not created yet cannot be resolved while this runs, so a Dispose method
+        /// that resolves a lazy service gets an exception instead of creating a service nobody disposes.
+        /// </remarks>
+        public void DisposeAll()
+        {
+            _isDisposing = true;
+
+            try
+            {
+                // Dispose in reverse initialization order so dependents go before their dependencies
+                for (int i = _initializationOrder.Count - 1; i >= 0; i--)
+                {
+                    try
+                    {
+                        _initializationOrder[i].Dispose();
+                    }
+                    catch (Exception ex)
+                    {
+                        _log.Error("{0}Failed to dispose service {1}: {2}", _logPrefix, _initializationOrder[i].ServiceType.Name, ex.Message);
+                    }
+                }
+            }
+            finally
+            {
+                _isDisposing = false;
+            }
+
+            _initializationOrder.Clear();
+            _registrations.Clear();
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private void Replace(Type serviceType, Registration registration)
+        {
+            if (_registrations.TryGetValue(serviceType, out Registration existing))
+            {
+                _log.Warning("{0}Service of type {1} is already registered. Overwriting.", _logPrefix, serviceType.Name);
+                _initializationOrder.Remove(existing);
+                existing.Dispose();
+            }
+
+            _registrations[serviceType] = registration;
+        }
+
+        #endregion
+    }
+}
@@ -0,0 +1,176 @@
+using System;
+
+namespace HaroFramework.Core
+{
+    /// <summary>
+    /// Child service locator that falls back to its parent.
+    /// </summary>
+    /// <remarks>
+    /// Created through ServiceLocator.CreateScope, ServiceLocator.GetSceneScope or ServiceScope.CreateScope.
+    /// Services registered in a scope shadow parent services of the same type for lookups through the scope.
+    /// Disposing the scope disposes its own services in reverse initialization order; parent services are untouched.
+    /// </remarks>
+    public sealed class ServiceScope : IDisposable
+    {
+        #region Fields
+
+        private static readonly LogCategory Log = FrameworkLogger.GetCategory("ServiceScope");
+
+        private readonly ServiceRegistry _registry;
+        private readonly ServiceLocator _root;
+        private readonly ServiceScope _parent;
+        private readonly string _scopeName;
+        private bool _isDisposed = false;
+
+        #endregion
+
+        #region Constructor
+
+        internal ServiceScope(string scopeName, ServiceLocator root, ServiceScope parent)
+        {
+            _scopeName = scopeName;
+            _root = root;
+            _parent = parent;
+            _registry = new ServiceRegistry($"[ServiceScope:{scopeName}]", Log, scopeName);
+        }
+
+        #endregion
+
+        #region Properties
+
+        /// <summary>
+        /// Gets the name of this scope.
+        /// </summary>
+        public string ScopeName => _scopeName;
+
+        /// <summary>
+        /// Gets the parent scope, or null if this scope falls back directly to the ServiceLocator.
+        /// </summary>
+        public ServiceScope Parent => _parent;
+
+        /// <summary>
+        /// Gets whether this scope has been disposed.
+        /// </summary>
+        public bool IsDisposed => _isDisposed;
+
+        #endregion
+
+        #region Public Methods
+
+        /// <summary>
+        /// Registers a service with this scope.
+        /// </summary>
+        /// <typeparam name="T">The interface type of the service.</typeparam>
+        /// <param name="service">The service instance to register.</param>
+        /// <remarks>
+        /// The service's Initialize method is called automatically after registration.
+        /// </remarks>
+        public void Register<T>(T service) where T : IService
+        {
+            ThrowIfDisposed();
+            _registry.Add(service).Resolve();
+
+            Log.Info("{0}: Registered service: {1}", _scopeName, typeof(T).Name);
+        }
+
+        /// <summary>
+        /// Registers a service with this scope that is created and initialized on first access.
+        /// </summary>
+        /// <typeparam name="T">The interface type of the service.</typeparam>
+        /// <param name="factory">Creates the service instance when it is first resolved.</param>
+        public void RegisterLazy<T>(Func<T> factory) where T : IService
+        {
+            ThrowIfDisposed();
+            _registry.AddLazy(factory);
+
+            Log.Info("{0}: Registered lazy service: {1}", _scopeName, typeof(T).Name);
+        }
+
+        /// <summary>
+        /// Gets a service from this scope or, if not registered here, from its parents.
+        /// </summary>
+        /// <typeparam name="T">The interface type of the service.</typeparam>
+        /// <returns>The service instance.</returns>
+        /// <exception cref="InvalidOperationException">Thrown if the service is not registered in any scope.</exception>
+        public T Get<T>() where T : IService
+        {
+            if (TryResolve(out T service))
+            {
+                return service;
+            }
+
+            throw new InvalidOperationException($"[ServiceScope:{_scopeName}] Service of type {typeof(T).Name} is not registered.");
+        }
+
+        /// <summary>
+        /// Checks if a service is registered in this scope or its parents.
+        /// </summary>
+        /// <typeparam name="T">The interface type of the service.</typeparam>
+        /// <returns>True if the service is registered, false otherwise.</returns>
+        public bool Has<T>() where T : IService
+        {
+            if (_registry.Contains(typeof(T))) return true;
+
+            return _parent != null ? _parent.Has<T>() : _root.Has<T>();
+        }
+
+        /// <summary>
+        /// Unregisters a service from this scope.
+        /// </summary>
+        /// <typeparam name="T">The interface type of the service.</typeparam>
+        /// <remarks>
+        /// Parent registrations are not affected. Safe to call even if the service is not registered.
+        /// </remarks>
+        public void Unregister<T>() where T : IService
+        {
+            if (_registry.Remove(typeof(T), out _))
+            {
+                Log.Info("{0}: Unregistered service: {1}", _scopeName, typeof(T).Name);
+            }
+        }
+
+        /// <summary>
+        /// Creates a child scope that falls back to this scope.
+        /// </summary>
+        /// <param name="scopeName">Name used in log messages.</param>
+        /// <returns>The new scope.</returns>
+        public ServiceScope CreateScope(string scopeName)
+        {
+            ThrowIfDisposed();
+            return new ServiceScope(scopeName, _root, this);
+        }
+
+        /// <summary>
+        /// Disposes all services registered in this scope.
+        /// </summary>
+        public void Dispose()
+        {
+            if (_isDisposed) return;
+
+            _isDisposed = true;
+            _registry.DisposeAll();
+            Log.Info("{0}: Disposed scope.", _scopeName);
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private bool TryResolve<T>(out T service) where T : IService
+        {
+            if (_registry.TryResolve(out service)) return true;
+
+            return _parent != null ? _parent.TryResolve(out service) : _root.TryResolve(out service);
+        }
+
+        private void ThrowIfDisposed()
+        {
+            if (_isDisposed)
+            {
+                throw new ObjectDisposedException(_scopeName);
+            }
+        }
+
+        #endregion
+    }
+}
@@ -9,12 +9,16 @@ namespace HaroFramework.Core
     /// <remarks>
     /// Provides thread-safe lazy initialization of singleton instances.
     /// Automatically creates a GameObject with DontDestroyOnLoad if instance doesn't exist.
+    /// The instance is cached on first access, after which Instance is a field read and Unity's null check
+    /// with no lock or scene search. FrameworkManager creates the core singletons up front through CreateOn.
     /// Use this for manager classes that need to persist across scenes.
     /// </remarks>
     public class Singleton<T> : MonoBehaviour where T : MonoBehaviour
     {
         #region Fields
 
+        private static readonly LogCategory Log = FrameworkLogger.GetCategory("Singleton");
+
         private static T _instance;
         private static object _lock = new object();
         private static bool _applicationIsQuitting = false;
@@ -31,30 +35,77 @@ namespace HaroFramework.Core
         {
             get
             {
-                if (_applicationIsQuitting)
+                // Unity's null check only reads the cached native pointer for a live instance, and it catches
+                // an instance destroyed by a subclass that skips base.OnDestroy, which CreateInstance replaces
+                T instance = _instance;
+
+                if (instance != null)
                 {
-                    Debug.LogWarning($"[Singleton] Instance of {typeof(T)} already destroyed. Returning null.");
-                    return null;
+                    return instance;
                 }
 
-                lock (_lock)
+                return CreateInstance(null);
+            }
+        }
+
+        /// <summary>
+        /// Gets whether the instance has been created and not destroyed.
+        /// </summary>
+        public static bool HasInstance => _instance != null;
+
+        #endregion
+
+        #region Internal Methods
+
+        /// <summary>
+        /// Creates the instance as a component of the given GameObject, unless one already exists.
+        /// </summary>
+        /// <param name="host">The GameObject to add the component to.</param>
+        /// <returns>The instance.</returns>
+        /// <remarks>
+        /// Lets several singletons share one GameObject instead of each creating its own.
+        /// </remarks>
+        internal static T CreateOn(GameObject host)
+        {
+            return CreateInstance(host);
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private static T CreateInstance(GameObject host)
+        {
+            if (_applicationIsQuitting)
+            {
+                Log.Warning("Instance of {0} already destroyed. Returning null.", typeof(T));
+                return null;
+            }
+
+            lock (_lock)
+            {
+                // Unity's null check, so a destroyed instance that was never cleared is replaced
+                if (_instance != null)
                 {
-                    if (_instance == null)
-                    {
-                        _instance = FindFirstObjectByType<T>();
+                    return _instance;
+                }
 
-                        if (_instance == null)
-                        {
-                            GameObject singletonObject = new GameObject();
-                            _instance = singletonObject.AddComponent<T>();
-                            singletonObject.name = $"{typeof(T).Name} (Singleton)";
+                // Adopt an instance placed in the scene; this search only runs until the instance is cached
+                T instance = FindFirstObjectByType<T>();
 
-                            DontDestroyOnLoad(singletonObject);
-                        }
+                if (instance == null)
+                {
+                    if (host == null)
+                    {
+                        host = new GameObject($"{typeof(T).Name} (Singleton)");
+                        DontDestroyOnLoad(host);
                     }
 
-                    return _instance;
+                    instance = host.AddComponent<T>();
                 }
+
+                _instance = instance;
+                return instance;
             }
         }
 
@@ -77,6 +128,7 @@ namespace HaroFramework.Core
         {
             if (_instance == this)
             {
+                _instance = null;
                 _applicationIsQuitting = true;
             }
         }
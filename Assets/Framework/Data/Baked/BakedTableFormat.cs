@@ -0,0 +1,317 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Reflection;
+
+namespace HaroFramework.Data
+{
+    /// <summary>
+    /// Layout constants and header access for baked table files.
+    /// </summary>
+    /// <remarks>
+    /// All values are little-endian. A file consists of:
+    /// a fixed 64-byte header; an id index of (int32 id, int32 row offset) pairs sorted by id;
+    /// the row data; and a string pool of (count + 1) int32 offsets followed by UTF-8 bytes.
+    /// Row offsets are relative to the start of the row data, string offsets to the start of the string bytes.
+    /// Header layout:
+    /// 0 magic (uint32), 4 format version (uint16), 6 reserved (uint16), 8 schema hash (uint64),
+    /// 16 content hash (uint64), 24 row count (int32), 28 string count (int32),
+    /// 32 id index offset (int64), 40 row data offset (int64), 48 string pool offset (int64), 56 reserved (int64).
+    /// </remarks>
+    internal static class BakedTableFormat
+    {
+        #region Constants
+
+        public const uint Magic = 0x54444248; // "HBDT"
+        public const ushort Version = 1;
+        public const int HeaderSize = 64;
+        public const int IndexEntrySize = 8;
+        public const int NullReference = -1;
+
+        #endregion
+
+        #region Nested Types
+
+        public struct Header
+        {
+            public ulong SchemaHash;
+            public ulong ContentHash;
+            public int RowCount;
+            public int StringCount;
+            public long IndexOffset;
+            public long RowDataOffset;
+            public long StringPoolOffset;
+        }
+
+        #endregion
+
+        #region Public Methods
+
+        public static void WriteHeader(BinaryWriter writer, in Header header)
+        {
+            writer.Write(Magic);
+            writer.Write(Version);
+            writer.Write((ushort)0);
+            writer.Write(header.SchemaHash);
+            writer.Write(header.ContentHash);
+            writer.Write(header.RowCount);
+            writer.Write(header.StringCount);
+            writer.Write(header.IndexOffset);
+            writer.Write(header.RowDataOffset);
+            writer.Write(header.StringPoolOffset);
+            writer.Write(0L);
+        }
+
+        public static Header ReadHeader(BinaryReader reader, string path)
+        {
+            if (reader.BaseStream.Length < HeaderSize || reader.ReadUInt32() != Magic)
+            {
+                throw new InvalidDataException($"{path} is not a baked table file.");
+            }
+
+            ushort version = reader.ReadUInt16();
+
+            if (version != Version)
+            {
+                throw new InvalidDataException($"{path} has format version {version}, expected {Version}. Rebake the table.");
+            }
+
+            reader.ReadUInt16();
+
+            var header = new Header
+            {
+                SchemaHash = reader.ReadUInt64(),
+                ContentHash = reader.ReadUInt64(),
+                RowCount = reader.ReadInt32(),
+                StringCount = reader.ReadInt32(),
+                IndexOffset = reader.ReadInt64(),
+                RowDataOffset = reader.ReadInt64(),
+                StringPoolOffset = reader.ReadInt64()
+            };
+
+            reader.ReadInt64();
+            return header;
+        }
+
+        /// <summary>
+        /// Reads only the header of a baked file, or returns false if it is missing or unreadable.
+        /// </summary>
+        /// <remarks>
+        /// A truncated or corrupt file, a file from another format version and a file that cannot be opened
+        /// all count as unreadable, so callers rebake or keep their current data instead of failing.
+        /// </remarks>
+        public static bool TryReadHeader(string path, out Header header)
+        {
+            header = default;
+
+            if (!File.Exists(path)) return false;
+
+            try
+            {
+                using (var stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.ReadWrite | FileShare.Delete))
+                using (var reader = new BinaryReader(stream))
+                {
+                    header = ReadHeader(reader, path);
+                    return true;
+                }
+            }
+            catch (IOException)
+            {
+                return false;
+            }
+            catch (InvalidDataException)
+            {
+                return false;
+            }
+            catch (UnauthorizedAccessException)
+            {
+                return false;
+            }
+        }
+
+        #endregion
+    }
+
+    /// <summary>
+    /// Describes how a BaseData type is laid out in a baked file.
+    /// </summary>
+    /// <remarks>
+    /// The schema is every public instance field that is not marked NonSerialized, ordered by name,
+    /// with Id first. Supported field types are primitives, enums, strings and one-dimensional arrays of those.
+    /// </remarks>
+    internal sealed class BakedRowSchema
+    {
+        #region Nested Types
+
+        public enum FieldKind : byte
+        {
+            Boolean,
+            Byte,
+            SByte,
+            Int16,
+            UInt16,
+            Char,
+            Int32,
+            UInt32,
+            Int64,
+            UInt64,
+            Single,
+            Double,
+            String
+        }
+
+        public sealed class Field
+        {
+            public FieldInfo Info;
+            public FieldKind Kind;
+            public Type ElementType;
+            public bool IsArray;
+        }
+
+        #endregion
+
+        #region Fields
+
+        private static readonly Dictionary<Type, BakedRowSchema> Cache = new Dictionary<Type, BakedRowSchema>();
+
+        private readonly Field[] _fields;
+        private readonly ulong _hash;
+
+        #endregion
+
+        #region Constructor
+
+        private BakedRowSchema(Type dataType)
+        {
+            var fields = new List<Field>();
+
+            foreach (FieldInfo info in dataType.GetFields(BindingFlags.Public | BindingFlags.Instance))
+            {
+                if (info.IsInitOnly || info.IsNotSerialized) continue;
+
+                Type type = info.FieldType;
+                bool isArray = type.IsArray;
+                Type elementType = isArray ? type.GetElementType() : type;
+
+                if (isArray && type.GetArrayRank() != 1)
+                {
+                    throw new NotSupportedException($"{dataType.Name}.{info.Name}: multi-dimensional arrays are not supported.");
+                }
+
+                fields.Add(new Field
+                {
+                    Info = info,
+                    Kind = GetKind(dataType, info, elementType),
+                    ElementType = elementType,
+                    IsArray = isArray
+                });
+            }
+
+            fields.Sort((a, b) =>
+            {
+                if (a.Info.Name == nameof(BaseData.Id)) return -1;
+                if (b.Info.Name == nameof(BaseData.Id)) return 1;
+                return string.CompareOrdinal(a.Info.Name, b.Info.Name);
+            });
+
+            _fields = fields.ToArray();
+
+            ulong hash = BakedHash.Offset;
+
+            foreach (Field field in _fields)
+            {
+                hash = BakedHash.Append(hash, $"{field.Info.Name}:{field.Kind}:{field.IsArray};");
+            }
+
+            _hash = hash;
+        }
+
+        #endregion
+
+        #region Properties
+
+        public Field[] Fields => _fields;
+
+        public ulong Hash => _hash;
+
+        #endregion
+
+        #region Public Methods
+
+        public static BakedRowSchema Get(Type dataType)
+        {
+            lock (Cache)
+            {
+                if (!Cache.TryGetValue(dataType, out BakedRowSchema schema))
+                {
+                    schema = new BakedRowSchema(dataType);
+                    Cache[dataType] = schema;
+                }
+
+                return schema;
+            }
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private static FieldKind GetKind(Type dataType, FieldInfo info, Type type)
+        {
+            if (type.IsEnum)
+            {
+                type = Enum.GetUnderlyingType(type);
+            }
+
+            switch (Type.GetTypeCode(type))
+            {
+                case TypeCode.Boolean: return FieldKind.Boolean;
+                case TypeCode.Byte: return FieldKind.Byte;
+                case TypeCode.SByte: return FieldKind.SByte;
+                case TypeCode.Int16: return FieldKind.Int16;
+                case TypeCode.UInt16: return FieldKind.UInt16;
+                case TypeCode.Char: return FieldKind.Char;
+                case TypeCode.Int32: return FieldKind.Int32;
+                case TypeCode.UInt32: return FieldKind.UInt32;
+                case TypeCode.Int64: return FieldKind.Int64;
+                case TypeCode.UInt64: return FieldKind.UInt64;
+                case TypeCode.Single: return FieldKind.Single;
+                case TypeCode.Double: return FieldKind.Double;
+                case TypeCode.String: return FieldKind.String;
+                default:
+                    throw new NotSupportedException($"{dataType.Name}.{info.Name}: field type {info.FieldType.Name} cannot be baked.");
+            }
+        }
+
+        #endregion
+    }
+
+    /// <summary>
+    /// 64-bit FNV-1a hash used for schema and content hashes.
+    /// </summary>
+    internal static class BakedHash
+    {
+        public const ulong Offset = 14695981039346656037UL;
+        private const ulong Prime = 1099511628211UL;
+
+        public static ulong Append(ulong hash, string value)
+        {
+            foreach (char c in value)
+            {
+                hash = (hash ^ c) * Prime;
+            }
+
+            return hash;
+        }
+
+        public static ulong Append(ulong hash, byte[] buffer, int offset, int count)
+        {
+            for (int i = offset; i < offset + count; i++)
+            {
+                hash = (hash ^ buffer[i]) * Prime;
+            }
+
+            return hash;
+        }
+    }
+}
@@ -0,0 +1,402 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.IO.MemoryMappedFiles;
+using System.Text;
+
+namespace HaroFramework.Data
+{
+    /// <summary>
+    /// Reads a baked table file through a memory-mapped view, materializing rows on first access.
+    /// </summary>
+    /// <typeparam name="TData">The row type.</typeparam>
+    /// <remarks>
+    /// Opening a table only reads the header and id index; row data and strings stay in the mapped file
+    /// until GetData touches them. With a cache capacity of zero every materialized row is kept;
+    /// with a positive capacity only the most recently used rows are kept.
+    /// The file must live on a real file system (for example persistentDataPath), not inside an archive.
+    /// All members are thread-safe.
+    /// </remarks>
+    public sealed class BakedTableReader<TData> : IDisposable where TData : BaseData, new()
+    {
+        #region Fields
+
+        private readonly object _lock = new object();
+        private readonly string _path;
+        private readonly int _cacheCapacity;
+        private readonly BakedRowSchema _schema;
+
+        private MemoryMappedFile _file;
+        private MemoryMappedViewAccessor _view;
+        private BakedTableFormat.Header _header;
+        private int[] _ids;
+        private int[] _offsets;
+        private string[] _strings;
+        private byte[] _stringBuffer = new byte[64];
+
+        // Unbounded cache: one slot per row. Bounded cache: LRU list keyed by row position.
+        private TData[] _rows;
+        private Dictionary<int, LinkedListNode<KeyValuePair<int, TData>>> _lruNodes;
+        private LinkedList<KeyValuePair<int, TData>> _lruList;
+
+        private bool _isDisposed = false;
+
+        #endregion
+
+        #region Constructor
+
+        /// <summary>
+        /// Opens a baked table file.
+        /// </summary>
+        /// <param name="path">The baked file path.</param>
+        /// <param name="cacheCapacity">Maximum number of materialized rows to keep, or 0 to keep all.</param>
+        /// <exception cref="InvalidDataException">Thrown if the file is not a baked table of the current format and TData schema.</exception>
+        public BakedTableReader(string path, int cacheCapacity = 0)
+        {
+            _path = path;
+            _cacheCapacity = Math.Max(0, cacheCapacity);
+            _schema = BakedRowSchema.Get(typeof(TData));
+            Open();
+        }
+
+        #endregion
+
+        #region Properties
+
+        /// <summary>
+        /// Gets the baked file path.
+        /// </summary>
+        public string Path => _path;
+
+        /// <summary>
+        /// Gets the number of rows in the table.
+        /// </summary>
+        public int Count => _ids.Length;
+
+        /// <summary>
+        /// Gets all row ids in ascending order.
+        /// </summary>
+        public IReadOnlyList<int> Ids => _ids;
+
+        /// <summary>
+        /// Gets the content hash of the currently opened file.
+        /// </summary>
+        public ulong ContentHash => _header.ContentHash;
+
+        #endregion
+
+        #region Public Methods
+
+        /// <summary>
+        /// Gets a row by Id, deserializing it on first access.
+        /// </summary>
+        /// <param name="id">The Id of the row.</param>
+        /// <returns>The row, or null if not found.</returns>
+        public TData GetData(int id)
+        {
+            lock (_lock)
+            {
+                ThrowIfDisposed();
+
+                int index = Array.BinarySearch(_ids, id);
+                return index >= 0 ? GetRow(index) : null;
+            }
+        }
+
+        /// <summary>
+        /// Checks if a row with the given Id exists without materializing it.
+        /// </summary>
+        /// <param name="id">The Id to check.</param>
+        /// <returns>True if the row exists, false otherwise.</returns>
+        public bool Contains(int id)
+        {
+            lock (_lock)
+            {
+                return Array.BinarySearch(_ids, id) >= 0;
+            }
+        }
+
+        /// <summary>
+        /// Enumerates all rows in id order, materializing them as needed.
+        /// </summary>
+        public IEnumerable<TData> GetAllData()
+        {
+            int[] ids;
+
+            lock (_lock)
+            {
+                ids = _ids;
+            }
+
+            foreach (int id in ids)
+            {
+                TData row = GetData(id);
+
+                if (row != null)
+                {
+                    yield return row;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Reopens the file if its content changed on disk.
+        /// </summary>
+        /// <returns>True if the table was reloaded, false if it was unchanged or its header is unreadable.</returns>
+        /// <exception cref="InvalidDataException">Thrown if the new file has a valid header but does not match the TData schema.</exception>
+        /// <remarks>
+        /// Materialized rows from the previous file are dropped; rows already handed out stay valid.
+        /// If the new file cannot be opened, the reader keeps serving the previous one.
+        /// </remarks>
+        public bool ReloadIfChanged()
+        {
+            if (!BakedTableFormat.TryReadHeader(_path, out BakedTableFormat.Header header)) return false;
+
+            lock (_lock)
+            {
+                ThrowIfDisposed();
+
+                if (header.ContentHash == _header.ContentHash && header.SchemaHash == _header.SchemaHash)
+                {
+                    return false;
+                }
+
+                Open();
+                return true;
+            }
+        }
+
+        /// <summary>
+        /// Drops all materialized rows and decoded strings.
+        /// </summary>
+        public void ClearCache()
+        {
+            lock (_lock)
+            {
+                ResetCache();
+            }
+        }
+
+        /// <summary>
+        /// Closes the memory-mapped file.
+        /// </summary>
+        public void Dispose()
+        {
+            lock (_lock)
+            {
+                if (_isDisposed) return;
+
+                _isDisposed = true;
+                Close();
+            }
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        /// <summary>
+        /// Maps the file and reads its index, replacing the current view only once everything is valid.
+        /// </summary>
+        private void Open()
+        {
+            var stream = new FileStream(_path, FileMode.Open, FileAccess.Read, FileShare.Read | FileShare.Delete);
+            BakedTableFormat.Header header;
+            MemoryMappedFile file = null;
+            MemoryMappedViewAccessor view = null;
+            int[] ids;
+            int[] offsets;
+
+            try
+            {
+                using (var reader = new BinaryReader(stream, Encoding.UTF8, true))
+                {
+                    header = BakedTableFormat.ReadHeader(reader, _path);
+                }
+
+                if (header.SchemaHash != _schema.Hash)
+                {
+                    throw new InvalidDataException($"{_path} was baked from a different {typeof(TData).Name} schema. Rebake the table.");
+                }
+
+                file = MemoryMappedFile.CreateFromFile(stream, null, 0, MemoryMappedFileAccess.Read, HandleInheritability.None, false);
+                view = file.CreateViewAccessor(0, 0, MemoryMappedFileAccess.Read);
+
+                ids = new int[header.RowCount];
+                offsets = new int[header.RowCount];
+
+                for (int i = 0; i < header.RowCount; i++)
+                {
+                    long position = header.IndexOffset + (long)i * BakedTableFormat.IndexEntrySize;
+                    ids[i] = view.ReadInt32(position);
+                    offsets[i] = view.ReadInt32(position + 4);
+                }
+            }
+            catch
+            {
+                view?.Dispose();
+                file?.Dispose();
+                stream.Dispose();
+                throw;
+            }
+
+            Close();
+
+            _header = header;
+            _file = file;
+            _view = view;
+            _ids = ids;
+            _offsets = offsets;
+
+            ResetCache();
+        }
+
+        private void Close()
+        {
+            _view?.Dispose();
+            _file?.Dispose();
+            _view = null;
+            _file = null;
+        }
+
+        private void ResetCache()
+        {
+            _strings = new string[_header.StringCount];
+
+            if (_cacheCapacity == 0)
+            {
+                _rows = new TData[_header.RowCount];
+            }
+            else
+            {
+                _lruNodes = new Dictionary<int, LinkedListNode<KeyValuePair<int, TData>>>(_cacheCapacity);
+                _lruList = new LinkedList<KeyValuePair<int, TData>>();
+            }
+        }
+
+        private TData GetRow(int index)
+        {
+            if (_cacheCapacity == 0)
+            {
+                return _rows[index] ?? (_rows[index] = ReadRow(index));
+            }
+
+            if (_lruNodes.TryGetValue(index, out LinkedListNode<KeyValuePair<int, TData>> node))
+            {
+                _lruList.Remove(node);
+                _lruList.AddFirst(node);
+                return node.Value.Value;
+            }
+
+            if (_lruNodes.Count >= _cacheCapacity)
+            {
+                LinkedListNode<KeyValuePair<int, TData>> last = _lruList.Last;
+                _lruList.RemoveLast();
+                _lruNodes.Remove(last.Value.Key);
+            }
+
+            TData row = ReadRow(index);
+            _lruNodes[index] = _lruList.AddFirst(new KeyValuePair<int, TData>(index, row));
+            return row;
+        }
+
+        private TData ReadRow(int index)
+        {
+            var row = new TData();
+            long position = _header.RowDataOffset + _offsets[index];
+
+            foreach (BakedRowSchema.Field field in _schema.Fields)
+            {
+                if (!field.IsArray)
+                {
+                    field.Info.SetValue(row, ReadValue(field, ref position));
+                    continue;
+                }
+
+                int length = _view.ReadInt32(position);
+                position += 4;
+
+                if (length == BakedTableFormat.NullReference)
+                {
+                    field.Info.SetValue(row, null);
+                    continue;
+                }
+
+                var array = Array.CreateInstance(field.ElementType, length);
+
+                for (int i = 0; i < length; i++)
+                {
+                    array.SetValue(ReadValue(field, ref position), i);
+                }
+
+                field.Info.SetValue(row, array);
+            }
+
+            return row;
+        }
+
+        private object ReadValue(BakedRowSchema.Field field, ref long position)
+        {
+            object value;
+
+            switch (field.Kind)
+            {
+                case BakedRowSchema.FieldKind.Boolean: value = _view.ReadBoolean(position); position += 1; break;
+                case BakedRowSchema.FieldKind.Byte: value = _view.ReadByte(position); position += 1; break;
+                case BakedRowSchema.FieldKind.SByte: value = _view.ReadSByte(position); position += 1; break;
+                case BakedRowSchema.FieldKind.Int16: value = _view.ReadInt16(position); position += 2; break;
+                case BakedRowSchema.FieldKind.UInt16: value = _view.ReadUInt16(position); position += 2; break;
+                case BakedRowSchema.FieldKind.Char: value = (char)_view.ReadUInt16(position); position += 2; break;
+                case BakedRowSchema.FieldKind.Int32: value = _view.ReadInt32(position); position += 4; break;
+                case BakedRowSchema.FieldKind.UInt32: value = _view.ReadUInt32(position); position += 4; break;
+                case BakedRowSchema.FieldKind.Int64: value = _view.ReadInt64(position); position += 8; break;
+                case BakedRowSchema.FieldKind.UInt64: value = _view.ReadUInt64(position); position += 8; break;
+                case BakedRowSchema.FieldKind.Single: value = _view.ReadSingle(position); position += 4; break;
+                case BakedRowSchema.FieldKind.Double: value = _view.ReadDouble(position); position += 8; break;
+                case BakedRowSchema.FieldKind.String:
+                    value = ReadString(_view.ReadInt32(position));
+                    position += 4;
+                    return value;
+                default:
+                    throw new InvalidDataException($"Unknown field kind {field.Kind}.");
+            }
+
+            return field.ElementType.IsEnum ? Enum.ToObject(field.ElementType, value) : value;
+        }
+
+        private string ReadString(int index)
+        {
+            if (index == BakedTableFormat.NullReference) return null;
+
+            string value = _strings[index];
+
+            if (value != null) return value;
+
+            long offsetTable = _header.StringPoolOffset;
+            long bytesStart = offsetTable + (_header.StringCount + 1L) * 4;
+            int start = _view.ReadInt32(offsetTable + index * 4L);
+            int end = _view.ReadInt32(offsetTable + (index + 1) * 4L);
+            int length = end - start;
+
+            if (_stringBuffer.Length < length)
+            {
+                _stringBuffer = new byte[Math.Max(length, _stringBuffer.Length * 2)];
+            }
+
+            _view.ReadArray(bytesStart + start, _stringBuffer, 0, length);
+            value = Encoding.UTF8.GetString(_stringBuffer, 0, length);
+            _strings[index] = value;
+            return value;
+        }
+
+        private void ThrowIfDisposed()
+        {
+            if (_isDisposed)
+            {
+                throw new ObjectDisposedException(_path);
+            }
+        }
+
+        #endregion
+    }
+}
@@ -0,0 +1,254 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+
+namespace HaroFramework.Data
+{
+    /// <summary>
+    /// Bakes BaseData tables into the compact binary format read by BakedTableReader.
+    /// </summary>
+    /// <remarks>
+    /// Has no Unity dependency, so it can run from build scripts or command-line tools on any .NET host.
+    /// Use BakeIfChanged in pipelines to rewrite only the tables whose content or schema changed.
+    /// </remarks>
+    public static class BakedTableWriter
+    {
+        #region Public Methods
+
+        /// <summary>
+        /// Writes rows to a baked table file, replacing any existing file.
+        /// </summary>
+        /// <typeparam name="TData">The row type.</typeparam>
+        /// <param name="path">The output file path.</param>
+        /// <param name="rows">The rows to bake.</param>
+        /// <exception cref="ArgumentNullException">Thrown if rows or any row is null.</exception>
+        /// <exception cref="ArgumentException">Thrown if two rows share the same Id.</exception>
+        /// <exception cref="NotSupportedException">Thrown if TData has a field type that cannot be baked.</exception>
+        public static void Write<TData>(string path, IEnumerable<TData> rows) where TData : BaseData
+        {
+            byte[] bytes = Serialize(rows, out _);
+            WriteFile(path, bytes);
+        }
+
+        /// <summary>
+        /// Writes rows to a baked table file only if its content or schema differs from the existing file.
+        /// </summary>
+        /// <typeparam name="TData">The row type.</typeparam>
+        /// <param name="path">The output file path.</param>
+        /// <param name="rows">The rows to bake.</param>
+        /// <returns>True if the file was written, false if it was already up to date.</returns>
+        public static bool BakeIfChanged<TData>(string path, IEnumerable<TData> rows) where TData : BaseData
+        {
+            byte[] bytes = Serialize(rows, out BakedTableFormat.Header header);
+
+            if (BakedTableFormat.TryReadHeader(path, out BakedTableFormat.Header existing)
+                && existing.SchemaHash == header.SchemaHash
+                && existing.ContentHash == header.ContentHash)
+            {
+                return false;
+            }
+
+            WriteFile(path, bytes);
+            return true;
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private static byte[] Serialize<TData>(IEnumerable<TData> rows, out BakedTableFormat.Header header) where TData : BaseData
+        {
+            if (rows == null)
+            {
+                throw new ArgumentNullException(nameof(rows));
+            }
+
+            BakedRowSchema schema = BakedRowSchema.Get(typeof(TData));
+            var sortedRows = new List<TData>(rows);
+
+            // Validate before sorting, so a null row is reported instead of failing inside the comparison
+            for (int i = 0; i < sortedRows.Count; i++)
+            {
+                if (sortedRows[i] == null)
+                {
+                    throw new ArgumentNullException(nameof(rows), $"Row at position {i} is null.");
+                }
+            }
+
+            sortedRows.Sort((a, b) => a.Id.CompareTo(b.Id));
+
+            var strings = new List<string>();
+            var stringIndices = new Dictionary<string, int>();
+            var offsets = new int[sortedRows.Count];
+
+            // Row data
+            var rowStream = new MemoryStream();
+            var rowWriter = new BinaryWriter(rowStream, Encoding.UTF8);
+
+            for (int i = 0; i < sortedRows.Count; i++)
+            {
+                TData row = sortedRows[i];
+
+                if (i > 0 && sortedRows[i - 1].Id == row.Id)
+                {
+                    throw new ArgumentException($"Duplicate id {row.Id} in {typeof(TData).Name} table.", nameof(rows));
+                }
+
+                offsets[i] = (int)rowStream.Position;
+
+                foreach (BakedRowSchema.Field field in schema.Fields)
+                {
+                    object value = field.Info.GetValue(row);
+
+                    if (!field.IsArray)
+                    {
+                        WriteValue(rowWriter, field.Kind, value, strings, stringIndices);
+                        continue;
+                    }
+
+                    var array = (Array)value;
+
+                    if (array == null)
+                    {
+                        rowWriter.Write(BakedTableFormat.NullReference);
+                        continue;
+                    }
+
+                    rowWriter.Write(array.Length);
+
+                    foreach (object element in array)
+                    {
+                        WriteValue(rowWriter, field.Kind, element, strings, stringIndices);
+                    }
+                }
+            }
+
+            rowWriter.Flush();
+
+            // String pool
+            var stringStream = new MemoryStream();
+            var stringWriter = new BinaryWriter(stringStream, Encoding.UTF8);
+            var stringBytes = new List<byte[]>(strings.Count);
+            int stringOffset = 0;
+
+            foreach (string value in strings)
+            {
+                byte[] encoded = Encoding.UTF8.GetBytes(value);
+                stringBytes.Add(encoded);
+                stringWriter.Write(stringOffset);
+                stringOffset += encoded.Length;
+            }
+
+            stringWriter.Write(stringOffset);
+
+            foreach (byte[] encoded in stringBytes)
+            {
+                stringWriter.Write(encoded);
+            }
+
+            stringWriter.Flush();
+
+            // Assemble file
+            long indexOffset = BakedTableFormat.HeaderSize;
+            long rowDataOffset = indexOffset + (long)sortedRows.Count * BakedTableFormat.IndexEntrySize;
+
+            header = new BakedTableFormat.Header
+            {
+                SchemaHash = schema.Hash,
+                RowCount = sortedRows.Count,
+                StringCount = strings.Count,
+                IndexOffset = indexOffset,
+                RowDataOffset = rowDataOffset,
+                StringPoolOffset = rowDataOffset + rowStream.Length
+            };
+
+            var fileStream = new MemoryStream((int)(header.StringPoolOffset + stringStream.Length));
+            var fileWriter = new BinaryWriter(fileStream, Encoding.UTF8);
+
+            BakedTableFormat.WriteHeader(fileWriter, header);
+
+            for (int i = 0; i < sortedRows.Count; i++)
+            {
+                fileWriter.Write(sortedRows[i].Id);
+                fileWriter.Write(offsets[i]);
+            }
+
+            rowStream.WriteTo(fileStream);
+            stringStream.WriteTo(fileStream);
+            fileWriter.Flush();
+
+            byte[] bytes = fileStream.ToArray();
+
+            // Content hash covers everything after the header
+            header.ContentHash = BakedHash.Append(BakedHash.Offset, bytes, BakedTableFormat.HeaderSize, bytes.Length - BakedTableFormat.HeaderSize);
+
+            fileStream.Position = 0;
+            BakedTableFormat.WriteHeader(fileWriter, header);
+            fileWriter.Flush();
+
+            return fileStream.ToArray();
+        }
+
+        private static void WriteValue(BinaryWriter writer, BakedRowSchema.FieldKind kind, object value, List<string> strings, Dictionary<string, int> stringIndices)
+        {
+            switch (kind)
+            {
+                case BakedRowSchema.FieldKind.Boolean: writer.Write((bool)value); break;
+                case BakedRowSchema.FieldKind.Byte: writer.Write(Convert.ToByte(value)); break;
+                case BakedRowSchema.FieldKind.SByte: writer.Write(Convert.ToSByte(value)); break;
+                case BakedRowSchema.FieldKind.Int16: writer.Write(Convert.ToInt16(value)); break;
+                case BakedRowSchema.FieldKind.UInt16: writer.Write(Convert.ToUInt16(value)); break;
+                case BakedRowSchema.FieldKind.Char: writer.Write((ushort)(char)value); break;
+                case BakedRowSchema.FieldKind.Int32: writer.Write(Convert.ToInt32(value)); break;
+                case BakedRowSchema.FieldKind.UInt32: writer.Write(Convert.ToUInt32(value)); break;
+                case BakedRowSchema.FieldKind.Int64: writer.Write(Convert.ToInt64(value)); break;
+                case BakedRowSchema.FieldKind.UInt64: writer.Write(Convert.ToUInt64(value)); break;
+                case BakedRowSchema.FieldKind.Single: writer.Write((float)value); break;
+                case BakedRowSchema.FieldKind.Double: writer.Write((double)value); break;
+                case BakedRowSchema.FieldKind.String:
+                    writer.Write(GetStringIndex((string)value, strings, stringIndices));
+                    break;
+            }
+        }
+
+        private static int GetStringIndex(string value, List<string> strings, Dictionary<string, int> stringIndices)
+        {
+            if (value == null) return BakedTableFormat.NullReference;
+
+            if (!stringIndices.TryGetValue(value, out int index))
+            {
+                index = strings.Count;
+                strings.Add(value);
+                stringIndices[value] = index;
+            }
+
+            return index;
+        }
+
+        private static void WriteFile(string path, byte[] bytes)
+        {
+            string directory = Path.GetDirectoryName(Path.GetFullPath(path));
+
+            if (!string.IsNullOrEmpty(directory))
+            {
+                Directory.CreateDirectory(directory);
+            }
+
+            // Write next to the target and swap in, so readers never see a partial file
+            string tempPath = path + ".tmp";
+            File.WriteAllBytes(tempPath, bytes);
+
+            if (File.Exists(path))
+            {
+                File.Replace(tempPath, path, null);
+            }
+            else
+            {
+                File.Move(tempPath, path);
+            }
+        }
+
+        #endregion
+    }
+}
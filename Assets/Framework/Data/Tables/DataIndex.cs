@@ -0,0 +1,258 @@
+using System;
+using System.Collections.Generic;
+
+namespace HaroFramework.Data
+{
+    /// <summary>
+    /// Non-generic view of a secondary index.
+    /// </summary>
+    public interface IDataIndex
+    {
+        /// <summary>
+        /// Gets the name of this index.
+        /// </summary>
+        string Name { get; }
+
+        /// <summary>
+        /// Gets the key type of this index.
+        /// </summary>
+        Type KeyType { get; }
+    }
+
+    /// <summary>
+    /// Sorted secondary index over the rows of a DataTable.
+    /// </summary>
+    /// <typeparam name="TData">The row type.</typeparam>
+    /// <typeparam name="TKey">The key type.</typeparam>
+    /// <remarks>
+    /// Keys are stored in a sorted array next to the row positions they point to,
+    /// so equality and range lookups are binary searches and enumerating results does not allocate.
+    /// Rows with equal keys are returned in table order.
+    /// </remarks>
+    public sealed class DataIndex<TData, TKey> : IDataIndex where TData : BaseData
+    {
+        #region Nested Types
+
+        /// <summary>
+        /// Rows matched by an index query.
+        /// </summary>
+        public readonly struct RowRange
+        {
+            private readonly TData[] _rows;
+            private readonly int[] _rowIndices;
+            private readonly int _start;
+            private readonly int _end;
+
+            internal RowRange(TData[] rows, int[] rowIndices, int start, int end)
+            {
+                _rows = rows;
+                _rowIndices = rowIndices;
+                _start = start;
+                _end = end;
+            }
+
+            /// <summary>
+            /// Gets the number of matched rows.
+            /// </summary>
+            public int Count => _end - _start;
+
+            /// <summary>
+            /// Gets the matched row at the given position.
+            /// </summary>
+            /// <param name="index">Position within the result, from 0 to Count - 1.</param>
+            public TData this[int index]
+            {
+                get
+                {
+                    if ((uint)index >= (uint)Count)
+                    {
+                        throw new ArgumentOutOfRangeException(nameof(index));
+                    }
+
+                    return _rows[_rowIndices[_start + index]];
+                }
+            }
+
+            /// <summary>
+            /// Returns an allocation-free enumerator over the matched rows.
+            /// </summary>
+            public Enumerator GetEnumerator()
+            {
+                return new Enumerator(_rows, _rowIndices, _start, _end);
+            }
+        }
+
+        /// <summary>
+        /// Allocation-free enumerator over a RowRange.
+        /// </summary>
+        public struct Enumerator
+        {
+            private readonly TData[] _rows;
+            private readonly int[] _rowIndices;
+            private readonly int _end;
+            private int _position;
+
+            internal Enumerator(TData[] rows, int[] rowIndices, int start, int end)
+            {
+                _rows = rows;
+                _rowIndices = rowIndices;
+                _end = end;
+                _position = start - 1;
+            }
+
+            /// <summary>
+            /// Gets the current row.
+            /// </summary>
+            public TData Current => _rows[_rowIndices[_position]];
+
+            /// <summary>
+            /// Advances to the next matched row.
+            /// </summary>
+            public bool MoveNext()
+            {
+                return ++_position < _end;
+            }
+        }
+
+        #endregion
+
+        #region Fields
+
+        private readonly string _name;
+        private readonly TData[] _rows;
+        private readonly TKey[] _keys;
+        private readonly int[] _rowIndices;
+        private readonly IComparer<TKey> _comparer;
+
+        #endregion
+
+        #region Constructor
+
+        internal DataIndex(string name, TData[] rows, Func<TData, TKey> keySelector, IComparer<TKey> comparer)
+        {
+            _name = name;
+            _rows = rows;
+            _comparer = comparer ?? Comparer<TKey>.Default;
+            _keys = new TKey[rows.Length];
+            _rowIndices = new int[rows.Length];
+
+            for (int i = 0; i < rows.Length; i++)
+            {
+                _keys[i] = keySelector(rows[i]);
+                _rowIndices[i] = i;
+            }
+
+            // Array.Sort is unstable; sort by (key, row position) to keep table order for equal keys
+            Array.Sort(_rowIndices, (a, b) =>
+            {
+                int result = _comparer.Compare(_keys[a], _keys[b]);
+                return result != 0 ? result : a.CompareTo(b);
+            });
+
+            var sortedKeys = new TKey[_keys.Length];
+
+            for (int i = 0; i < _rowIndices.Length; i++)
+            {
+                sortedKeys[i] = _keys[_rowIndices[i]];
+            }
+
+            _keys = sortedKeys;
+        }
+
+        #endregion
+
+        #region Properties
+
+        /// <summary>
+        /// Gets the name of this index.
+        /// </summary>
+        public string Name => _name;
+
+        /// <summary>
+        /// Gets the key type of this index.
+        /// </summary>
+        public Type KeyType => typeof(TKey);
+
+        #endregion
+
+        #region Public Methods
+
+        /// <summary>
+        /// Gets the first row with the given key.
+        /// </summary>
+        /// <param name="key">The key to look up.</param>
+        /// <returns>The first matching row in table order, or null if none match.</returns>
+        public TData Find(TKey key)
+        {
+            int start = LowerBound(key);
+
+            if (start < _keys.Length && _comparer.Compare(_keys[start], key) == 0)
+            {
+                return _rows[_rowIndices[start]];
+            }
+
+            return null;
+        }
+
+        /// <summary>
+        /// Gets all rows with the given key.
+        /// </summary>
+        /// <param name="key">The key to look up.</param>
+        /// <returns>The matching rows.</returns>
+        public RowRange FindAll(TKey key)
+        {
+            return new RowRange(_rows, _rowIndices, LowerBound(key), UpperBound(key));
+        }
+
+        /// <summary>
+        /// Gets all rows whose key is between min and max, inclusive.
+        /// </summary>
+        /// <param name="min">The lowest key to include.</param>
+        /// <param name="max">The highest key to include.</param>
+        /// <returns>The matching rows ordered by key.</returns>
+        public RowRange Range(TKey min, TKey max)
+        {
+            int start = LowerBound(min);
+            int end = UpperBound(max);
+            return new RowRange(_rows, _rowIndices, start, Math.Max(start, end));
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private int LowerBound(TKey key)
+        {
+            int low = 0;
+            int high = _keys.Length;
+
+            while (low < high)
+            {
+                int mid = low + ((high - low) >> 1);
+
+                if (_comparer.Compare(_keys[mid], key) < 0) low = mid + 1;
+                else high = mid;
+            }
+
+            return low;
+        }
+
+        private int UpperBound(TKey key)
+        {
+            int low = 0;
+            int high = _keys.Length;
+
+            while (low < high)
+            {
+                int mid = low + ((high - low) >> 1);
+
+                if (_comparer.Compare(_keys[mid], key) <= 0) low = mid + 1;
+                else high = mid;
+            }
+
+            return low;
+        }
+
+        #endregion
+    }
+}
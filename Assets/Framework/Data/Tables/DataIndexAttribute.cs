@@ -0,0 +1,38 @@
+using System;
+
+namespace HaroFramework.Data
+{
+    /// <summary>
+    /// Marks a field or property of a BaseData class as a secondary index key.
+    /// </summary>
+    /// <remarks>
+    /// DataTable builds a sorted index for every marked member when the table is created.
+    /// The member type must implement IComparable&lt;T&gt;.
+    /// Query the index with DataTable.GetIndex&lt;TKey&gt;(name), where name defaults to the member name.
+    /// </remarks>
+    [AttributeUsage(AttributeTargets.Field | AttributeTargets.Property, AllowMultiple = false, Inherited = true)]
+    public sealed class DataIndexAttribute : Attribute
+    {
+        #region Properties
+
+        /// <summary>
+        /// Gets the index name, or null to use the member name.
+        /// </summary>
+        public string Name { get; }
+
+        #endregion
+
+        #region Constructor
+
+        /// <summary>
+        /// Marks the member as an index key.
+        /// </summary>
+        /// <param name="name">Optional index name. Defaults to the member name.</param>
+        public DataIndexAttribute(string name = null)
+        {
+            Name = name;
+        }
+
+        #endregion
+    }
+}
@@ -0,0 +1,395 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Reflection;
+
+namespace HaroFramework.Data
+{
+    /// <summary>
+    /// Read-only table of data rows stored in a contiguous array.
+    /// </summary>
+    /// <typeparam name="TData">The row type.</typeparam>
+    /// <remarks>
+    /// Rows are sorted by Id. When ids are dense, lookups go through a direct id-to-index array;
+    /// when they are sparse, lookups go through an id-to-index dictionary instead. A binary search over
+    /// the sorted ids would save that dictionary's memory, but on large tables it takes several times as long
+    /// as a dictionary lookup because each probe misses the cache.
+    /// Secondary indexes are built for members marked with DataIndexAttribute and can be added with AddIndex.
+    /// Enumerate with foreach over the table or AsSpan() to avoid allocations.
+    /// </remarks>
+    public sealed class DataTable<TData> : IReadOnlyList<TData> where TData : BaseData
+    {
+        #region Nested Types
+
+        /// <summary>
+        /// Allocation-free enumerator over the rows of a table.
+        /// </summary>
+        public struct Enumerator : IEnumerator<TData>
+        {
+            private readonly TData[] _rows;
+            private int _index;
+
+            internal Enumerator(TData[] rows)
+            {
+                _rows = rows;
+                _index = -1;
+            }
+
+            /// <summary>
+            /// Gets the current row.
+            /// </summary>
+            public TData Current => _rows[_index];
+
+            object IEnumerator.Current => Current;
+
+            /// <summary>
+            /// Advances to the next row.
+            /// </summary>
+            public bool MoveNext()
+            {
+                return ++_index < _rows.Length;
+            }
+
+            /// <summary>
+            /// Resets the enumerator to before the first row.
+            /// </summary>
+            public void Reset()
+            {
+                _index = -1;
+            }
+
+            /// <summary>
+            /// Does nothing; present for IEnumerator compatibility.
+            /// </summary>
+            public void Dispose()
+            {
+            }
+        }
+
+        #endregion
+
+        #region Fields
+
+        /// <summary>
+        /// Maximum id range per row for which the dense id map is used.
+        /// </summary>
+        private const int MaxDenseRangeFactor = 2;
+
+        private static readonly MethodInfo AddMemberIndexMethod =
+            typeof(DataTable<TData>).GetMethod(nameof(AddMemberIndex), BindingFlags.NonPublic | BindingFlags.Instance);
+
+        private readonly TData[] _rows;
+        private readonly int[] _ids;
+        private readonly int[] _denseIndices;
+        private readonly Dictionary<int, int> _sparseIndices;
+        private readonly int _minId;
+        private readonly Dictionary<string, IDataIndex> _indexes = new Dictionary<string, IDataIndex>();
+
+        #endregion
+
+        #region Constructor
+
+        /// <summary>
+        /// Creates a table from the given rows.
+        /// </summary>
+        /// <param name="rows">The rows to store. The sequence is copied.</param>
+        /// <exception cref="ArgumentNullException">Thrown if rows or any row is null.</exception>
+        /// <exception cref="ArgumentException">Thrown if two rows share the same Id.</exception>
+        public DataTable(IEnumerable<TData> rows)
+        {
+            if (rows == null)
+            {
+                throw new ArgumentNullException(nameof(rows));
+            }
+
+            _rows = new List<TData>(rows).ToArray();
+            _ids = new int[_rows.Length];
+
+            for (int i = 0; i < _rows.Length; i++)
+            {
+                if (_rows[i] == null)
+                {
+                    throw new ArgumentNullException(nameof(rows), $"Row at position {i} is null.");
+                }
+
+                _ids[i] = _rows[i].Id;
+            }
+
+            Array.Sort(_ids, _rows);
+
+            for (int i = 1; i < _ids.Length; i++)
+            {
+                if (_ids[i] == _ids[i - 1])
+                {
+                    throw new ArgumentException($"Duplicate id {_ids[i]} in {typeof(TData).Name} table.", nameof(rows));
+                }
+            }
+
+            if (_rows.Length > 0)
+            {
+                _minId = _ids[0];
+                long range = (long)_ids[_ids.Length - 1] - _minId + 1;
+
+                if (range <= (long)_rows.Length * MaxDenseRangeFactor)
+                {
+                    _denseIndices = new int[range];
+
+                    for (int i = 0; i < _denseIndices.Length; i++)
+                    {
+                        _denseIndices[i] = -1;
+                    }
+
+                    for (int i = 0; i < _ids.Length; i++)
+                    {
+                        _denseIndices[_ids[i] - _minId] = i;
+                    }
+                }
+                else
+                {
+                    _sparseIndices = new Dictionary<int, int>(_ids.Length);
+
+                    for (int i = 0; i < _ids.Length; i++)
+                    {
+                        _sparseIndices.Add(_ids[i], i);
+                    }
+                }
+            }
+
+            AddAttributeIndexes();
+        }
+
+        #endregion
+
+        #region Properties
+
+        /// <summary>
+        /// Gets the number of rows.
+        /// </summary>
+        public int Count => _rows.Length;
+
+        /// <summary>
+        /// Gets the row at the given position in id order.
+        /// </summary>
+        /// <param name="index">Position from 0 to Count - 1.</param>
+        public TData this[int index] => _rows[index];
+
+        /// <summary>
+        /// Gets whether id lookups use the dense id-to-index array rather than the sparse id dictionary.
+        /// </summary>
+        public bool IsDense => _denseIndices != null;
+
+        #endregion
+
+        #region Public Methods
+
+        /// <summary>
+        /// Gets a row by Id.
+        /// </summary>
+        /// <param name="id">The Id of the row.</param>
+        /// <returns>The row, or null if not found.</returns>
+        public TData GetData(int id)
+        {
+            int index = IndexOf(id);
+            return index >= 0 ? _rows[index] : null;
+        }
+
+        /// <summary>
+        /// Gets a row by Id.
+        /// </summary>
+        /// <param name="id">The Id of the row.</param>
+        /// <param name="data">The row, or null if not found.</param>
+        /// <returns>True if the row exists, false otherwise.</returns>
+        public bool TryGetData(int id, out TData data)
+        {
+            int index = IndexOf(id);
+            data = index >= 0 ? _rows[index] : null;
+            return index >= 0;
+        }
+
+        /// <summary>
+        /// Checks if a row with the given Id exists.
+        /// </summary>
+        /// <param name="id">The Id to check.</param>
+        /// <returns>True if the row exists, false otherwise.</returns>
+        public bool Contains(int id)
+        {
+            return IndexOf(id) >= 0;
+        }
+
+        /// <summary>
+        /// Gets the position of a row in id order.
+        /// </summary>
+        /// <param name="id">The Id of the row.</param>
+        /// <returns>The position, or -1 if not found.</returns>
+        public int IndexOf(int id)
+        {
+            if (_denseIndices != null)
+            {
+                uint offset = (uint)(id - _minId);
+                return offset < (uint)_denseIndices.Length ? _denseIndices[offset] : -1;
+            }
+
+            if (_sparseIndices != null && _sparseIndices.TryGetValue(id, out int index))
+            {
+                return index;
+            }
+
+            return -1;
+        }
+
+        /// <summary>
+        /// Gets the rows as a read-only span in id order.
+        /// </summary>
+        public ReadOnlySpan<TData> AsSpan()
+        {
+            return _rows;
+        }
+
+        /// <summary>
+        /// Adds a secondary index over a key selected from each row.
+        /// </summary>
+        /// <typeparam name="TKey">The key type.</typeparam>
+        /// <param name="name">The index name used by GetIndex.</param>
+        /// <param name="keySelector">Selects the key of a row.</param>
+        /// <param name="comparer">Optional key comparer. Defaults to Comparer&lt;TKey&gt;.Default.</param>
+        /// <returns>The new index.</returns>
+        /// <remarks>
+        /// Building an index sorts all keys once; call this during loading, not per frame.
+        /// Adding an index with an existing name replaces it.
+        /// </remarks>
+        public DataIndex<TData, TKey> AddIndex<TKey>(string name, Func<TData, TKey> keySelector, IComparer<TKey> comparer = null)
+        {
+            if (keySelector == null)
+            {
+                throw new ArgumentNullException(nameof(keySelector));
+            }
+
+            var index = new DataIndex<TData, TKey>(name, _rows, keySelector, comparer);
+            _indexes[name] = index;
+            return index;
+        }
+
+        /// <summary>
+        /// Gets a secondary index by name.
+        /// </summary>
+        /// <typeparam name="TKey">The key type of the index.</typeparam>
+        /// <param name="name">The index name.</param>
+        /// <returns>The index.</returns>
+        /// <exception cref="KeyNotFoundException">Thrown if no index has the given name.</exception>
+        /// <exception cref="InvalidCastException">Thrown if the index key type is not TKey.</exception>
+        public DataIndex<TData, TKey> GetIndex<TKey>(string name)
+        {
+            if (!_indexes.TryGetValue(name, out IDataIndex index))
+            {
+                throw new KeyNotFoundException($"{typeof(TData).Name} table has no index named {name}.");
+            }
+
+            return (DataIndex<TData, TKey>)index;
+        }
+
+        /// <summary>
+        /// Checks if a secondary index with the given name exists.
+        /// </summary>
+        /// <param name="name">The index name.</param>
+        /// <returns>True if the index exists, false otherwise.</returns>
+        public bool HasIndex(string name)
+        {
+            return _indexes.ContainsKey(name);
+        }
+
+        /// <summary>
+        /// Runs BaseData.Validate on every row.
+        /// </summary>
+        /// <param name="invalidIds">Optional list that receives the Id of every invalid row.</param>
+        /// <returns>The number of invalid rows.</returns>
+        /// <remarks>
+        /// A row whose Validate throws is counted as invalid.
+        /// </remarks>
+        public int Validate(List<int> invalidIds = null)
+        {
+            int invalidCount = 0;
+
+            for (int i = 0; i < _rows.Length; i++)
+            {
+                bool isValid;
+
+                try
+                {
+                    isValid = _rows[i].Validate();
+                }
+                catch (Exception)
+                {
+                    isValid = false;
+                }
+
+                if (!isValid)
+                {
+                    invalidCount++;
+                    invalidIds?.Add(_ids[i]);
+                }
+            }
+
+            return invalidCount;
+        }
+
+        /// <summary>
+        /// Returns an allocation-free enumerator over the rows in id order.
+        /// </summary>
+        public Enumerator GetEnumerator()
+        {
+            return new Enumerator(_rows);
+        }
+
+        IEnumerator<TData> IEnumerable<TData>.GetEnumerator()
+        {
+            return GetEnumerator();
+        }
+
+        IEnumerator IEnumerable.GetEnumerator()
+        {
+            return GetEnumerator();
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private void AddAttributeIndexes()
+        {
+            const BindingFlags flags = BindingFlags.Public | BindingFlags.NonPublic | BindingFlags.Instance;
+
+            foreach (MemberInfo member in typeof(TData).GetMembers(flags))
+            {
+                var attribute = member.GetCustomAttribute<DataIndexAttribute>(true);
+
+                if (attribute == null) continue;
+
+                Type keyType;
+
+                if (member is FieldInfo field) keyType = field.FieldType;
+                else if (member is PropertyInfo property && property.CanRead) keyType = property.PropertyType;
+                else continue;
+
+                AddMemberIndexMethod.MakeGenericMethod(keyType)
+                    .Invoke(this, new object[] { attribute.Name ?? member.Name, member });
+            }
+        }
+
+        private void AddMemberIndex<TKey>(string name, MemberInfo member)
+        {
+            // Reflection only runs while the index is built, never on lookups
+            if (member is FieldInfo field)
+            {
+                AddIndex(name, row => (TKey)field.GetValue(row));
+            }
+            else
+            {
+                var getter = (Func<TData, TKey>)Delegate.CreateDelegate(
+                    typeof(Func<TData, TKey>), ((PropertyInfo)member).GetGetMethod(true));
+                AddIndex(name, getter);
+            }
+        }
+
+        #endregion
+    }
+}
@@ -0,0 +1,195 @@
+using System;
+using System.IO;
+using HaroFramework.Data;
+using NUnit.Framework;
+
+namespace HaroFramework.Tests
+{
+    /// <summary>
+    /// Error handling of BakedTableWriter and BakedTableReader reloads.
+    /// </summary>
+    [TestFixture]
+    public class BakedTableTests
+    {
+        #region Nested Types
+
+        private sealed class ItemRow : BaseData
+        {
+            public string Name;
+
+            public override bool Validate()
+            {
+                return true;
+            }
+        }
+
+        private sealed class OtherRow : BaseData
+        {
+            public float Weight;
+
+            public override bool Validate()
+            {
+                return true;
+            }
+        }
+
+        #endregion
+
+        #region Fields
+
+        private static readonly ItemRow[] Items =
+        {
+            new ItemRow { Id = 1, Name = "Sword" },
+            new ItemRow { Id = 2, Name = "Shield" }
+        };
+
+        private string _directory;
+        private string _path;
+
+        #endregion
+
+        #region Setup
+
+        [SetUp]
+        public void SetUp()
+        {
+            _directory = Path.Combine(Path.GetTempPath(), "HaroFrameworkTests", Guid.NewGuid().ToString("N"));
+            _path = Path.Combine(_directory, "items.bytes");
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            if (Directory.Exists(_directory))
+            {
+                Directory.Delete(_directory, true);
+            }
+        }
+
+        #endregion
+
+        #region Tests
+
+        [Test]
+        public void Write_NullRow_ThrowsArgumentNullException()
+        {
+            var rows = new[] { new ItemRow { Id = 2 }, null, new ItemRow { Id = 1 } };
+
+            Assert.Throws<ArgumentNullException>(() => BakedTableWriter.Write(_path, rows));
+        }
+
+        [Test]
+        public void Write_ExistingFile_ReplacesIt()
+        {
+            BakedTableWriter.Write(_path, new[] { new ItemRow { Id = 1, Name = "Old" } });
+            BakedTableWriter.Write(_path, new[] { new ItemRow { Id = 1, Name = "New" } });
+
+            using (var reader = new BakedTableReader<ItemRow>(_path))
+            {
+                Assert.AreEqual("New", reader.GetData(1).Name);
+            }
+
+            Assert.IsFalse(File.Exists(_path + ".tmp"));
+        }
+
+        [Test]
+        public void ReloadIfChanged_InvalidNewFile_KeepsPreviousTable()
+        {
+            BakedTableWriter.Write(_path, new[] { new ItemRow { Id = 1, Name = "Sword" } });
+
+            using (var reader = new BakedTableReader<ItemRow>(_path))
+            {
+                BakedTableWriter.Write(_path, new[] { new OtherRow { Id = 1, Weight = 2f } });
+
+                Assert.Throws<InvalidDataException>(() => reader.ReloadIfChanged());
+
+                reader.ClearCache();
+                Assert.AreEqual("Sword", reader.GetData(1).Name);
+
+                BakedTableWriter.Write(_path, new[] { new ItemRow { Id = 1, Name = "Axe" } });
+
+                Assert.IsTrue(reader.ReloadIfChanged());
+                Assert.AreEqual("Axe", reader.GetData(1).Name);
+            }
+        }
+
+        [Test]
+        public void ReloadIfChanged_HalfWrittenFile_KeepsPreviousTable()
+        {
+            BakedTableWriter.Write(_path, Items);
+
+            using (var reader = new BakedTableReader<ItemRow>(_path))
+            {
+                byte[] bytes = File.ReadAllBytes(_path);
+                Array.Resize(ref bytes, 10);
+                ReplaceFile(bytes);
+
+                Assert.IsFalse(reader.ReloadIfChanged());
+                Assert.AreEqual("Sword", reader.GetData(1).Name);
+            }
+        }
+
+        [Test]
+        public void BakeIfChanged_TruncatedFile_Rebakes()
+        {
+            Directory.CreateDirectory(_directory);
+            File.WriteAllBytes(_path, new byte[] { 1, 2, 3 });
+
+            AssertRebakes();
+        }
+
+        [Test]
+        public void BakeIfChanged_WrongVersionFile_Rebakes()
+        {
+            BakedTableWriter.Write(_path, Items);
+            byte[] bytes = File.ReadAllBytes(_path);
+
+            // The format version follows the 4-byte magic number
+            bytes[4]++;
+            File.WriteAllBytes(_path, bytes);
+
+            AssertRebakes();
+        }
+
+        [Test]
+        public void BakeIfChanged_GarbageFile_Rebakes()
+        {
+            Directory.CreateDirectory(_directory);
+            File.WriteAllBytes(_path, new byte[64]);
+
+            AssertRebakes();
+        }
+
+        [Test]
+        public void BakeIfChanged_UnchangedFile_IsNotRewritten()
+        {
+            Assert.IsTrue(BakedTableWriter.BakeIfChanged(_path, Items));
+            Assert.IsFalse(BakedTableWriter.BakeIfChanged(_path, Items));
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private void AssertRebakes()
+        {
+            Assert.IsTrue(BakedTableWriter.BakeIfChanged(_path, Items));
+
+            using (var reader = new BakedTableReader<ItemRow>(_path))
+            {
+                Assert.AreEqual("Sword", reader.GetData(1).Name);
+                Assert.AreEqual("Shield", reader.GetData(2).Name);
+            }
+        }
+
+        private void ReplaceFile(byte[] bytes)
+        {
+            // Swap the file in the way BakedTableWriter does, since the reader keeps the original mapped
+            string tempPath = _path + ".partial";
+            File.WriteAllBytes(tempPath, bytes);
+            File.Replace(tempPath, _path, null);
+        }
+
+        #endregion
+    }
+}
@@ -0,0 +1,339 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+using HaroFramework.Core;
+using HaroFramework.Data;
+using NUnit.Framework;
+using UnityEngine;
+using Object = UnityEngine.Object;
+
+namespace HaroFramework.Tests
+{
+    /// <summary>
+    /// Load order, failure handling, threading and hot reload of DataManager.
+    /// </summary>
+    [TestFixture]
+    public class DataManagerTests
+    {
+        #region Nested Types
+
+        private sealed class TestData : BaseData
+        {
+            public override bool Validate()
+            {
+                return true;
+            }
+        }
+
+        private abstract class TestDomain : BaseDomain<TestData>, IReloadableDomain
+        {
+            private readonly List<string> _loadLog;
+
+            public Type[] DependsOn = Array.Empty<Type>();
+            public bool IsMainThreadOnly;
+            public bool Fails;
+            public bool HasChanged;
+            public int LoadCount;
+            public int LoadThreadId;
+
+            protected TestDomain(List<string> loadLog)
+            {
+                _loadLog = loadLog;
+            }
+
+            public override string DomainName => GetType().Name;
+
+            public override IReadOnlyList<Type> Dependencies => DependsOn;
+
+            public override bool LoadOnMainThread => IsMainThreadOnly;
+
+            public override void LoadData()
+            {
+                LoadThreadId = Thread.CurrentThread.ManagedThreadId;
+                Interlocked.Increment(ref LoadCount);
+
+                lock (_loadLog)
+                {
+                    _loadLog.Add(DomainName);
+                }
+
+                if (Fails)
+                {
+                    throw new InvalidOperationException($"{DomainName} failed.");
+                }
+            }
+
+            public bool ReloadIfChanged()
+            {
+                if (!HasChanged) return false;
+
+                HasChanged = false;
+                LoadData();
+                return true;
+            }
+
+            public override TestData GetData(int id)
+            {
+                return null;
+            }
+
+            public override IEnumerable<TestData> GetAllData()
+            {
+                return Array.Empty<TestData>();
+            }
+        }
+
+        private sealed class DomainA : TestDomain
+        {
+            public DomainA(List<string> loadLog) : base(loadLog)
+            {
+            }
+        }
+
+        private sealed class DomainB : TestDomain
+        {
+            public DomainB(List<string> loadLog) : base(loadLog)
+            {
+            }
+        }
+
+        private sealed class DomainC : TestDomain
+        {
+            public DomainC(List<string> loadLog) : base(loadLog)
+            {
+            }
+        }
+
+        private sealed class ErrorSink : ILogSink
+        {
+            public readonly List<string> Messages = new List<string>();
+
+            public void Write(in LogEntry entry)
+            {
+                if (entry.Level != LogLevel.Error || entry.Category != "DataManager") return;
+
+                lock (Messages)
+                {
+                    Messages.Add(entry.Message);
+                }
+            }
+
+            public void Flush()
+            {
+            }
+        }
+
+        private sealed class ProgressLog : IProgress<DomainLoadProgress>
+        {
+            public readonly List<DomainLoadProgress> Reports = new List<DomainLoadProgress>();
+
+            public void Report(DomainLoadProgress value)
+            {
+                lock (Reports)
+                {
+                    Reports.Add(value);
+                }
+            }
+        }
+
+        #endregion
+
+        #region Fields
+
+        private const string SkippedMessage = "Skipped domain DomainB: dependency DomainA failed to load.";
+
+        private GameObject _host;
+        private DataManager _manager;
+        private List<string> _loadLog;
+        private ErrorSink _errors;
+        private DomainA _domainA;
+        private DomainB _domainB;
+        private DomainC _domainC;
+
+        #endregion
+
+        #region Setup
+
+        [SetUp]
+        public void SetUp()
+        {
+            _host = new GameObject(nameof(DataManagerTests));
+            _manager = _host.AddComponent<DataManager>();
+            _loadLog = new List<string>();
+            _errors = new ErrorSink();
+            FrameworkLogger.AddSink(_errors);
+
+            _domainA = new DomainA(_loadLog);
+            _domainB = new DomainB(_loadLog);
+            _domainC = new DomainC(_loadLog);
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            FrameworkLogger.RemoveSink(_errors);
+            Object.DestroyImmediate(_host);
+        }
+
+        #endregion
+
+        #region Tests
+
+        [Test]
+        public void LoadAllDomains_LoadsDependenciesBeforeDependents()
+        {
+            _domainC.DependsOn = new[] { typeof(DomainB) };
+            _domainB.DependsOn = new[] { typeof(DomainA) };
+            RegisterAll();
+
+            _manager.LoadAllDomains();
+
+            CollectionAssert.AreEqual(new[] { "DomainA", "DomainB", "DomainC" }, _loadLog);
+            Assert.IsTrue(_manager.IsLoaded);
+            Assert.AreEqual(3, _manager.DomainLoadTimes.Count);
+        }
+
+        [Test]
+        public void LoadAllDomains_CircularDependency_Throws()
+        {
+            _domainA.DependsOn = new[] { typeof(DomainB) };
+            _domainB.DependsOn = new[] { typeof(DomainA) };
+            RegisterAll();
+
+            var exception = Assert.Throws<InvalidOperationException>(() => _manager.LoadAllDomains());
+
+            StringAssert.Contains("Circular domain dependency", exception.Message);
+            Assert.IsEmpty(_loadLog);
+            Assert.IsFalse(_manager.IsLoading);
+            Assert.IsFalse(_manager.IsLoaded);
+        }
+
+        [Test]
+        public void LoadAllDomains_DependencyFailed_SkipsDependent()
+        {
+            _domainA.Fails = true;
+            _domainB.DependsOn = new[] { typeof(DomainA) };
+            RegisterAll();
+            var progress = new ProgressLog();
+
+            _manager.LoadAllDomains(progress);
+
+            Assert.AreEqual(0, _domainB.LoadCount);
+            Assert.AreEqual(1, _domainC.LoadCount);
+            CollectionAssert.Contains(_errors.Messages, SkippedMessage);
+            Assert.AreEqual(3, progress.Reports.Count);
+            Assert.AreEqual(2, CountFailed(progress));
+        }
+
+        [Test]
+        public void LoadAllDomainsAsync_DependencyFailed_LogsLikeSyncPath()
+        {
+            _domainA.Fails = true;
+            _domainB.DependsOn = new[] { typeof(DomainA) };
+            RegisterAll();
+            var progress = new ProgressLog();
+
+            LoadAsync(progress);
+
+            Assert.AreEqual(0, _domainB.LoadCount);
+            Assert.AreEqual(1, _domainC.LoadCount);
+            CollectionAssert.Contains(_errors.Messages, SkippedMessage);
+            Assert.AreEqual(3, progress.Reports.Count);
+            Assert.AreEqual(2, CountFailed(progress));
+            Assert.IsTrue(_manager.IsLoaded);
+        }
+
+        [Test]
+        public void LoadAllDomainsAsync_WorkerDomainDependsOnMainThreadDomain_LoadsInOrderOnEachThread()
+        {
+            _domainA.IsMainThreadOnly = true;
+            _domainB.DependsOn = new[] { typeof(DomainA) };
+            _domainC.DependsOn = new[] { typeof(DomainB) };
+            _domainC.IsMainThreadOnly = true;
+            RegisterAll();
+
+            int mainThreadId = LoadAsync(null);
+
+            CollectionAssert.AreEqual(new[] { "DomainA", "DomainB", "DomainC" }, _loadLog);
+            Assert.AreEqual(mainThreadId, _domainA.LoadThreadId);
+            Assert.AreNotEqual(mainThreadId, _domainB.LoadThreadId);
+            Assert.AreEqual(mainThreadId, _domainC.LoadThreadId);
+            Assert.IsTrue(_manager.IsLoaded);
+            Assert.IsFalse(_manager.IsLoading);
+        }
+
+        [Test]
+        public void LoadAllDomainsAsync_CircularDependency_FaultsTask()
+        {
+            _domainB.DependsOn = new[] { typeof(DomainC) };
+            _domainC.DependsOn = new[] { typeof(DomainB) };
+            RegisterAll();
+
+            Task task = _manager.LoadAllDomainsAsync();
+
+            Assert.IsTrue(task.IsFaulted);
+            Assert.IsInstanceOf<InvalidOperationException>(task.Exception.InnerException);
+            Assert.IsEmpty(_loadLog);
+            Assert.IsFalse(_manager.IsLoading);
+        }
+
+        [Test]
+        public void ReloadChangedDomains_ReloadsOnlyChangedDomains()
+        {
+            RegisterAll();
+            _manager.LoadAllDomains();
+
+            _domainA.HasChanged = true;
+            _domainC.HasChanged = true;
+            _domainC.Fails = true;
+
+            int reloaded = _manager.ReloadChangedDomains();
+
+            // DomainC's failed reload is logged and does not stop the others
+            Assert.AreEqual(1, reloaded);
+            Assert.AreEqual(2, _domainA.LoadCount);
+            Assert.AreEqual(1, _domainB.LoadCount);
+            Assert.AreEqual(2, _domainC.LoadCount);
+            Assert.AreEqual(1, _errors.Messages.Count);
+            Assert.AreEqual(0, _manager.ReloadChangedDomains());
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private void RegisterAll()
+        {
+            _manager.RegisterDomain<DomainA, TestData>(_domainA);
+            _manager.RegisterDomain<DomainB, TestData>(_domainB);
+            _manager.RegisterDomain<DomainC, TestData>(_domainC);
+        }
+
+        /// <returns>The id of the thread that stood in for the main thread.</returns>
+        private int LoadAsync(IProgress<DomainLoadProgress> progress)
+        {
+            using (ManualSynchronizationContext.Install(out ManualSynchronizationContext context))
+            {
+                Task task = _manager.LoadAllDomainsAsync(progress);
+                context.RunUntilCompleted(task);
+                task.GetAwaiter().GetResult();
+                return context.ThreadId;
+            }
+        }
+
+        private static int CountFailed(ProgressLog progress)
+        {
+            int failed = 0;
+
+            foreach (DomainLoadProgress report in progress.Reports)
+            {
+                if (!report.Succeeded) failed++;
+            }
+
+            return failed;
+        }
+
+        #endregion
+    }
+}
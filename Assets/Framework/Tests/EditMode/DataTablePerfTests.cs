@@ -0,0 +1,168 @@
+using System;
+using System.Collections.Generic;
+using HaroFramework.Data;
+using NUnit.Framework;
+
+namespace HaroFramework.Tests
+{
+    /// <summary>
+    /// Cost of DataTable id lookups over 100k rows against a Dictionary keyed by id.
+    /// </summary>
+    [TestFixture]
+    [Category("Performance")]
+    public class DataTablePerfTests
+    {
+        #region Nested Types
+
+        private sealed class PerfRow : BaseData
+        {
+            public int Value;
+
+            public override bool Validate()
+            {
+                return true;
+            }
+        }
+
+        #endregion
+
+        #region Fields
+
+        private const int RowCount = 100_000;
+        private const int Operations = 1_000_000;
+        private const int SparseIdStep = 7;
+
+        private int _sum;
+
+        #endregion
+
+        #region Tests
+
+        [Test]
+        public void GetData_DenseIds_DoesNotAllocate()
+        {
+            List<PerfRow> rows = CreateRows(RowCount, 1);
+            var table = new DataTable<PerfRow>(rows);
+            Dictionary<int, PerfRow> dictionary = CreateDictionary(rows);
+            int[] lookupIds = CreateLookupIds(table);
+
+            PerfResult result = Perf.Measure(Operations, () => LookupLoop(table, lookupIds));
+            PerfResult baseline = Perf.Measure(Operations, () => LookupLoop(dictionary, lookupIds));
+
+            Perf.Report("DataTable.GetData, 100k dense rows", result, 31);
+            Perf.Report("Dictionary lookup, 100k dense rows", baseline, 43);
+
+            Assert.IsTrue(table.IsDense);
+            Assert.AreEqual(0, result.BytesPerOperation);
+        }
+
+        [Test]
+        public void GetData_SparseIds_DoesNotAllocate()
+        {
+            List<PerfRow> rows = CreateRows(RowCount, SparseIdStep);
+            var table = new DataTable<PerfRow>(rows);
+            Dictionary<int, PerfRow> dictionary = CreateDictionary(rows);
+            int[] lookupIds = CreateLookupIds(table);
+
+            PerfResult result = Perf.Measure(Operations, () => LookupLoop(table, lookupIds));
+            PerfResult baseline = Perf.Measure(Operations, () => LookupLoop(dictionary, lookupIds));
+
+            Perf.Report("DataTable.GetData, 100k sparse rows", result);
+            Perf.Report("Dictionary lookup, 100k sparse rows", baseline, 90);
+
+            Assert.IsFalse(table.IsDense);
+            Assert.AreEqual(0, result.BytesPerOperation);
+            Assert.AreEqual(1 + SparseIdStep, table.GetData(1 + SparseIdStep).Id);
+            Assert.IsNull(table.GetData(2));
+        }
+
+        [Test]
+        public void Constructor_100kRows_ReportsMemory()
+        {
+            foreach (int idStep in new[] { 1, SparseIdStep })
+            {
+                List<PerfRow> rows = CreateRows(RowCount, idStep);
+                string layout = idStep == 1 ? "dense" : "sparse";
+
+                long tableBytes = MeasureRetainedBytes(() => new DataTable<PerfRow>(rows));
+                long dictionaryBytes = MeasureRetainedBytes(() => CreateDictionary(rows));
+
+                TestContext.WriteLine("[Perf] Memory, 100k {0} rows: DataTable {1:F0} KB, Dictionary {2:F0} KB",
+                    layout, tableBytes / 1024.0, dictionaryBytes / 1024.0);
+            }
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private static List<PerfRow> CreateRows(int count, int idStep)
+        {
+            var rows = new List<PerfRow>(count);
+
+            for (int i = 0; i < count; i++)
+            {
+                rows.Add(new PerfRow { Id = 1 + i * idStep, Value = i });
+            }
+
+            return rows;
+        }
+
+        private static int[] CreateLookupIds(DataTable<PerfRow> table)
+        {
+            // Random order so lookups are not served from a warm cache line
+            var random = new Random(1234);
+            var ids = new int[Operations];
+
+            for (int i = 0; i < ids.Length; i++)
+            {
+                ids[i] = table[random.Next(table.Count)].Id;
+            }
+
+            return ids;
+        }
+
+        private static Dictionary<int, PerfRow> CreateDictionary(List<PerfRow> rows)
+        {
+            var dictionary = new Dictionary<int, PerfRow>(rows.Count);
+
+            foreach (PerfRow row in rows)
+            {
+                dictionary.Add(row.Id, row);
+            }
+
+            return dictionary;
+        }
+
+        private static long MeasureRetainedBytes(Func<object> create)
+        {
+            GC.Collect();
+            GC.WaitForPendingFinalizers();
+            long before = GC.GetTotalMemory(true);
+
+            object instance = create();
+            long retained = GC.GetTotalMemory(true) - before;
+
+            GC.KeepAlive(instance);
+            return retained;
+        }
+
+        private void LookupLoop(Dictionary<int, PerfRow> dictionary, int[] lookupIds)
+        {
+            for (int i = 0; i < lookupIds.Length; i++)
+            {
+                _sum += dictionary[lookupIds[i]].Value;
+            }
+        }
+
+        private void LookupLoop(DataTable<PerfRow> table, int[] lookupIds)
+        {
+            for (int i = 0; i < lookupIds.Length; i++)
+            {
+                _sum += table.GetData(lookupIds[i]).Value;
+            }
+        }
+
+        #endregion
+    }
+}
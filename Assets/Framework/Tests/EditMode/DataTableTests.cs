@@ -0,0 +1,258 @@
+using System;
+using System.Collections.Generic;
+using HaroFramework.Core;
+using HaroFramework.Data;
+using NUnit.Framework;
+
+namespace HaroFramework.Tests
+{
+    /// <summary>
+    /// Id lookups, secondary indexes and validation of DataTable and TableDomain.
+    /// </summary>
+    [TestFixture]
+    public class DataTableTests
+    {
+        #region Nested Types
+
+        private sealed class ItemRow : BaseData
+        {
+            [DataIndex]
+            public int Level;
+
+            public bool IsValid = true;
+            public int ValidateCount;
+
+            [DataIndex("Kind")]
+            public string Category { get; set; }
+
+            public override bool Validate()
+            {
+                ValidateCount++;
+                return IsValid;
+            }
+        }
+
+        private sealed class ItemDomain : TableDomain<ItemRow>
+        {
+            private readonly List<ItemRow> _rows;
+
+            public ItemDomain(List<ItemRow> rows)
+            {
+                _rows = rows;
+            }
+
+            public override string DomainName => "Items";
+
+            protected override IEnumerable<ItemRow> LoadRows()
+            {
+                return _rows;
+            }
+        }
+
+        #endregion
+
+        #region Tests
+
+        [Test]
+        public void Constructor_IdRangeAtTwiceRowCount_UsesDenseLookup()
+        {
+            // 4 rows spanning ids 1..8: the range is exactly twice the row count
+            var table = new DataTable<ItemRow>(CreateRows(1, 3, 5, 8));
+
+            Assert.IsTrue(table.IsDense);
+            AssertLookups(table, new[] { 1, 3, 5, 8 }, new[] { 0, 2, 4, 7, 9, int.MinValue, int.MaxValue });
+        }
+
+        [Test]
+        public void Constructor_IdRangeAboveTwiceRowCount_UsesDictionaryLookup()
+        {
+            var table = new DataTable<ItemRow>(CreateRows(1, 3, 5, 9));
+
+            Assert.IsFalse(table.IsDense);
+            AssertLookups(table, new[] { 1, 3, 5, 9 }, new[] { 0, 2, 8, 10, int.MinValue, int.MaxValue });
+        }
+
+        [Test]
+        public void GetData_NegativeIds_AreFoundInBothLookups()
+        {
+            var dense = new DataTable<ItemRow>(CreateRows(-5, -3, 0, 2));
+            var sparse = new DataTable<ItemRow>(CreateRows(int.MinValue, -1000, 0, int.MaxValue));
+
+            Assert.IsTrue(dense.IsDense);
+            Assert.IsFalse(sparse.IsDense);
+            AssertLookups(dense, new[] { -5, -3, 0, 2 }, new[] { -6, -4, -1, 3 });
+            AssertLookups(sparse, new[] { int.MinValue, -1000, 0, int.MaxValue }, new[] { -999, 1, int.MinValue + 1 });
+        }
+
+        [Test]
+        public void Constructor_RowsOutOfOrder_AreStoredInIdOrder()
+        {
+            var table = new DataTable<ItemRow>(CreateRows(30, 10, 20));
+
+            Assert.AreEqual(10, table[0].Id);
+            Assert.AreEqual(20, table[1].Id);
+            Assert.AreEqual(30, table[2].Id);
+            Assert.AreEqual(1, table.IndexOf(20));
+            Assert.AreEqual(-1, table.IndexOf(15));
+        }
+
+        [Test]
+        public void Constructor_DuplicateIds_Throws()
+        {
+            var exception = Assert.Throws<ArgumentException>(() => new DataTable<ItemRow>(CreateRows(1, 2, 2)));
+
+            StringAssert.Contains("Duplicate id 2", exception.Message);
+        }
+
+        [Test]
+        public void Constructor_EmptyRows_FindsNothing()
+        {
+            var table = new DataTable<ItemRow>(new ItemRow[0]);
+
+            Assert.AreEqual(0, table.Count);
+            Assert.IsNull(table.GetData(0));
+            Assert.IsFalse(table.TryGetData(1, out _));
+        }
+
+        [Test]
+        public void AttributeIndex_FindAndFindAll_ReturnRowsInTableOrder()
+        {
+            var table = new DataTable<ItemRow>(CreateItems());
+            DataIndex<ItemRow, int> levels = table.GetIndex<int>(nameof(ItemRow.Level));
+
+            DataIndex<ItemRow, int>.RowRange level2 = levels.FindAll(2);
+
+            Assert.AreEqual(3, level2.Count);
+            Assert.AreEqual(2, level2[0].Id);
+            Assert.AreEqual(4, level2[1].Id);
+            Assert.AreEqual(6, level2[2].Id);
+            Assert.AreEqual(2, levels.Find(2).Id);
+            Assert.IsNull(levels.Find(4));
+            Assert.AreEqual(0, levels.FindAll(4).Count);
+        }
+
+        [Test]
+        public void AttributeIndex_Range_IsInclusiveAndOrderedByKey()
+        {
+            var table = new DataTable<ItemRow>(CreateItems());
+            DataIndex<ItemRow, int> levels = table.GetIndex<int>(nameof(ItemRow.Level));
+            var ids = new List<int>();
+
+            foreach (ItemRow row in levels.Range(2, 3))
+            {
+                ids.Add(row.Id);
+            }
+
+            CollectionAssert.AreEqual(new[] { 2, 4, 6, 5 }, ids);
+            Assert.AreEqual(6, levels.Range(int.MinValue, int.MaxValue).Count);
+            Assert.AreEqual(0, levels.Range(3, 2).Count);
+            Assert.AreEqual(0, levels.Range(10, 20).Count);
+        }
+
+        [Test]
+        public void AttributeIndex_NamedPropertyIndex_UsesAttributeName()
+        {
+            var table = new DataTable<ItemRow>(CreateItems());
+
+            Assert.IsTrue(table.HasIndex("Kind"));
+            Assert.IsFalse(table.HasIndex(nameof(ItemRow.Category)));
+
+            DataIndex<ItemRow, string>.RowRange weapons = table.GetIndex<string>("Kind").FindAll("Weapon");
+
+            Assert.AreEqual(2, weapons.Count);
+            Assert.AreEqual(1, weapons[0].Id);
+            Assert.AreEqual(4, weapons[1].Id);
+            Assert.Throws<KeyNotFoundException>(() => table.GetIndex<int>("Missing"));
+        }
+
+        [Test]
+        public void LoadData_ValidatesEachRowOnce()
+        {
+            List<ItemRow> rows = CreateItems();
+            rows[1].IsValid = false;
+            var domain = new ItemDomain(rows);
+
+            domain.LoadData();
+            domain.GetData(1);
+            domain.Table.GetIndex<int>(nameof(ItemRow.Level)).FindAll(2);
+
+            foreach (ItemRow row in domain.GetAllData())
+            {
+                Assert.AreEqual(1, row.ValidateCount);
+            }
+
+            Assert.AreEqual(rows.Count, domain.Table.Count);
+        }
+
+        [Test]
+        public void Foreach_OverDomain_DoesNotAllocate()
+        {
+            var domain = new ItemDomain(CreateItems());
+            domain.LoadData();
+            int sum = 0;
+
+            long bytes = Perf.MeasureAllocatedBytes(() =>
+            {
+                foreach (ItemRow row in domain)
+                {
+                    sum += row.Id;
+                }
+
+                foreach (ItemRow row in domain.AsSpan())
+                {
+                    sum += row.Id;
+                }
+            });
+
+            Assert.AreEqual(0, bytes);
+            Assert.AreEqual(2 * 2 * 21, sum);
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private static List<ItemRow> CreateRows(params int[] ids)
+        {
+            var rows = new List<ItemRow>(ids.Length);
+
+            foreach (int id in ids)
+            {
+                rows.Add(new ItemRow { Id = id });
+            }
+
+            return rows;
+        }
+
+        private static List<ItemRow> CreateItems()
+        {
+            return new List<ItemRow>
+            {
+                new ItemRow { Id = 6, Level = 2, Category = "Armor" },
+                new ItemRow { Id = 1, Level = 1, Category = "Weapon" },
+                new ItemRow { Id = 5, Level = 3, Category = "Potion" },
+                new ItemRow { Id = 2, Level = 2, Category = "Armor" },
+                new ItemRow { Id = 4, Level = 2, Category = "Weapon" },
+                new ItemRow { Id = 3, Level = 1, Category = "Potion" }
+            };
+        }
+
+        private static void AssertLookups(DataTable<ItemRow> table, int[] presentIds, int[] missingIds)
+        {
+            foreach (int id in presentIds)
+            {
+                Assert.AreEqual(id, table.GetData(id).Id);
+                Assert.IsTrue(table.Contains(id));
+            }
+
+            foreach (int id in missingIds)
+            {
+                Assert.IsNull(table.GetData(id), $"Id {id} should be missing.");
+                Assert.IsFalse(table.TryGetData(id, out ItemRow row));
+                Assert.IsNull(row);
+            }
+        }
+
+        #endregion
+    }
+}
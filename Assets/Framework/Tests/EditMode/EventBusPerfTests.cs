@@ -0,0 +1,226 @@
+using System;
+using System.Collections.Generic;
+using HaroFramework.Core;
+using NUnit.Framework;
+using UnityEngine;
+using Object = UnityEngine.Object;
+
+namespace HaroFramework.Tests
+{
+    /// <summary>
+    /// Cost of EventBus.Publish with FrameworkStats on and off, and against the previous implementation.
+    /// </summary>
+    [TestFixture]
+    [Category("Performance")]
+    public class EventBusPerfTests
+    {
+        #region Nested Types
+
+        private struct PerfEvent : IGameEvent
+        {
+            public int Value;
+        }
+
+        private sealed class Counter
+        {
+            public int Sum;
+
+            public void OnEvent(PerfEvent gameEvent)
+            {
+                Sum += gameEvent.Value;
+            }
+        }
+
+        /// <summary>
+        /// The List&lt;Delegate&gt; implementation EventBus.Publish replaced, kept as the comparison baseline.
+        /// </summary>
+        private sealed class LegacyEventBus
+        {
+            private readonly Dictionary<Type, List<Delegate>> _eventHandlers = new Dictionary<Type, List<Delegate>>();
+
+            public void Subscribe<T>(Action<T> handler) where T : IGameEvent
+            {
+                Type eventType = typeof(T);
+
+                if (!_eventHandlers.ContainsKey(eventType))
+                {
+                    _eventHandlers[eventType] = new List<Delegate>();
+                }
+
+                if (!_eventHandlers[eventType].Contains(handler))
+                {
+                    _eventHandlers[eventType].Add(handler);
+                }
+            }
+
+            public void Publish<T>(T gameEvent) where T : IGameEvent
+            {
+                Type eventType = typeof(T);
+
+                if (_eventHandlers.ContainsKey(eventType))
+                {
+                    List<Delegate> handlers = new List<Delegate>(_eventHandlers[eventType]);
+
+                    foreach (Delegate handler in handlers)
+                    {
+                        (handler as Action<T>)?.Invoke(gameEvent);
+                    }
+                }
+            }
+        }
+
+        #endregion
+
+        #region Fields
+
+        private const int Operations = 200_000;
+        private static readonly int[] HandlerCounts = { 1, 4, 16 };
+
+        private GameObject _host;
+        private EventBus _bus;
+        private int _sum;
+
+        #endregion
+
+        #region Setup
+
+        [SetUp]
+        public void SetUp()
+        {
+            _host = new GameObject(nameof(EventBusPerfTests));
+            _bus = _host.AddComponent<EventBus>();
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            FrameworkStats.IsEnabled = true;
+            Object.DestroyImmediate(_host);
+        }
+
+        #endregion
+
+        #region Tests
+
+        [Test]
+        public void Publish_WithStatsOnAndOff_DoesNotAllocate()
+        {
+            _bus.Subscribe<PerfEvent>(OnEvent);
+            _bus.Subscribe<PerfEvent>(OnEventByReference);
+
+            FrameworkStats.IsEnabled = false;
+            PerfResult statsOff = Perf.Measure(Operations, PublishLoop);
+
+            FrameworkStats.IsEnabled = true;
+            PerfResult statsOn = Perf.Measure(Operations, PublishLoop);
+
+            Perf.Report("EventBus.Publish, 2 handlers, stats off", statsOff, 30);
+            Perf.Report("EventBus.Publish, 2 handlers, stats on", statsOn, 140);
+
+            Assert.AreEqual(0, statsOff.BytesPerOperation);
+            Assert.AreEqual(0, statsOn.BytesPerOperation);
+            Assert.AreEqual(2, FrameworkStats.GetEventStats<PerfEvent>().HandlerCount);
+        }
+
+        [Test]
+        public void Publish_PerHandlerCost_BeatsLegacyImplementation()
+        {
+            FrameworkStats.IsEnabled = false;
+
+            foreach (int handlerCount in HandlerCounts)
+            {
+                var bus = _host.AddComponent<EventBus>();
+                var legacyBus = new LegacyEventBus();
+                var gameEvent = new PerfEvent { Value = 1 };
+
+                for (int i = 0; i < handlerCount; i++)
+                {
+                    var counter = new Counter();
+                    bus.Subscribe<PerfEvent>(counter.OnEvent);
+                    legacyBus.Subscribe<PerfEvent>(counter.OnEvent);
+                }
+
+                PerfResult current = Perf.Measure(Operations, () =>
+                {
+                    for (int i = 0; i < Operations; i++)
+                    {
+                        bus.Publish(in gameEvent);
+                    }
+                });
+
+                PerfResult legacy = Perf.Measure(Operations, () =>
+                {
+                    for (int i = 0; i < Operations; i++)
+                    {
+                        legacyBus.Publish(gameEvent);
+                    }
+                });
+
+                Perf.Report($"EventBus.Publish, {handlerCount} handlers, per handler", PerHandler(current, handlerCount), 12);
+                Perf.Report($"Legacy EventBus.Publish, {handlerCount} handlers, per handler", PerHandler(legacy, handlerCount), 50);
+
+                // The baselines put it about 4x ahead; asserting only "faster" leaves room for timing noise
+                Assert.Less(current.NanosecondsPerOperation, legacy.NanosecondsPerOperation,
+                    $"{handlerCount} handlers: current path is not faster than the legacy one.");
+                Assert.AreEqual(0, current.BytesPerOperation);
+                Assert.Greater(legacy.BytesPerOperation, 0);
+            }
+        }
+
+        [Test]
+        public void Publish_UnchangedHandlerList_DoesNotAllocate()
+        {
+            var first = new Counter();
+            var second = new Counter();
+            var gameEvent = new PerfEvent { Value = 1 };
+
+            _bus.Subscribe<PerfEvent>(first.OnEvent);
+            _bus.Subscribe<PerfEvent>(second.OnEvent);
+            _bus.Unsubscribe<PerfEvent>(first.OnEvent);
+            _bus.Subscribe<PerfEvent>(first.OnEvent);
+
+            // The warm-up publish rebuilds the snapshot once; later publishes reuse it
+            long bytes = Perf.MeasureAllocatedBytes(() =>
+            {
+                for (int i = 0; i < 1000; i++)
+                {
+                    _bus.Publish(in gameEvent);
+                }
+            });
+
+            Assert.AreEqual(0, bytes);
+            Assert.AreEqual(second.Sum, first.Sum);
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private static PerfResult PerHandler(PerfResult result, int handlerCount)
+        {
+            return new PerfResult(result.NanosecondsPerOperation / handlerCount, result.BytesPerOperation);
+        }
+
+        private void PublishLoop()
+        {
+            var gameEvent = new PerfEvent { Value = 1 };
+
+            for (int i = 0; i < Operations; i++)
+            {
+                _bus.Publish(in gameEvent);
+            }
+        }
+
+        private void OnEvent(PerfEvent gameEvent)
+        {
+            _sum += gameEvent.Value;
+        }
+
+        private void OnEventByReference(in PerfEvent gameEvent)
+        {
+            _sum += gameEvent.Value;
+        }
+
+        #endregion
+    }
+}
@@ -0,0 +1,183 @@
+using System.Collections.Generic;
+using HaroFramework.Core;
+using NUnit.Framework;
+using UnityEngine;
+
+namespace HaroFramework.Tests
+{
+    /// <summary>
+    /// Queue limit and priority behavior of coalesced EventBus events.
+    /// </summary>
+    [TestFixture]
+    public class EventBusQueueTests
+    {
+        #region Nested Types
+
+        private struct PlainEvent : IGameEvent
+        {
+            public int Value;
+        }
+
+        private struct CoalescedEvent : IGameEvent
+        {
+            public int Value;
+        }
+
+        #endregion
+
+        #region Fields
+
+        private GameObject _host;
+        private EventBus _bus;
+        private List<string> _published;
+
+        #endregion
+
+        #region Setup
+
+        [SetUp]
+        public void SetUp()
+        {
+            _host = new GameObject(nameof(EventBusQueueTests));
+            _bus = _host.AddComponent<EventBus>();
+            _published = new List<string>();
+
+            _bus.Subscribe<PlainEvent>(gameEvent => _published.Add($"Plain {gameEvent.Value}"));
+            _bus.Subscribe<CoalescedEvent>(gameEvent => _published.Add($"Coalesced {gameEvent.Value}"));
+            _bus.EnableCoalescing<CoalescedEvent>((pending, next) => new CoalescedEvent { Value = pending.Value + next.Value });
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            Object.DestroyImmediate(_host);
+        }
+
+        #endregion
+
+        #region Tests
+
+        [Test]
+        public void Enqueue_CoalescedEventWhenQueueIsFull_IsDropped()
+        {
+            _bus.MaxQueuedEvents = 1;
+
+            Assert.IsTrue(_bus.Enqueue(new PlainEvent { Value = 1 }));
+            Assert.IsFalse(_bus.Enqueue(new CoalescedEvent { Value = 1 }));
+
+            Assert.AreEqual(1, _bus.QueuedEventCount);
+            Assert.AreEqual(1, _bus.DroppedEventCount);
+
+            _bus.DispatchQueued();
+
+            CollectionAssert.AreEqual(new[] { "Plain 1" }, _published);
+        }
+
+        [Test]
+        public void Enqueue_MergeIntoPendingEventWhenQueueIsFull_IsKept()
+        {
+            _bus.MaxQueuedEvents = 1;
+
+            Assert.IsTrue(_bus.Enqueue(new CoalescedEvent { Value = 1 }));
+            Assert.IsTrue(_bus.Enqueue(new CoalescedEvent { Value = 2 }));
+
+            Assert.AreEqual(1, _bus.QueuedEventCount);
+            Assert.AreEqual(0, _bus.DroppedEventCount);
+            Assert.AreEqual(1, _bus.CoalescedEventCount);
+
+            _bus.DispatchQueued();
+
+            CollectionAssert.AreEqual(new[] { "Coalesced 3" }, _published);
+        }
+
+        [Test]
+        public void Enqueue_CoalescedEventAtHigherPriority_PromotesPendingEvent()
+        {
+            _bus.Enqueue(new CoalescedEvent { Value = 1 }, EventPriority.Low);
+            _bus.Enqueue(new PlainEvent { Value = 1 }, EventPriority.Normal);
+            _bus.Enqueue(new CoalescedEvent { Value = 2 }, EventPriority.High);
+
+            int dispatched = _bus.DispatchQueued();
+
+            CollectionAssert.AreEqual(new[] { "Coalesced 3", "Plain 1" }, _published);
+            Assert.AreEqual(2, dispatched);
+            Assert.AreEqual(0, _bus.QueuedEventCount);
+        }
+
+        [Test]
+        public void Enqueue_CoalescedEventAtLowerPriority_KeepsPendingChannel()
+        {
+            _bus.Enqueue(new CoalescedEvent { Value = 1 }, EventPriority.High);
+            _bus.Enqueue(new CoalescedEvent { Value = 2 }, EventPriority.Low);
+
+            // Only the High channel is exempt from the budget, so a spent budget still delivers the merged event
+            _bus.DispatchQueued(double.Epsilon);
+
+            CollectionAssert.AreEqual(new[] { "Coalesced 3" }, _published);
+            Assert.AreEqual(0, _bus.QueuedEventCount);
+        }
+
+        [Test]
+        public void Enqueue_AfterPromotedEventIsDispatched_StartsNewPendingEvent()
+        {
+            _bus.Enqueue(new CoalescedEvent { Value = 1 }, EventPriority.Low);
+            _bus.Enqueue(new CoalescedEvent { Value = 2 }, EventPriority.High);
+            _bus.DispatchQueued();
+
+            _bus.Enqueue(new CoalescedEvent { Value = 5 }, EventPriority.Normal);
+            _bus.DispatchQueued();
+
+            CollectionAssert.AreEqual(new[] { "Coalesced 3", "Coalesced 5" }, _published);
+        }
+
+        [Test]
+        public void Enqueue_PromotionWhenQueueIsFull_StaysWithinLimit()
+        {
+            _bus.MaxQueuedEvents = 2;
+
+            _bus.Enqueue(new CoalescedEvent { Value = 1 }, EventPriority.Low);
+            _bus.Enqueue(new PlainEvent { Value = 1 }, EventPriority.Normal);
+
+            Assert.IsTrue(_bus.Enqueue(new CoalescedEvent { Value = 2 }, EventPriority.Normal));
+            Assert.IsTrue(_bus.Enqueue(new CoalescedEvent { Value = 4 }, EventPriority.High));
+
+            // The superseded entries are not counted, so the queue is still exactly full
+            Assert.AreEqual(2, _bus.QueuedEventCount);
+            Assert.IsFalse(_bus.Enqueue(new PlainEvent { Value = 2 }));
+
+            _bus.DispatchQueued();
+
+            CollectionAssert.AreEqual(new[] { "Coalesced 7", "Plain 1" }, _published);
+            Assert.AreEqual(0, _bus.QueuedEventCount);
+            Assert.IsTrue(_bus.Enqueue(new PlainEvent { Value = 3 }));
+            Assert.AreEqual(1, _bus.QueuedEventCount);
+        }
+
+        [Test]
+        public void ClearQueue_WithSupersededEntries_ResetsCount()
+        {
+            _bus.Enqueue(new CoalescedEvent { Value = 1 }, EventPriority.Low);
+            _bus.Enqueue(new CoalescedEvent { Value = 2 }, EventPriority.High);
+
+            _bus.ClearQueue();
+
+            Assert.AreEqual(0, _bus.QueuedEventCount);
+            Assert.AreEqual(0, _bus.DispatchQueued());
+        }
+
+        [Test]
+        public void EnableCoalescing_CalledAgain_KeepsPendingEvent()
+        {
+            _bus.Enqueue(new CoalescedEvent { Value = 1 });
+            _bus.EnableCoalescing<CoalescedEvent>((pending, next) => new CoalescedEvent { Value = pending.Value * 10 + next.Value });
+            _bus.Enqueue(new CoalescedEvent { Value = 2 });
+
+            _bus.DispatchQueued();
+
+            CollectionAssert.AreEqual(new[] { "Coalesced 12" }, _published);
+            Assert.AreEqual(0, _bus.QueuedEventCount);
+        }
+
+        #endregion
+    }
+}
@@ -0,0 +1,471 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+using HaroFramework.Core;
+using NUnit.Framework;
+using UnityEngine;
+using Object = UnityEngine.Object;
+
+namespace HaroFramework.Tests
+{
+    /// <summary>
+    /// Dependency order, threading and cancellation of ModuleBootstrapper, and the FrameworkManager boot pipeline.
+    /// </summary>
+    [TestFixture]
+    public class FrameworkBootTests
+    {
+        #region Nested Types
+
+        private abstract class TestModule : BaseModule
+        {
+            private readonly List<string> _log;
+
+            public Type[] DependsOn = Array.Empty<Type>();
+            public int Order;
+            public bool IsWorker;
+            public bool Fails;
+            public ManualResetEventSlim Gate;
+            public readonly ManualResetEventSlim Started = new ManualResetEventSlim(false);
+            public int InitializeCount;
+            public int InitializeThreadId;
+            public int ShutdownCount;
+
+            protected TestModule(List<string> log)
+            {
+                _log = log;
+            }
+
+            public override string ModuleName => GetType().Name;
+
+            public override int Priority => Order;
+
+            public override IReadOnlyList<Type> Dependencies => DependsOn;
+
+            public override bool InitializeOnMainThread => !IsWorker;
+
+            public override void Initialize()
+            {
+                InitializeThreadId = Thread.CurrentThread.ManagedThreadId;
+                Interlocked.Increment(ref InitializeCount);
+                Started.Set();
+                Gate?.Wait(Timeout);
+                Add($"Initialize {ModuleName}");
+
+                if (Fails)
+                {
+                    throw new InvalidOperationException($"{ModuleName} failed.");
+                }
+            }
+
+            public override void Shutdown()
+            {
+                ShutdownCount++;
+                Add($"Shutdown {ModuleName}");
+            }
+
+            private void Add(string message)
+            {
+                lock (_log)
+                {
+                    _log.Add(message);
+                }
+            }
+        }
+
+        private sealed class ModuleA : TestModule
+        {
+            public ModuleA(List<string> log) : base(log)
+            {
+            }
+        }
+
+        private sealed class ModuleB : TestModule
+        {
+            public ModuleB(List<string> log) : base(log)
+            {
+            }
+        }
+
+        private sealed class ModuleC : TestModule
+        {
+            public ModuleC(List<string> log) : base(log)
+            {
+            }
+        }
+
+        private sealed class ModuleD : TestModule
+        {
+            public ModuleD(List<string> log) : base(log)
+            {
+            }
+        }
+
+        private sealed class ErrorSink : ILogSink
+        {
+            public readonly List<string> Messages = new List<string>();
+
+            public void Write(in LogEntry entry)
+            {
+                if (entry.Level != LogLevel.Error) return;
+
+                lock (Messages)
+                {
+                    Messages.Add(entry.Message);
+                }
+            }
+
+            public void Flush()
+            {
+            }
+        }
+
+        #endregion
+
+        #region Fields
+
+        private static readonly TimeSpan Timeout = TimeSpan.FromSeconds(10);
+
+        private readonly List<ILogSink> _savedSinks = new List<ILogSink>();
+        private List<string> _log;
+        private ErrorSink _errors;
+        private bool _wasLoggingEnabled;
+        private LogLevel _previousMinimumLevel;
+        private ModuleA _moduleA;
+        private ModuleB _moduleB;
+        private ModuleC _moduleC;
+        private ModuleD _moduleD;
+        private FrameworkConfig _config;
+        private GameObject _host;
+        private FrameworkManager _manager;
+
+        #endregion
+
+        #region Setup
+
+        [SetUp]
+        public void SetUp()
+        {
+            // Expected module failures go to a recording sink instead of the console
+            FrameworkLogger.Flush();
+            _savedSinks.Clear();
+            _savedSinks.AddRange(FrameworkLogger.Sinks);
+
+            foreach (ILogSink sink in _savedSinks)
+            {
+                FrameworkLogger.RemoveSink(sink);
+            }
+
+            _errors = new ErrorSink();
+            FrameworkLogger.AddSink(_errors);
+            _wasLoggingEnabled = FrameworkLogger.IsEnabled;
+            _previousMinimumLevel = FrameworkLogger.MinimumLevel;
+
+            _log = new List<string>();
+            _moduleA = new ModuleA(_log);
+            _moduleB = new ModuleB(_log);
+            _moduleC = new ModuleC(_log);
+            _moduleD = new ModuleD(_log);
+
+            // Only the module pipeline is under test, so no core system singletons are created
+            _config = ScriptableObject.CreateInstance<FrameworkConfig>();
+            _config.EnableEventBus = false;
+            _config.EnableServiceLocator = false;
+            _config.EnableDataManager = false;
+            _config.LogBootReport = false;
+
+            _host = new GameObject(nameof(FrameworkBootTests));
+            _manager = _host.AddComponent<FrameworkManager>();
+            _manager.Config = _config;
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            foreach (TestModule module in new TestModule[] { _moduleA, _moduleB, _moduleC, _moduleD })
+            {
+                module.Gate?.Set();
+            }
+
+            Object.DestroyImmediate(_host);
+            Object.DestroyImmediate(_config);
+
+            FrameworkLogger.RemoveSink(_errors);
+
+            foreach (ILogSink sink in _savedSinks)
+            {
+                FrameworkLogger.AddSink(sink);
+            }
+
+            FrameworkLogger.IsEnabled = _wasLoggingEnabled;
+            FrameworkLogger.MinimumLevel = _previousMinimumLevel;
+        }
+
+        #endregion
+
+        #region Tests
+
+        [Test]
+        public void Run_InitializesDependenciesFirst_ThenByPriority()
+        {
+            _moduleA.Order = 2;
+            _moduleB.Order = 1;
+            _moduleB.DependsOn = new[] { typeof(ModuleA) };
+            _moduleC.Order = 0;
+            _moduleC.DependsOn = new[] { typeof(ModuleB) };
+            _moduleD.Order = 1;
+
+            ModuleBootstrapper bootstrapper = CreateBootstrapper(_moduleC, _moduleB, _moduleA, _moduleD);
+            bootstrapper.Run();
+
+            // D and A are ready at the start, so priority decides between them; B and C wait for their dependency
+            CollectionAssert.AreEqual(
+                new[] { "Initialize ModuleD", "Initialize ModuleA", "Initialize ModuleB", "Initialize ModuleC" }, _log);
+            CollectionAssert.AreEqual(new IModule[] { _moduleD, _moduleA, _moduleB, _moduleC }, bootstrapper.InitializedModules);
+        }
+
+        [Test]
+        public void Constructor_CircularDependency_Throws()
+        {
+            _moduleA.DependsOn = new[] { typeof(ModuleC) };
+            _moduleB.DependsOn = new[] { typeof(ModuleA) };
+            _moduleC.DependsOn = new[] { typeof(ModuleB) };
+
+            var exception = Assert.Throws<InvalidOperationException>(() => CreateBootstrapper(_moduleA, _moduleB, _moduleC));
+
+            StringAssert.Contains("Circular module dependency detected", exception.Message);
+            Assert.AreEqual(0, _moduleA.InitializeCount + _moduleB.InitializeCount + _moduleC.InitializeCount);
+        }
+
+        [Test]
+        public void Run_WorkerModule_InitializesOnThreadPool()
+        {
+            _moduleB.IsWorker = true;
+            _moduleC.DependsOn = new[] { typeof(ModuleB) };
+
+            var report = new BootReport(Time.frameCount);
+            new ModuleBootstrapper(new IModule[] { _moduleA, _moduleB, _moduleC }, report).Run();
+
+            int mainThreadId = Thread.CurrentThread.ManagedThreadId;
+            Assert.AreEqual(mainThreadId, _moduleA.InitializeThreadId);
+            Assert.AreNotEqual(mainThreadId, _moduleB.InitializeThreadId);
+            Assert.AreEqual(mainThreadId, _moduleC.InitializeThreadId);
+
+            BootTiming workerEntry = FindEntry(report, "ModuleB");
+            Assert.IsFalse(workerEntry.IsMainThread);
+            Assert.IsTrue(workerEntry.Succeeded);
+            Assert.AreEqual(BootPhase.Modules, workerEntry.Phase);
+            Assert.IsTrue(FindEntry(report, "ModuleC").IsMainThread);
+        }
+
+        [Test]
+        public void Run_FailedOrMissingDependency_SkipsDependents()
+        {
+            _moduleA.Fails = true;
+            _moduleB.DependsOn = new[] { typeof(ModuleA) };
+            _moduleC.DependsOn = new[] { typeof(ModuleD) };
+
+            var report = new BootReport(Time.frameCount);
+            var bootstrapper = new ModuleBootstrapper(new IModule[] { _moduleA, _moduleB, _moduleC }, report);
+            bootstrapper.Run();
+
+            Assert.IsEmpty(bootstrapper.InitializedModules);
+            Assert.AreEqual(0, _moduleB.InitializeCount);
+            Assert.AreEqual(0, _moduleC.InitializeCount);
+            Assert.AreEqual(3, report.Entries.Count);
+            Assert.IsFalse(FindEntry(report, "ModuleB").Succeeded);
+            CollectionAssert.Contains(_errors.Messages, "Skipped module ModuleB: dependency ModuleA failed to initialize.");
+            CollectionAssert.Contains(_errors.Messages, "Failed to initialize module ModuleC: dependency ModuleD is not registered.");
+        }
+
+        [Test]
+        public void RunAsync_Cancelled_WaitsForRunningWorkerModules()
+        {
+            _moduleA.IsWorker = true;
+            _moduleA.Gate = new ManualResetEventSlim(false);
+            _moduleB.IsWorker = true;
+            _moduleB.Gate = new ManualResetEventSlim(false);
+            _moduleC.DependsOn = new[] { typeof(ModuleA) };
+
+            ModuleBootstrapper bootstrapper = CreateBootstrapper(_moduleA, _moduleB, _moduleC);
+
+            using (var cancellation = new CancellationTokenSource())
+            using (ManualSynchronizationContext.Install(out ManualSynchronizationContext context))
+            {
+                Task boot = bootstrapper.RunAsync(0, cancellation.Token);
+                Assert.IsTrue(_moduleA.Started.Wait(Timeout));
+                Assert.IsTrue(_moduleB.Started.Wait(Timeout));
+
+                // A finishing wakes the bootstrapper, which sees the cancellation while B is still running
+                cancellation.Cancel();
+                _moduleA.Gate.Set();
+                context.RunFor(200);
+                Assert.IsFalse(boot.IsCompleted);
+
+                _moduleB.Gate.Set();
+                context.RunUntilCompleted(boot);
+                Assert.IsTrue(boot.IsCanceled);
+            }
+
+            CollectionAssert.AreEquivalent(new IModule[] { _moduleA, _moduleB }, bootstrapper.InitializedModules);
+            Assert.AreEqual(0, _moduleC.InitializeCount);
+        }
+
+        [Test]
+        public void Initialize_RecordsPhasesBootStepsAndModules()
+        {
+            _moduleB.IsWorker = true;
+            _moduleB.DependsOn = new[] { typeof(ModuleA) };
+            _manager.AddBootStep(BootPhase.Services, "RegisterServices", () => { });
+            _manager.AddBootStep(BootPhase.Services, "BrokenStep", () => throw new InvalidOperationException("Broken"));
+            _manager.RegisterModule(_moduleA);
+            _manager.RegisterModule(_moduleB);
+
+            _manager.Initialize();
+
+            BootReport report = _manager.BootReport;
+            Assert.IsTrue(_manager.IsInitialized);
+            Assert.IsTrue(report.IsComplete);
+            Assert.GreaterOrEqual(report.FrameCount, 1);
+            CollectionAssert.AreEqual(new[] { "CoreSystems", "Data", "Services", "Modules" }, PhaseNames(report));
+
+            foreach (BootTiming phase in report.Phases)
+            {
+                Assert.IsTrue(phase.Succeeded, phase.Name);
+            }
+
+            Assert.AreEqual(BootPhase.Services, FindEntry(report, "RegisterServices").Phase);
+            Assert.IsTrue(FindEntry(report, "RegisterServices").Succeeded);
+            Assert.IsFalse(FindEntry(report, "BrokenStep").Succeeded);
+
+            BootTiming dependency = FindEntry(report, "ModuleA");
+            BootTiming dependent = FindEntry(report, "ModuleB");
+            Assert.IsTrue(dependency.IsMainThread);
+            Assert.IsFalse(dependent.IsMainThread);
+            Assert.GreaterOrEqual(dependent.StartMilliseconds, dependency.StartMilliseconds + dependency.ElapsedMilliseconds);
+
+            string table = report.ToString();
+            StringAssert.Contains("Boot completed", table);
+            StringAssert.Contains("ModuleB", table);
+            StringAssert.Contains("worker", table);
+            StringAssert.Contains("FAILED", table);
+        }
+
+        [Test]
+        public void Shutdown_AfterModuleFailure_ShutsDownOnlyInitializedModules()
+        {
+            _moduleB.Fails = true;
+            _moduleC.DependsOn = new[] { typeof(ModuleB) };
+            RegisterAll();
+
+            _manager.Initialize();
+            _manager.Shutdown();
+
+            Assert.IsFalse(_manager.IsInitialized);
+            CollectionAssert.AreEqual(new[] { "Shutdown ModuleD", "Shutdown ModuleA" }, ShutdownLog());
+            Assert.AreEqual(0, _moduleB.ShutdownCount);
+            Assert.AreEqual(0, _moduleC.InitializeCount);
+            Assert.AreEqual(0, _moduleC.ShutdownCount);
+        }
+
+        [Test]
+        public void Shutdown_DuringAsyncBoot_ShutsDownModulesInitializedBeforeCancellation()
+        {
+            _moduleB.IsWorker = true;
+            _moduleB.Gate = new ManualResetEventSlim(false);
+            _moduleC.DependsOn = new[] { typeof(ModuleB) };
+            _manager.RegisterModule(_moduleA);
+            _manager.RegisterModule(_moduleB);
+            _manager.RegisterModule(_moduleC);
+
+            using (ManualSynchronizationContext.Install(out ManualSynchronizationContext context))
+            {
+                Task boot = _manager.InitializeAsync();
+                Assert.IsTrue(_moduleB.Started.Wait(Timeout));
+                Assert.IsTrue(_manager.IsBooting);
+
+                // Shutdown cancels the boot, which still waits for B before shutting down
+                _manager.Shutdown();
+                _moduleB.Gate.Set();
+                context.RunUntilCompleted(boot);
+                Assert.IsTrue(boot.IsCanceled);
+            }
+
+            Assert.IsFalse(_manager.IsBooting);
+            Assert.IsFalse(_manager.IsInitialized);
+            Assert.AreEqual(0, _moduleC.InitializeCount);
+            CollectionAssert.AreEqual(new[] { "Shutdown ModuleB", "Shutdown ModuleA" }, ShutdownLog());
+
+            BootReport report = _manager.BootReport;
+            Assert.IsFalse(report.IsComplete);
+            Assert.AreEqual("Modules", report.Phases[report.Phases.Count - 1].Name);
+            Assert.IsFalse(report.Phases[report.Phases.Count - 1].Succeeded);
+            StringAssert.Contains("Boot aborted", report.ToString());
+            CollectionAssert.Contains(_errors.Messages, "HaroFramework boot aborted during the Modules phase.");
+        }
+
+        [Test]
+        public void Initialize_CircularModuleDependency_AbortsBoot()
+        {
+            _moduleA.DependsOn = new[] { typeof(ModuleB) };
+            _moduleB.DependsOn = new[] { typeof(ModuleA) };
+            _manager.RegisterModule(_moduleA);
+            _manager.RegisterModule(_moduleB);
+
+            Assert.Throws<InvalidOperationException>(() => _manager.Initialize());
+
+            Assert.IsFalse(_manager.IsInitialized);
+            Assert.IsFalse(_manager.IsBooting);
+            Assert.IsFalse(_manager.BootReport.IsComplete);
+            Assert.AreEqual(0, _moduleA.InitializeCount + _moduleB.InitializeCount);
+            CollectionAssert.Contains(_errors.Messages, "HaroFramework boot aborted during the Modules phase.");
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private static ModuleBootstrapper CreateBootstrapper(params IModule[] modules)
+        {
+            return new ModuleBootstrapper(modules, new BootReport(Time.frameCount));
+        }
+
+        private static BootTiming FindEntry(BootReport report, string name)
+        {
+            foreach (BootTiming entry in report.Entries)
+            {
+                if (entry.Name == name) return entry;
+            }
+
+            Assert.Fail($"No boot report entry named {name}.");
+            return default;
+        }
+
+        private static List<string> PhaseNames(BootReport report)
+        {
+            var names = new List<string>();
+
+            foreach (BootTiming phase in report.Phases)
+            {
+                names.Add(phase.Name);
+            }
+
+            return names;
+        }
+
+        private void RegisterAll()
+        {
+            _manager.RegisterModule(_moduleA);
+            _manager.RegisterModule(_moduleB);
+            _manager.RegisterModule(_moduleC);
+            _manager.RegisterModule(_moduleD);
+        }
+
+        private List<string> ShutdownLog()
+        {
+            return _log.FindAll(entry => entry.StartsWith("Shutdown "));
+        }
+
+        #endregion
+    }
+}
@@ -0,0 +1,188 @@
+using System.Collections.Generic;
+using System.Threading;
+using HaroFramework.Core;
+using NUnit.Framework;
+
+namespace HaroFramework.Tests
+{
+    /// <summary>
+    /// Cost of logging through a LogCategory, filtered out and enqueued, with value and struct arguments.
+    /// </summary>
+    [TestFixture]
+    [Category("Performance")]
+    public class FrameworkLoggerPerfTests
+    {
+        #region Nested Types
+
+        private struct Position
+        {
+            public float X;
+            public float Y;
+
+            // Constant text keeps the measurement on the logger rather than on float formatting
+            public override string ToString()
+            {
+                return "Position";
+            }
+        }
+
+        private sealed class CountingSink : ILogSink
+        {
+            public int Count;
+
+            public void Write(in LogEntry entry)
+            {
+                Interlocked.Increment(ref Count);
+            }
+
+            public void Flush()
+            {
+            }
+        }
+
+        #endregion
+
+        #region Fields
+
+        // Stays below the ring buffer capacity so no message is dropped
+        private const int Operations = 2_000;
+        private const int FilteredOperations = 1_000_000;
+
+        // The boxed argument plus the formatted message
+        private const int EnabledStructBytesBudget = 128;
+
+        private readonly List<ILogSink> _savedSinks = new List<ILogSink>();
+        private CountingSink _sink;
+        private LogCategory _category;
+        private bool _wasEnabled;
+
+        #endregion
+
+        #region Setup
+
+        [SetUp]
+        public void SetUp()
+        {
+            // Route messages to a counting sink instead of the console
+            FrameworkLogger.Flush();
+            _savedSinks.Clear();
+            _savedSinks.AddRange(FrameworkLogger.Sinks);
+
+            foreach (ILogSink sink in _savedSinks)
+            {
+                FrameworkLogger.RemoveSink(sink);
+            }
+
+            _sink = new CountingSink();
+            FrameworkLogger.AddSink(_sink);
+
+            _wasEnabled = FrameworkLogger.IsEnabled;
+            FrameworkLogger.IsEnabled = true;
+            _category = FrameworkLogger.GetCategory("PerfTests");
+            _category.MinimumLevel = LogLevel.Info;
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            FrameworkLogger.RemoveSink(_sink);
+
+            foreach (ILogSink sink in _savedSinks)
+            {
+                FrameworkLogger.AddSink(sink);
+            }
+
+            FrameworkLogger.IsEnabled = _wasEnabled;
+        }
+
+        #endregion
+
+        #region Tests
+
+        [Test]
+        public void Info_StructArgumentFilteredOut_DoesNotAllocate()
+        {
+            _category.MinimumLevel = LogLevel.Warning;
+            var position = new Position { X = 1f, Y = 2f };
+
+            PerfResult result = Perf.Measure(FilteredOperations, () =>
+            {
+                for (int i = 0; i < FilteredOperations; i++)
+                {
+                    _category.Info("Position {0}", position);
+                }
+            });
+
+            Perf.Report("LogCategory.Info<struct>, filtered out", result, 3);
+
+            Assert.AreEqual(0, result.BytesPerOperation);
+            Assert.AreEqual(0, _sink.Count);
+        }
+
+        [Test]
+        public void Info_StructArgumentEnabled_StaysWithinAllocationBudget()
+        {
+            var position = new Position { X = 1f, Y = 2f };
+
+            PerfResult result = Perf.Measure(Operations, () =>
+            {
+                for (int i = 0; i < Operations; i++)
+                {
+                    _category.Info("Position {0}", position);
+                }
+
+                FrameworkLogger.Flush();
+            });
+
+            Perf.Report("LogCategory.Info<struct>, enqueued and drained", result);
+
+            // string.Format boxes the struct once the level check passes
+            Assert.LessOrEqual(result.BytesPerOperation, EnabledStructBytesBudget);
+            Assert.Greater(_sink.Count, 0);
+        }
+
+        [Test]
+        public void Info_FilteredOut_DoesNotAllocate()
+        {
+            _category.MinimumLevel = LogLevel.Warning;
+
+            PerfResult result = Perf.Measure(FilteredOperations, () =>
+            {
+                for (int i = 0; i < FilteredOperations; i++)
+                {
+                    _category.Info("Value {0}", i);
+                }
+            });
+
+            Perf.Report("LogCategory.Info<int>, filtered out", result, 3);
+
+            Assert.AreEqual(0, result.BytesPerOperation);
+            Assert.AreEqual(0, _sink.Count);
+        }
+
+        [Test]
+        public void Info_Enqueued_ReachesSink()
+        {
+            long droppedBefore = FrameworkLogger.DroppedCount;
+
+            PerfResult result = Perf.Measure(Operations, () =>
+            {
+                for (int i = 0; i < Operations; i++)
+                {
+                    _category.Info("Value {0}", i);
+                }
+
+                FrameworkLogger.Flush();
+            });
+
+            Perf.Report("LogCategory.Info<int>, enqueued and drained", result, 530);
+
+            // One warm-up run plus the measured runs, all delivered
+            Assert.AreEqual(droppedBefore, FrameworkLogger.DroppedCount);
+            Assert.AreEqual(0, _sink.Count % Operations);
+            Assert.Greater(_sink.Count, 0);
+        }
+
+        #endregion
+    }
+}
@@ -0,0 +1,199 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Threading;
+using System.Threading.Tasks;
+using HaroFramework.Core;
+using NUnit.Framework;
+
+namespace HaroFramework.Tests
+{
+    /// <summary>
+    /// Delivery of error messages, including with a full buffer, and size-based rotation of RotatingFileLogSink.
+    /// </summary>
+    [TestFixture]
+    public class FrameworkLoggerTests
+    {
+        #region Nested Types
+
+        private sealed class RecordingSink : ILogSink
+        {
+            public readonly List<string> Messages = new List<string>();
+
+            public void Write(in LogEntry entry)
+            {
+                lock (Messages)
+                {
+                    Messages.Add(entry.Message);
+                }
+            }
+
+            public void Flush()
+            {
+            }
+        }
+
+        /// <summary>
+        /// Holds the draining thread inside Write when it sees BlockMessage, so the ring buffer can fill up.
+        /// </summary>
+        private sealed class BlockingSink : ILogSink
+        {
+            public const string BlockMessage = "Block";
+
+            public readonly ManualResetEventSlim Entered = new ManualResetEventSlim(false);
+            public readonly ManualResetEventSlim Release = new ManualResetEventSlim(false);
+
+            public void Write(in LogEntry entry)
+            {
+                if (entry.Message != BlockMessage) return;
+
+                Entered.Set();
+                Release.Wait(TimeSpan.FromSeconds(10));
+            }
+
+            public void Flush()
+            {
+            }
+        }
+
+        #endregion
+
+        #region Fields
+
+        private const long MaxFileBytes = 1024;
+
+        private RecordingSink _sink;
+        private string _directory;
+
+        #endregion
+
+        #region Setup
+
+        [SetUp]
+        public void SetUp()
+        {
+            _sink = new RecordingSink();
+            _directory = Path.Combine(Path.GetTempPath(), "HaroFrameworkTests", Guid.NewGuid().ToString("N"));
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            FrameworkLogger.RemoveSink(_sink);
+
+            if (Directory.Exists(_directory))
+            {
+                Directory.Delete(_directory, true);
+            }
+        }
+
+        #endregion
+
+        #region Tests
+
+        [Test]
+        public void Error_IsWrittenToSinksBeforeReturning()
+        {
+            FrameworkLogger.AddSink(_sink);
+            LogCategory category = FrameworkLogger.GetCategory("LoggerTests");
+
+            category.Error("Failed with code {0}", 42);
+
+            lock (_sink.Messages)
+            {
+                CollectionAssert.Contains(_sink.Messages, "Failed with code 42");
+            }
+        }
+
+        [Test]
+        public void Error_WhenBufferIsFull_IsStillWritten()
+        {
+            ILogSink[] previousSinks = FrameworkLogger.Sinks.ToArray();
+            var blockingSink = new BlockingSink();
+            LogCategory category = FrameworkLogger.GetCategory("LoggerTests");
+            Task blocked = null;
+
+            // Keep the filler messages out of the console
+            foreach (ILogSink sink in previousSinks)
+            {
+                FrameworkLogger.RemoveSink(sink);
+            }
+
+            try
+            {
+                FrameworkLogger.AddSink(blockingSink);
+                FrameworkLogger.AddSink(_sink);
+
+                category.MinimumLevel = LogLevel.Info;
+                blocked = Task.Run(() =>
+                {
+                    category.Info(BlockingSink.BlockMessage);
+                    FrameworkLogger.Flush();
+                });
+                Assert.IsTrue(blockingSink.Entered.Wait(TimeSpan.FromSeconds(10)));
+
+                long droppedBefore = FrameworkLogger.DroppedCount;
+
+                for (int i = 0; i <= FrameworkLogger.BufferCapacity; i++)
+                {
+                    category.Info("Filler");
+                }
+
+                Assert.Greater(FrameworkLogger.DroppedCount, droppedBefore);
+                long droppedAfterFill = FrameworkLogger.DroppedCount;
+
+                // The error finds the buffer full and then waits for the blocked drain to finish
+                Task.Delay(200).ContinueWith(_ => blockingSink.Release.Set());
+                category.Error("Logged into a full buffer");
+
+                lock (_sink.Messages)
+                {
+                    CollectionAssert.Contains(_sink.Messages, "Logged into a full buffer");
+                }
+
+                Assert.AreEqual(droppedAfterFill, FrameworkLogger.DroppedCount);
+            }
+            finally
+            {
+                blockingSink.Release.Set();
+                blocked?.Wait();
+                category.ResetMinimumLevel();
+                FrameworkLogger.RemoveSink(blockingSink);
+
+                foreach (ILogSink sink in previousSinks)
+                {
+                    FrameworkLogger.AddSink(sink);
+                }
+            }
+        }
+
+        [Test]
+        public void Write_MultiByteMessages_RotatesByEncodedSize()
+        {
+            // Two UTF-8 bytes per character, so counting characters would let files grow to twice the limit
+            string message = new string('é', 150);
+            var fileSink = new RotatingFileLogSink(_directory, "rotation", MaxFileBytes, 10);
+
+            for (int i = 0; i < 20; i++)
+            {
+                fileSink.Write(new LogEntry(LogLevel.Info, "LoggerTests", message, null, DateTime.UtcNow, 0));
+            }
+
+            fileSink.Dispose();
+
+            string[] files = Directory.GetFiles(_directory, "rotation*.log");
+            long maxLineBytes = System.Text.Encoding.UTF8.GetByteCount(message) + 64;
+
+            Assert.Greater(files.Length, 1);
+
+            foreach (string file in files)
+            {
+                // A file is rotated once it reaches the limit, so it can only overshoot by the last line
+                Assert.Less(new FileInfo(file).Length, MaxFileBytes + maxLineBytes);
+            }
+        }
+
+        #endregion
+    }
+}
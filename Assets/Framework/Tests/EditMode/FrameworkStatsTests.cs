@@ -0,0 +1,150 @@
+using System;
+using System.Collections.Generic;
+using System.Threading.Tasks;
+using HaroFramework.Core;
+using NUnit.Framework;
+using UnityEngine;
+using Object = UnityEngine.Object;
+
+namespace HaroFramework.Tests
+{
+    [TestFixture]
+    public class FrameworkStatsTests
+    {
+        #region Nested Types
+
+        private sealed class FirstModule : BaseModule
+        {
+            public override string ModuleName => "Shared";
+
+            public override int Priority => 0;
+        }
+
+        private sealed class SecondModule : BaseModule
+        {
+            public override string ModuleName => "Shared";
+
+            public override int Priority => 0;
+        }
+
+        private interface ICountedService : IService
+        {
+        }
+
+        private sealed class CountedService : ICountedService
+        {
+            public string ServiceName => nameof(CountedService);
+
+            public void Initialize()
+            {
+            }
+
+            public void Dispose()
+            {
+            }
+        }
+
+        private sealed class CountedDomain : IDomain
+        {
+            public string DomainName => nameof(CountedDomain);
+
+            public IReadOnlyList<Type> Dependencies => Array.Empty<Type>();
+
+            public bool LoadOnMainThread => false;
+
+            public void LoadData()
+            {
+            }
+        }
+
+        #endregion
+
+        #region Setup
+
+        [SetUp]
+        public void SetUp()
+        {
+            if (!FrameworkStats.IsCompiled)
+            {
+                Assert.Ignore("FrameworkStats is compiled out.");
+            }
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            FrameworkStats.IsResolveCountingEnabled = false;
+        }
+
+        #endregion
+
+        #region Tests
+
+        [Test]
+        public void GetModuleRecord_SameNameDifferentTypes_KeepsSeparateRecords()
+        {
+            var first = new FirstModule();
+            var second = new SecondModule();
+
+            using (FrameworkStats.Begin(FrameworkStats.GetModuleRecord(first).Initialize))
+            {
+            }
+
+            Assert.AreNotSame(FrameworkStats.GetModuleRecord(first), FrameworkStats.GetModuleRecord(second));
+            Assert.AreSame(FrameworkStats.GetModuleRecord(first), FrameworkStats.GetModuleRecord(new FirstModule()));
+
+            Assert.IsTrue(FrameworkStats.TryGetModuleStats(typeof(FirstModule), out ModuleStats firstStats));
+            Assert.IsTrue(FrameworkStats.TryGetModuleStats(typeof(SecondModule), out ModuleStats secondStats));
+            Assert.AreEqual(typeof(FirstModule), firstStats.ModuleType);
+            Assert.Greater(firstStats.Initialize.Count, 0);
+            Assert.AreEqual(0, secondStats.Initialize.Count);
+        }
+
+        [Test]
+        public void Get_CountsResolvesOnlyWhenCountingIsEnabled()
+        {
+            var host = new GameObject(nameof(FrameworkStatsTests));
+
+            try
+            {
+                var locator = host.AddComponent<ServiceLocator>();
+                locator.Register<ICountedService>(new CountedService());
+
+                long before = FrameworkStats.GetServiceStats<ICountedService>().ResolveCount;
+                locator.Get<ICountedService>();
+                Assert.AreEqual(before, FrameworkStats.GetServiceStats<ICountedService>().ResolveCount);
+
+                FrameworkStats.IsResolveCountingEnabled = true;
+                locator.Get<ICountedService>();
+                Assert.AreEqual(before + 1, FrameworkStats.GetServiceStats<ICountedService>().ResolveCount);
+            }
+            finally
+            {
+                Object.DestroyImmediate(host);
+            }
+        }
+
+        [Test]
+        public void BeginDomainLoad_FromParallelThreads_CountsEveryLoad()
+        {
+            const int Threads = 8;
+            const int LoadsPerThread = 10000;
+
+            long before = FrameworkStats.GetDomainStats<CountedDomain>().Load.Count;
+
+            Parallel.For(0, Threads, new ParallelOptions { MaxDegreeOfParallelism = Threads }, _ =>
+            {
+                for (int i = 0; i < LoadsPerThread; i++)
+                {
+                    using (FrameworkStats.BeginDomainLoad(typeof(CountedDomain)))
+                    {
+                    }
+                }
+            });
+
+            Assert.AreEqual(before + Threads * LoadsPerThread, FrameworkStats.GetDomainStats<CountedDomain>().Load.Count);
+        }
+
+        #endregion
+    }
+}
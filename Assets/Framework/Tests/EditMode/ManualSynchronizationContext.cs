@@ -0,0 +1,146 @@
+using System;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace HaroFramework.Tests
+{
+    /// <summary>
+    /// Synchronization context whose posted callbacks run only when the test pumps it.
+    /// </summary>
+    /// <remarks>
+    /// Stands in for Unity's main-thread context, so a test can drive async code frame by frame
+    /// and block on the result without deadlocking the editor's own context.
+    /// Install it with Install and dispose the returned scope to restore the previous context.
+    /// </remarks>
+    internal sealed class ManualSynchronizationContext : SynchronizationContext
+    {
+        #region Nested Types
+
+        public sealed class Scope : IDisposable
+        {
+            private readonly SynchronizationContext _previous;
+
+            public Scope(SynchronizationContext previous)
+            {
+                _previous = previous;
+            }
+
+            public void Dispose()
+            {
+                SetSynchronizationContext(_previous);
+            }
+        }
+
+        #endregion
+
+        #region Fields
+
+        private const int DefaultTimeoutMilliseconds = 10_000;
+
+        private readonly ConcurrentQueue<(SendOrPostCallback Callback, object State)> _callbacks =
+            new ConcurrentQueue<(SendOrPostCallback Callback, object State)>();
+        private readonly int _threadId = Thread.CurrentThread.ManagedThreadId;
+
+        #endregion
+
+        #region Properties
+
+        /// <summary>
+        /// Gets the managed id of the thread that pumps this context.
+        /// </summary>
+        public int ThreadId => _threadId;
+
+        #endregion
+
+        #region Public Methods
+
+        /// <summary>
+        /// Installs a new context on the calling thread.
+        /// </summary>
+        /// <param name="context">The installed context.</param>
+        /// <returns>A scope that restores the previous context when disposed.</returns>
+        public static Scope Install(out ManualSynchronizationContext context)
+        {
+            var scope = new Scope(Current);
+            context = new ManualSynchronizationContext();
+            SetSynchronizationContext(context);
+            return scope;
+        }
+
+        public override void Post(SendOrPostCallback callback, object state)
+        {
+            _callbacks.Enqueue((callback, state));
+        }
+
+        public override void Send(SendOrPostCallback callback, object state)
+        {
+            throw new NotSupportedException("Send is not supported by ManualSynchronizationContext.");
+        }
+
+        /// <summary>
+        /// Runs the callbacks posted so far on the calling thread.
+        /// </summary>
+        /// <returns>The number of callbacks run.</returns>
+        public int RunPending()
+        {
+            int count = _callbacks.Count;
+            int run = 0;
+
+            while (run < count && _callbacks.TryDequeue(out var item))
+            {
+                item.Callback(item.State);
+                run++;
+            }
+
+            return run;
+        }
+
+        /// <summary>
+        /// Pumps the context for a fixed time, for tests that check a task is still waiting.
+        /// </summary>
+        /// <param name="milliseconds">How long to pump.</param>
+        public void RunFor(int milliseconds)
+        {
+            var elapsed = System.Diagnostics.Stopwatch.StartNew();
+
+            while (elapsed.ElapsedMilliseconds < milliseconds)
+            {
+                if (RunPending() == 0)
+                {
+                    Thread.Sleep(1);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Pumps the context until the task completes.
+        /// </summary>
+        /// <param name="task">The task to wait for.</param>
+        /// <param name="onFrame">Optional action run before each pump, for example to advance the frame count.</param>
+        /// <exception cref="TimeoutException">Thrown if the task does not complete in time.</exception>
+        public void RunUntilCompleted(Task task, Action onFrame = null)
+        {
+            var timeout = System.Diagnostics.Stopwatch.StartNew();
+
+            while (!task.IsCompleted)
+            {
+                onFrame?.Invoke();
+
+                if (RunPending() == 0)
+                {
+                    Thread.Sleep(1);
+                }
+
+                if (timeout.ElapsedMilliseconds > DefaultTimeoutMilliseconds)
+                {
+                    throw new TimeoutException("Task did not complete while pumping the synchronization context.");
+                }
+            }
+
+            RunPending();
+        }
+
+        #endregion
+    }
+}
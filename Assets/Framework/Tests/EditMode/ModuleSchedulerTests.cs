@@ -0,0 +1,329 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using HaroFramework.Core;
+using NUnit.Framework;
+
+namespace HaroFramework.Tests
+{
+    /// <summary>
+    /// Tick selection, rates, ordering and time slicing of ModuleScheduler.
+    /// </summary>
+    [TestFixture]
+    public class ModuleSchedulerTests
+    {
+        #region Nested Types
+
+        private sealed class IdleModule : BaseModule
+        {
+            public override string ModuleName => nameof(IdleModule);
+
+            public override int Priority => 0;
+        }
+
+        private abstract class UpdatingModuleBase : BaseModule
+        {
+            public int UpdateCount;
+
+            public override void OnUpdate()
+            {
+                UpdateCount++;
+            }
+        }
+
+        private sealed class InheritedUpdateModule : UpdatingModuleBase
+        {
+            public override string ModuleName => nameof(InheritedUpdateModule);
+
+            public override int Priority => 0;
+        }
+
+        private sealed class PlainModule : IModule
+        {
+            public int UpdateCount;
+
+            public string ModuleName => nameof(PlainModule);
+
+            public int Priority => 0;
+
+            public void Initialize()
+            {
+            }
+
+            public void Shutdown()
+            {
+            }
+
+            public void OnUpdate()
+            {
+                UpdateCount++;
+            }
+        }
+
+        private sealed class TestModule : BaseModule
+        {
+            private readonly string _name;
+            private readonly int _priority;
+            private readonly List<string> _log;
+
+            public ModuleTickGroup Group = ModuleTickGroup.Normal;
+            public int Interval = 1;
+            public float Rate;
+            public bool Sliced;
+            public double SpinMilliseconds;
+            public Action OnTick;
+
+            public TestModule(string name, int priority, List<string> log)
+            {
+                _name = name;
+                _priority = priority;
+                _log = log;
+            }
+
+            public override string ModuleName => _name;
+
+            public override int Priority => _priority;
+
+            public override ModuleTickGroup TickGroup => Group;
+
+            public override int UpdateInterval => Interval;
+
+            public override float UpdateRate => Rate;
+
+            public override bool IsTimeSliced => Sliced;
+
+            public override void OnUpdate()
+            {
+                _log.Add(_name);
+                OnTick?.Invoke();
+
+                // Busy-wait so the module uses a known share of the time slice budget
+                long end = Stopwatch.GetTimestamp() + (long)(SpinMilliseconds * Stopwatch.Frequency / 1000.0);
+
+                while (Stopwatch.GetTimestamp() < end)
+                {
+                }
+            }
+        }
+
+        #endregion
+
+        #region Fields
+
+        private ModuleScheduler _scheduler;
+        private List<string> _log;
+        private long _frame;
+
+        #endregion
+
+        #region Setup
+
+        [SetUp]
+        public void SetUp()
+        {
+            _scheduler = new ModuleScheduler();
+            _log = new List<string>();
+            _frame = 0;
+        }
+
+        #endregion
+
+        #region Tests
+
+        [Test]
+        public void Add_ModuleWithoutOnUpdateOverride_IsSkipped()
+        {
+            var inherited = new InheritedUpdateModule();
+            var plain = new PlainModule();
+
+            _scheduler.Add(new IdleModule());
+            _scheduler.Add(inherited);
+            _scheduler.Add(plain);
+            TickFrame();
+
+            // An override in an intermediate class counts; plain IModule implementations are always ticked
+            Assert.AreEqual(2, _scheduler.ModuleCount);
+            Assert.AreEqual(1, inherited.UpdateCount);
+            Assert.AreEqual(1, plain.UpdateCount);
+        }
+
+        [Test]
+        public void Tick_UpdateInterval_TicksEveryNthStep()
+        {
+            var module = new TestModule("Interval", 0, _log) { Interval = 3 };
+            _scheduler.Add(module);
+
+            for (int i = 0; i < 7; i++)
+            {
+                TickFrame();
+            }
+
+            // Steps 1, 4 and 7
+            Assert.AreEqual(3, _log.Count);
+        }
+
+        [Test]
+        public void Tick_UpdateRate_TicksOncePerPeriodAndSkipsMissedTicks()
+        {
+            var module = new TestModule("Rate", 0, _log) { Rate = 10f };
+            _scheduler.Add(module);
+            var tickTimes = new List<double>();
+
+            foreach (double time in new[] { 0.0, 0.05, 0.1, 0.15, 0.2, 0.5, 0.55, 0.6 })
+            {
+                int before = _log.Count;
+                _scheduler.Tick(ModuleTickGroup.Normal, time, ++_frame);
+
+                if (_log.Count > before)
+                {
+                    tickTimes.Add(time);
+                }
+            }
+
+            // After the stall at 0.5 the next tick is one period later, not a burst of catch-up ticks
+            CollectionAssert.AreEqual(new[] { 0.0, 0.1, 0.2, 0.5, 0.6 }, tickTimes);
+        }
+
+        [Test]
+        public void Tick_ModulesInGroup_RunInPriorityThenRegistrationOrder()
+        {
+            _scheduler.Add(new TestModule("C", 10, _log));
+            _scheduler.Add(new TestModule("A", 5, _log));
+            _scheduler.Add(new TestModule("D", 10, _log));
+            _scheduler.Add(new TestModule("B", 5, _log));
+
+            TickFrame();
+
+            CollectionAssert.AreEqual(new[] { "A", "B", "C", "D" }, _log);
+        }
+
+        [Test]
+        public void Tick_ModuleAddedMidFrame_IsSortedInFromNextFrame()
+        {
+            var early = new TestModule("Early", 1, _log);
+            var late = new TestModule("Late", 10, _log);
+            late.OnTick = () =>
+            {
+                if (_frame == 1) _scheduler.Add(early);
+            };
+            _scheduler.Add(late);
+
+            TickFrame();
+            TickFrame();
+
+            CollectionAssert.AreEqual(new[] { "Late", "Early", "Late" }, _log);
+        }
+
+        [Test]
+        public void Tick_ModuleRemovedMidFrame_IsNotTickedAgain()
+        {
+            var removed = new TestModule("Removed", 10, _log);
+            var remover = new TestModule("Remover", 1, _log);
+            remover.OnTick = () => _scheduler.Remove(removed);
+            _scheduler.Add(removed);
+            _scheduler.Add(remover);
+
+            TickFrame();
+            TickFrame();
+
+            CollectionAssert.AreEqual(new[] { "Remover", "Remover" }, _log);
+            Assert.AreEqual(1, _scheduler.ModuleCount);
+        }
+
+        [Test]
+        public void Tick_TimeSliceBudgetSpent_DefersRemainingModules()
+        {
+            _scheduler.TimeSliceBudgetMilliseconds = 1;
+            _scheduler.Add(new TestModule("Regular", 100, _log) { SpinMilliseconds = 3 });
+            AddSliced("S1", 3);
+            AddSliced("S2", 3);
+
+            TickFrame();
+
+            // Regular modules never count against the budget, and the first sliced module always runs
+            CollectionAssert.AreEqual(new[] { "Regular", "S1" }, _log);
+        }
+
+        [Test]
+        public void Tick_TimeSliceCursor_CarriesAcrossFrames()
+        {
+            _scheduler.TimeSliceBudgetMilliseconds = 1;
+            AddSliced("S1", 2);
+            AddSliced("S2", 2);
+            AddSliced("S3", 2);
+
+            for (int i = 0; i < 4; i++)
+            {
+                TickFrame();
+            }
+
+            CollectionAssert.AreEqual(new[] { "S1", "S2", "S3", "S1" }, _log);
+        }
+
+        [Test]
+        public void Tick_UnlimitedBudget_RunsAllSlicedModules()
+        {
+            AddSliced("S1", 1);
+            AddSliced("S2", 1);
+
+            TickFrame();
+
+            CollectionAssert.AreEqual(new[] { "S1", "S2" }, _log);
+        }
+
+        [Test]
+        public void Tick_FixedGroup_HasItsOwnBudgetPerFixedStep()
+        {
+            _scheduler.TimeSliceBudgetMilliseconds = 5;
+            AddSliced("Normal", 8);
+            AddSliced("Fixed1", 0.5, ModuleTickGroup.Fixed);
+            AddSliced("Fixed2", 0.5, ModuleTickGroup.Fixed);
+
+            // The Normal module spends the whole frame budget before two fixed steps run in the same frame
+            _frame++;
+            _scheduler.Tick(ModuleTickGroup.Normal, _frame, _frame);
+            _scheduler.Tick(ModuleTickGroup.Fixed, _frame, _frame);
+            _scheduler.Tick(ModuleTickGroup.Fixed, _frame + 0.5, _frame);
+
+            CollectionAssert.AreEqual(new[] { "Normal", "Fixed1", "Fixed2", "Fixed1", "Fixed2" }, _log);
+        }
+
+        [Test]
+        public void Tick_EarlyAndNormalGroups_ShareTheFrameBudget()
+        {
+            _scheduler.TimeSliceBudgetMilliseconds = 1;
+            AddSliced("Early", 2, ModuleTickGroup.Early);
+            AddSliced("Normal1", 0, ModuleTickGroup.Normal);
+            AddSliced("Normal2", 0, ModuleTickGroup.Normal);
+
+            TickFrame();
+
+            // Each group still runs its first due module, but Normal starts with the budget already spent
+            CollectionAssert.AreEqual(new[] { "Early", "Normal1" }, _log);
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private void AddSliced(string name, double spinMilliseconds, ModuleTickGroup group = ModuleTickGroup.Normal)
+        {
+            _scheduler.Add(new TestModule(name, 0, _log)
+            {
+                Group = group,
+                Sliced = true,
+                SpinMilliseconds = spinMilliseconds
+            });
+        }
+
+        private void TickFrame()
+        {
+            _frame++;
+            _scheduler.Tick(ModuleTickGroup.Early, _frame, _frame);
+            _scheduler.Tick(ModuleTickGroup.Normal, _frame, _frame);
+            _scheduler.Tick(ModuleTickGroup.Late, _frame, _frame);
+        }
+
+        #endregion
+    }
+}
@@ -0,0 +1,111 @@
+using System;
+using System.Diagnostics;
+using NUnit.Framework;
+
+namespace HaroFramework.Tests
+{
+    /// <summary>
+    /// Time and allocation cost of one measured operation.
+    /// </summary>
+    internal readonly struct PerfResult
+    {
+        public readonly double NanosecondsPerOperation;
+        public readonly double BytesPerOperation;
+
+        public PerfResult(double nanosecondsPerOperation, double bytesPerOperation)
+        {
+            NanosecondsPerOperation = nanosecondsPerOperation;
+            BytesPerOperation = bytesPerOperation;
+        }
+    }
+
+    /// <summary>
+    /// Measurement helpers for the performance tests.
+    /// </summary>
+    /// <remarks>
+    /// The measured action runs a whole loop of operations, so delegate overhead is paid once per run
+    /// rather than per operation. Each measurement warms up once, then keeps the fastest of several runs.
+    /// Results are written to the test output next to the baseline recorded when the optimization landed,
+    /// so regressions show up when comparing runs. Absolute timings are reported, not asserted, because they
+    /// depend on the machine; allocation budgets are asserted, and so are timings relative to a baseline
+    /// implementation measured in the same run.
+    /// </remarks>
+    internal static class Perf
+    {
+        #region Fields
+
+        private const int Runs = 5;
+
+        #endregion
+
+        #region Public Methods
+
+        /// <summary>
+        /// Measures an action that performs the given number of operations.
+        /// </summary>
+        /// <param name="operations">Number of operations one call of the action performs.</param>
+        /// <param name="action">Runs the operations.</param>
+        public static PerfResult Measure(int operations, Action action)
+        {
+            action();
+
+            GC.Collect();
+            GC.WaitForPendingFinalizers();
+
+            long bestTicks = long.MaxValue;
+            long allocatedBytes = long.MaxValue;
+
+            for (int run = 0; run < Runs; run++)
+            {
+                long bytesBefore = GC.GetAllocatedBytesForCurrentThread();
+                long start = Stopwatch.GetTimestamp();
+
+                action();
+
+                long ticks = Stopwatch.GetTimestamp() - start;
+                long bytes = GC.GetAllocatedBytesForCurrentThread() - bytesBefore;
+
+                bestTicks = Math.Min(bestTicks, ticks);
+                allocatedBytes = Math.Min(allocatedBytes, bytes);
+            }
+
+            double nanoseconds = bestTicks * 1e9 / Stopwatch.Frequency / operations;
+            return new PerfResult(nanoseconds, (double)allocatedBytes / operations);
+        }
+
+        /// <summary>
+        /// Measures the bytes allocated by an action after a warm-up call.
+        /// </summary>
+        public static long MeasureAllocatedBytes(Action action)
+        {
+            action();
+
+            long bytesBefore = GC.GetAllocatedBytesForCurrentThread();
+            action();
+            return GC.GetAllocatedBytesForCurrentThread() - bytesBefore;
+        }
+
+        /// <summary>
+        /// Writes a result and its baseline to the test output.
+        /// </summary>
+        /// <param name="name">The measured operation.</param>
+        /// <param name="result">The measured cost.</param>
+        /// <param name="baselineNanoseconds">The ns/op recorded when the optimization landed.</param>
+        public static void Report(string name, PerfResult result, double baselineNanoseconds)
+        {
+            TestContext.WriteLine("[Perf] {0}: {1:F1} ns/op, {2:F1} B/op (baseline {3:F1} ns/op)",
+                name, result.NanosecondsPerOperation, result.BytesPerOperation, baselineNanoseconds);
+        }
+
+        /// <summary>
+        /// Writes a result without a baseline to the test output.
+        /// </summary>
+        public static void Report(string name, PerfResult result)
+        {
+            TestContext.WriteLine("[Perf] {0}: {1:F1} ns/op, {2:F1} B/op",
+                name, result.NanosecondsPerOperation, result.BytesPerOperation);
+        }
+
+        #endregion
+    }
+}
@@ -0,0 +1,151 @@
+using System;
+using System.Collections.Generic;
+using HaroFramework.Core;
+using NUnit.Framework;
+using UnityEngine;
+using Object = UnityEngine.Object;
+
+namespace HaroFramework.Tests
+{
+    /// <summary>
+    /// Cost of ServiceLocator.Get with and without resolve counting, and against the previous implementation.
+    /// </summary>
+    [TestFixture]
+    [Category("Performance")]
+    public class ServiceLocatorPerfTests
+    {
+        #region Nested Types
+
+        private interface IPerfService : IService
+        {
+            int Value { get; }
+        }
+
+        private sealed class PerfService : IPerfService
+        {
+            public string ServiceName => nameof(PerfService);
+
+            public int Value => 1;
+
+            public void Initialize()
+            {
+            }
+
+            public void Dispose()
+            {
+            }
+        }
+
+        /// <summary>
+        /// The dictionary lookup ServiceLocator.Get replaced, kept as the comparison baseline.
+        /// </summary>
+        private sealed class LegacyServiceLocator
+        {
+            private readonly Dictionary<Type, IService> _services = new Dictionary<Type, IService>();
+
+            public void Register<T>(T service) where T : IService
+            {
+                _services[typeof(T)] = service;
+            }
+
+            public T Get<T>() where T : IService
+            {
+                Type serviceType = typeof(T);
+
+                if (_services.ContainsKey(serviceType))
+                {
+                    return (T)_services[serviceType];
+                }
+
+                throw new InvalidOperationException($"[ServiceLocator] Service of type {serviceType.Name} is not registered.");
+            }
+        }
+
+        #endregion
+
+        #region Fields
+
+        private const int Operations = 1_000_000;
+
+        private GameObject _host;
+        private ServiceLocator _locator;
+        private int _sum;
+
+        #endregion
+
+        #region Setup
+
+        [SetUp]
+        public void SetUp()
+        {
+            _host = new GameObject(nameof(ServiceLocatorPerfTests));
+            _locator = _host.AddComponent<ServiceLocator>();
+            _locator.Register<IPerfService>(new PerfService());
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            FrameworkStats.IsResolveCountingEnabled = false;
+            Object.DestroyImmediate(_host);
+        }
+
+        #endregion
+
+        #region Tests
+
+        [Test]
+        public void Get_Cached_DoesNotAllocate()
+        {
+            PerfResult uncounted = Perf.Measure(Operations, GetLoop);
+
+            FrameworkStats.IsResolveCountingEnabled = true;
+            long countBefore = FrameworkStats.GetServiceStats<IPerfService>().ResolveCount;
+            PerfResult counted = Perf.Measure(Operations, GetLoop);
+            long countedCalls = FrameworkStats.GetServiceStats<IPerfService>().ResolveCount - countBefore;
+
+            Perf.Report("ServiceLocator.Get, cached", uncounted, 7);
+            Perf.Report("ServiceLocator.Get, cached, resolve counting on", counted, 16);
+
+            Assert.AreEqual(0, uncounted.BytesPerOperation);
+            Assert.AreEqual(0, counted.BytesPerOperation);
+            Assert.Greater(countedCalls, 0);
+        }
+
+        [Test]
+        public void Get_CachedAndLegacy_DoNotAllocate()
+        {
+            var legacyLocator = new LegacyServiceLocator();
+            legacyLocator.Register<IPerfService>(new PerfService());
+
+            PerfResult current = Perf.Measure(Operations, GetLoop);
+            PerfResult legacy = Perf.Measure(Operations, () =>
+            {
+                for (int i = 0; i < Operations; i++)
+                {
+                    _sum += legacyLocator.Get<IPerfService>().Value;
+                }
+            });
+
+            Perf.Report("ServiceLocator.Get, cached", current, 7);
+            Perf.Report("Legacy ServiceLocator.Get", legacy, 48);
+
+            Assert.AreEqual(0, current.BytesPerOperation);
+            Assert.AreEqual(0, legacy.BytesPerOperation);
+        }
+
+        #endregion
+
+        #region Private Methods
+
+        private void GetLoop()
+        {
+            for (int i = 0; i < Operations; i++)
+            {
+                _sum += _locator.Get<IPerfService>().Value;
+            }
+        }
+
+        #endregion
+    }
+}
@@ -0,0 +1,138 @@
+using System;
+using HaroFramework.Core;
+using NUnit.Framework;
+using UnityEngine;
+using Object = UnityEngine.Object;
+
+namespace HaroFramework.Tests
+{
+    /// <summary>
+    /// Disposal behavior of ServiceLocator.Clear.
+    /// </summary>
+    [TestFixture]
+    public class ServiceLocatorTests
+    {
+        #region Nested Types
+
+        private interface ILazyService : IService
+        {
+        }
+
+        private interface IEagerService : IService
+        {
+        }
+
+        private sealed class LazyService : ILazyService
+        {
+            public string ServiceName => nameof(LazyService);
+
+            public void Initialize()
+            {
+            }
+
+            public void Dispose()
+            {
+            }
+        }
+
+        private sealed class EagerService : IEagerService
+        {
+            private readonly Action _onDispose;
+
+            public EagerService(Action onDispose)
+            {
+                _onDispose = onDispose;
+            }
+
+            public string ServiceName => nameof(EagerService);
+
+            public void Initialize()
+            {
+            }
+
+            public void Dispose()
+            {
+                _onDispose();
+            }
+        }
+
+        #endregion
+
+        #region Fields
+
+        private GameObject _host;
+        private ServiceLocator _locator;
+
+        #endregion
+
+        #region Setup
+
+        [SetUp]
+        public void SetUp()
+        {
+            _host = new GameObject(nameof(ServiceLocatorTests));
+            _locator = _host.AddComponent<ServiceLocator>();
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            Object.DestroyImmediate(_host);
+        }
+
+        #endregion
+
+        #region Tests
+
+        [Test]
+        public void Clear_DisposeResolvesUncreatedLazyService_DoesNotCreateIt()
+        {
+            int createdCount = 0;
+            Exception resolveException = null;
+
+            _locator.RegisterLazy<ILazyService>(() =>
+            {
+                createdCount++;
+                return new LazyService();
+            });
+
+            _locator.Register<IEagerService>(new EagerService(() =>
+            {
+                try
+                {
+                    _locator.Get<ILazyService>();
+                }
+                catch (InvalidOperationException ex)
+                {
+                    resolveException = ex;
+                }
+            }));
+
+            _locator.Clear();
+
+            Assert.AreEqual(0, createdCount);
+            Assert.IsNotNull(resolveException);
+            Assert.IsFalse(_locator.Has<ILazyService>());
+        }
+
+        [Test]
+        public void Clear_DisposeResolvesCreatedLazyService_GetsCachedInstance()
+        {
+            var lazyService = new LazyService();
+            ILazyService resolved = null;
+
+            // Created first, so it is disposed after the service that resolves it
+            _locator.RegisterLazy<ILazyService>(() => lazyService);
+            _locator.Get<ILazyService>();
+            _locator.Register<IEagerService>(new EagerService(() => resolved = _locator.Get<ILazyService>()));
+
+            _locator.Clear();
+
+            Assert.AreSame(lazyService, resolved);
+            Assert.IsFalse(_locator.Has<IEagerService>());
+            Assert.IsFalse(_locator.Has<ILazyService>());
+        }
+
+        #endregion
+    }
+}
@@ -0,0 +1,71 @@
+using HaroFramework.Core;
+using NUnit.Framework;
+using UnityEngine;
+
+namespace HaroFramework.Tests
+{
+    /// <summary>
+    /// Caching and replacement of Singleton instances.
+    /// </summary>
+    [TestFixture]
+    public class SingletonTests
+    {
+        #region Nested Types
+
+        /// <summary>
+        /// Skips base.OnDestroy, so the cached instance is never cleared.
+        /// </summary>
+        private sealed class UnclearedSingleton : Singleton<UnclearedSingleton>
+        {
+            protected override void OnDestroy()
+            {
+            }
+        }
+
+        #endregion
+
+        #region Fields
+
+        private GameObject _firstHost;
+        private GameObject _secondHost;
+
+        #endregion
+
+        #region Setup
+
+        [SetUp]
+        public void SetUp()
+        {
+            _firstHost = new GameObject(nameof(SingletonTests));
+            _secondHost = new GameObject(nameof(SingletonTests));
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            Object.DestroyImmediate(_firstHost);
+            Object.DestroyImmediate(_secondHost);
+        }
+
+        #endregion
+
+        #region Tests
+
+        [Test]
+        public void Instance_DestroyedWithoutBaseOnDestroy_IsReplaced()
+        {
+            UnclearedSingleton first = UnclearedSingleton.CreateOn(_firstHost);
+            Assert.AreSame(first, UnclearedSingleton.Instance);
+
+            // Placed in the scene so the replacement is adopted instead of created with DontDestroyOnLoad,
+            // which edit mode does not allow
+            UnclearedSingleton replacement = _secondHost.AddComponent<UnclearedSingleton>();
+            Object.DestroyImmediate(first);
+
+            Assert.AreSame(replacement, UnclearedSingleton.Instance);
+            Assert.IsTrue(UnclearedSingleton.HasInstance);
+        }
+
+        #endregion
+    }
+}